@@ -0,0 +1,61 @@
+"""Captures emulator's screen into corpus of perception benchmark.
+
+Screen is saved at emulator's resolution as `<corpus>/<width>x<height>/<screen>.png`
+and added to the manifest without labels: UI elements that are present and absent on it
+should be written into the manifest by hand after looking at the capture.
+
+Usage:
+    python -m benchmarks.capture_corpus --emulator NoxPlayer --name NoxPlayer --screen main_menu
+"""
+import argparse
+import json
+import os
+
+import cv2
+
+from benchmarks.perception import CORPUS_FOLDER, MANIFEST_FILE_NAME
+from lib.emulators.bluestacks import BlueStacks
+from lib.emulators.nox_player import NoxPlayer
+
+EMULATORS = {NoxPlayer.__name__: NoxPlayer, BlueStacks.__name__: BlueStacks}
+
+
+def capture_screen(emulator, screen_name, corpus=CORPUS_FOLDER):
+    """Captures emulator's screen into the corpus.
+
+    :param lib.emulators.android_emulator.AndroidEmulator emulator: instance of emulator.
+    :param str screen_name: name of the screen in the manifest.
+    :param str corpus: path to corpus folder.
+
+    :return: path to captured screen.
+    :rtype: str
+    """
+    screen = emulator.get_screen_image()
+    if screen is None:
+        raise RuntimeError(f"Can't capture screen of {emulator.name}.")
+    height, width = screen.shape[:2]
+    path = os.path.join(corpus, f"{width}x{height}", f"{screen_name}.png")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    cv2.imwrite(path, cv2.cvtColor(screen, cv2.COLOR_RGB2BGR))
+
+    manifest_path = os.path.join(corpus, MANIFEST_FILE_NAME)
+    with open(manifest_path, encoding="utf-8") as file:
+        manifest = json.load(file)
+    manifest.setdefault(screen_name, {"source": f"Capture of {emulator.name} at {width}x{height}",
+                                      "present": [], "absent": []})
+    with open(manifest_path, "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=2)
+    return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Captures emulator's screen into corpus of perception benchmark.")
+    parser.add_argument("--emulator", choices=EMULATORS, default=NoxPlayer.__name__, help="type of emulator")
+    parser.add_argument("--name", help="window's name of emulator; default name of emulator's type if not given")
+    parser.add_argument("--screen", required=True, help="name of the screen in the manifest")
+    parser.add_argument("--corpus", default=CORPUS_FOLDER, help="path to corpus folder")
+    args = parser.parse_args()
+
+    emulator_class = EMULATORS[args.emulator]
+    emulator = emulator_class(args.name) if args.name else emulator_class()
+    print(capture_screen(emulator, screen_name=args.screen, corpus=args.corpus))
@@ -0,0 +1,70 @@
+"""Benchmark of OCR backends on recorded screens.
+
+Runs text checks of perception benchmark (see `benchmarks.perception`) with every available OCR backend
+and reports recognition speed and accuracy of each backend overall and per UI element,
+so the fastest accurate backend can be selected for UI element by its `ocr_backend` attribute.
+
+Usage:
+    python -m benchmarks.ocr_backends --backends tesseract4_lstm tesseract4_legacy --repeat 5
+"""
+import argparse
+
+import lib.logger as logging
+from benchmarks.perception import PerceptionBenchmark, CORPUS_FOLDER, RESOLUTIONS, BENCHMARK_REPEAT, \
+    parse_resolution
+from lib.functions import OCR_BACKENDS, get_ocr_backend, TESSERACT_ENG_LANGUAGE
+from lib.tesseract3 import TesseractError
+
+logger = logging.get_logger(__name__)
+
+
+def is_backend_available(backend):
+    """Checks if OCR backend can be loaded.
+
+    :param str backend: name of OCR backend.
+
+    :rtype: bool
+    """
+    try:
+        get_ocr_backend(language=TESSERACT_ENG_LANGUAGE, backend=backend)
+        return True
+    except TesseractError as error:
+        logger.warning(f"OCR backend {backend} isn't available: {error}")
+        return False
+
+
+def compare_backends(backends, corpus=CORPUS_FOLDER, resolutions=RESOLUTIONS, repeat=BENCHMARK_REPEAT):
+    """Runs perception benchmark with every OCR backend.
+
+    :param list[str] backends: names of OCR backends.
+    :param str corpus: path to corpus folder.
+    :param tuple[tuple[int, int]] resolutions: list of (width, height) resolutions to benchmark.
+    :param int repeat: how many times call OCR for latency measurement.
+
+    :return: text report.
+    :rtype: str
+    """
+    lines = []
+    for backend in backends:
+        if not is_backend_available(backend):
+            continue
+        benchmark = PerceptionBenchmark(corpus=corpus, resolutions=resolutions, repeat=repeat, ocr_backend=backend)
+        results = benchmark.run()
+        lines.append(f"{backend}:")
+        for (width, height), stats in results.items():
+            lines.append(f"  {width}x{height} {stats['get_text_from_image']}")
+        lines.extend(f"    {element_stats}" for element_stats in benchmark.elements_stats.values())
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark of OCR backends on recorded screens.")
+    parser.add_argument("--backends", nargs="+", default=list(OCR_BACKENDS), help="names of OCR backends")
+    parser.add_argument("--corpus", default=CORPUS_FOLDER, help="path to corpus folder")
+    parser.add_argument("--resolutions", nargs="+", type=parse_resolution, default=RESOLUTIONS,
+                        help="resolutions to benchmark, for example: 1280x720 1920x1080")
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_REPEAT, help="how many times call OCR")
+    args = parser.parse_args()
+
+    print(compare_backends(backends=args.backends, corpus=args.corpus, resolutions=args.resolutions,
+                           repeat=args.repeat))
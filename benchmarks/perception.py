@@ -0,0 +1,331 @@
+"""Benchmark of perception primitives on recorded screens.
+
+Measures latency percentiles and accuracy of `lib.functions` primitives (OCR, strings and images similarity,
+colors conversion) at every benchmark resolution. Doesn't need emulator, so it can be run headless.
+Also measures pre-OCR rejection by ink signatures: its accuracy is the ratio of checks without false rejection,
+so anything below 100% is a bug. Signatures are learned only from screens marked with `"learn": true`
+(present elements as recognized text, absent ones as regions without text) and rejection is checked only on other
+screens, so learned and checked captures are disjoint; without learning screens every check is a cold start.
+
+Corpus layout:
+    benchmarks/corpus/manifest.json - screens and UI elements that should and shouldn't be found on them;
+    benchmarks/corpus/<screen>.png - capture of emulator's screen at any resolution,
+        it's resized to every benchmark resolution;
+    benchmarks/corpus/<width>x<height>/<screen>.png - capture at exact resolution, used instead of resized one
+        (see `benchmarks.capture_corpus`).
+Screens are captures of the game only: UI elements are labelled by hand after looking at them.
+
+Manifest format:
+    {"<screen>": {"source": "<where the capture came from>",
+                  "learn": <true if screen is used only for learning ink signatures>,
+                  "present": ["<UI element's name>", ...],
+                  "absent": ["<UI element's name>", ...],
+                  "texts": {"<UI element's name>": "<expected text>", ...}}}
+Elements with text are checked by OCR, elements with image are checked by structural similarity.
+`texts` is used for elements without constant text (counters, stages, etc.): recognized text should be equal to it.
+
+Every screen of the manifest must be in the corpus and every UI element must exist, otherwise benchmark fails.
+
+Usage:
+    python -m benchmarks.perception --repeat 5 --resolutions 1280x720 1920x1080 2560x1440
+"""
+import argparse
+import json
+import os
+import time
+
+import cv2
+import numpy
+
+import lib.logger as logging
+from lib.emulators.android_emulator import AndroidEmulator
+from lib.functions import get_text_from_image, is_strings_similar, is_images_similar, convert_colors_in_image
+from lib.game import ui
+from lib.ink_signature import InkSignatures
+from lib.tesseract3 import TesseractError
+
+logger = logging.get_logger(__name__)
+
+CORPUS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+MANIFEST_FILE_NAME = "manifest.json"
+RESOLUTIONS = ((1280, 720), (1920, 1080), (2560, 1440))
+PERCENTILES = (50, 90, 99)
+BENCHMARK_REPEAT = 5
+
+
+class PrimitiveStats:
+    """Class for collecting latency and accuracy of single perception primitive."""
+
+    def __init__(self, name):
+        """Class initialization.
+
+        :param str name: name of primitive.
+        """
+        self.name = name
+        self.timings = []
+        self.checked = 0
+        self.correct = 0
+
+    def measure(self, function, *args, **kwargs):
+        """Calls primitive's function and records its latency.
+
+        :param function function: primitive's function.
+        :param args: function's args.
+        :param kwargs: function's kwargs.
+
+        :return: result of the function.
+        """
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        self.timings.append(time.perf_counter() - start)
+        return result
+
+    def add_check(self, is_correct):
+        """Records result of accuracy check.
+
+        :param bool is_correct: was primitive's result correct or not.
+        """
+        self.checked += 1
+        self.correct += int(is_correct)
+
+    @property
+    def accuracy(self):
+        """Ratio of correct results or None if primitive wasn't checked.
+
+        :rtype: float | None
+        """
+        return self.correct / self.checked if self.checked else None
+
+    def percentiles(self, percentiles=PERCENTILES):
+        """Gets latency percentiles in milliseconds.
+
+        :param tuple[int] percentiles: percentiles to calculate.
+
+        :rtype: list[float]
+        """
+        if not self.timings:
+            return [float("nan") for _ in percentiles]
+        return [value * 1000 for value in numpy.percentile(self.timings, percentiles)]
+
+    def __str__(self):
+        latency = " ".join(f"p{percentile}={value:8.3f}ms"
+                           for percentile, value in zip(PERCENTILES, self.percentiles()))
+        accuracy = f"{self.accuracy:7.2%} ({self.correct}/{self.checked})" if self.checked else "-"
+        return f"{self.name:<26} n={len(self.timings):<5} {latency}  accuracy={accuracy}"
+
+
+class PerceptionBenchmark:
+    """Class for benchmarking perception primitives on corpus of recorded screens."""
+
+    PRIMITIVES = ("get_text_from_image", "is_strings_similar", "is_images_similar", "convert_colors_in_image",
+                  "ink_signature")
+
+    def __init__(self, corpus=CORPUS_FOLDER, resolutions=RESOLUTIONS, repeat=BENCHMARK_REPEAT, ocr_backend=None):
+        """Class initialization.
+
+        :param str corpus: path to corpus folder.
+        :param tuple[tuple[int, int]] resolutions: list of (width, height) resolutions to benchmark.
+        :param int repeat: how many times call every primitive for latency measurement.
+        :param str ocr_backend: name of OCR backend; UI element's or default backend if not given.
+        """
+        self.corpus = corpus
+        self.resolutions = resolutions
+        self.repeat = max(repeat, 1)
+        self.ocr_backend = ocr_backend
+        self.elements_stats = {}  # OCR statistics of every UI element at all resolutions
+        self.ink_signatures = InkSignatures()
+        with open(os.path.join(corpus, MANIFEST_FILE_NAME), encoding="utf-8") as file:
+            self.manifest = json.load(file)
+        self.ocr_available = True
+
+    def load_screen(self, screen_name, resolution):
+        """Loads screen from corpus at given resolution.
+
+        :param str screen_name: name of the screen.
+        :param tuple[int, int] resolution: (width, height) of the screen.
+
+        :return: screen in RGB format (same as emulator's screen).
+        :rtype: numpy.ndarray
+        """
+        width, height = resolution
+        exact_path = os.path.join(self.corpus, f"{width}x{height}", f"{screen_name}.png")
+        path = exact_path if os.path.exists(exact_path) else os.path.join(self.corpus, f"{screen_name}.png")
+        image = cv2.imread(path) if os.path.exists(path) else None
+        if image is None:
+            raise FileNotFoundError(f"Screen {screen_name} isn't in corpus {self.corpus} or can't be read.")
+        if image.shape[:2] != (height, width):
+            interpolation = cv2.INTER_AREA if image.shape[0] > height else cv2.INTER_CUBIC
+            image = cv2.resize(image, (width, height), interpolation=interpolation)
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+    @staticmethod
+    def get_ui_element(element_name):
+        """Gets UI element from the manifest by its name.
+
+        :param str element_name: name of UI element.
+
+        :rtype: lib.game.ui.UIElement
+        """
+        ui_element = ui.get_by_name(element_name)
+        if ui_element is None:
+            raise ValueError(f"UI element {element_name} from the manifest doesn't exist.")
+        return ui_element
+
+    def run(self):
+        """Runs benchmark on every screen of the corpus at every resolution.
+
+        :return: dictionary of resolution -> statistics of primitives.
+        :rtype: dict[tuple[int, int], dict[str, PrimitiveStats]]
+        """
+        results = {}
+        for resolution in self.resolutions:
+            stats = {name: PrimitiveStats(name) for name in self.PRIMITIVES}
+            self._learn_ink_signatures(resolution)
+            for screen_name, expectations in self.manifest.items():
+                if expectations.get("learn"):
+                    continue
+                screen = self.load_screen(screen_name, resolution)
+                for element_name in expectations.get("present", []):
+                    self._check_element(stats, screen, element_name, expected=True)
+                for element_name in expectations.get("absent", []):
+                    self._check_element(stats, screen, element_name, expected=False)
+                for element_name, text in expectations.get("texts", {}).items():
+                    self._check_element(stats, screen, element_name, expected=True, expected_text=text)
+            results[resolution] = stats
+        return results
+
+    def _learn_ink_signatures(self, resolution):
+        """Learns ink signatures of UI elements from learning screens (they aren't checked by benchmark).
+
+        :param tuple[int, int] resolution: (width, height) of the screens.
+        """
+        self.ink_signatures = InkSignatures()
+        for screen_name, expectations in self.manifest.items():
+            if not expectations.get("learn"):
+                continue
+            screen = self.load_screen(screen_name, resolution)
+            elements = [(element_name, self.ink_signatures.learn) for element_name in expectations.get("present", [])]
+            elements += [(element_name, self.ink_signatures.learn_negative)
+                         for element_name in expectations.get("absent", [])]
+            for element_name, learn in elements:
+                ui_element = self.get_ui_element(element_name)
+                if ui_element.text_rect and ui_element.text:
+                    learn(ui_element, AndroidEmulator.get_image_from_image(screen, ui_element.text_rect))
+
+    def _check_element(self, stats, screen, element_name, expected, expected_text=None):
+        """Checks UI element on screen with every primitive that element supports.
+
+        :param dict[str, PrimitiveStats] stats: statistics of primitives.
+        :param numpy.ndarray screen: screen image.
+        :param str element_name: name of UI element.
+        :param bool expected: should element be on screen or not.
+        :param str expected_text: exact text that should be recognized.
+        """
+        ui_element = self.get_ui_element(element_name)
+        if ui_element.text_rect and (ui_element.text or expected_text is not None):
+            self._check_text(stats, screen, ui_element, expected, expected_text)
+        if ui_element.image_rect and ui_element.image is not None and expected_text is None:
+            self._check_image(stats, screen, ui_element, expected)
+
+    def _check_text(self, stats, screen, ui_element, expected, expected_text=None):
+        """Checks UI element's text on screen.
+
+        :param dict[str, PrimitiveStats] stats: statistics of primitives.
+        :param numpy.ndarray screen: screen image.
+        :param lib.game.ui.UIElement ui_element: UI element.
+        :param bool expected: should element be on screen or not.
+        :param str expected_text: exact text that should be recognized.
+        """
+        image = AndroidEmulator.get_image_from_image(screen, ui_element.text_rect)
+        if expected_text is None:
+            for _ in range(self.repeat):
+                is_rejected = stats["ink_signature"].measure(self.ink_signatures.is_rejected, ui_element, image)
+            stats["ink_signature"].add_check(not (is_rejected and expected))
+        if not self.ocr_available:
+            return
+        ocr_backend = self.ocr_backend if self.ocr_backend else ui_element.ocr_backend
+        element_stats = self.elements_stats.setdefault(ui_element.name, PrimitiveStats(ui_element.name))
+        text = None
+        for _ in range(self.repeat):
+            region_image = image
+            if ui_element.color_to_convert:
+                region_image = stats["convert_colors_in_image"].measure(convert_colors_in_image, image=image,
+                                                                        colors=ui_element.color_to_convert)
+            try:
+                text = stats["get_text_from_image"].measure(get_text_from_image, image=region_image,
+                                                            threshold=ui_element.text_threshold,
+                                                            chars=ui_element.available_characters,
+                                                            max_height=ui_element.tesseract_resize_height,
+                                                            use_cache=False, ocr_backend=ocr_backend)
+            except TesseractError as error:
+                logger.error(f"OCR isn't available, skipping text checks: {error}")
+                self.ocr_available = False
+                return
+            element_stats.timings.append(stats["get_text_from_image"].timings[-1])
+        if expected_text is not None:
+            stats["get_text_from_image"].add_check(text == expected_text)
+            element_stats.add_check(text == expected_text)
+            return
+        for _ in range(self.repeat):
+            is_similar = stats["is_strings_similar"].measure(is_strings_similar, ui_element.text, text)
+        stats["get_text_from_image"].add_check(is_similar == expected)
+        element_stats.add_check(is_similar == expected)
+        if is_similar != expected:
+            logger.debug(f"{ui_element.name}: got '{text}', expected {'' if expected else 'not '}'{ui_element.text}'")
+
+    def _check_image(self, stats, screen, ui_element, expected):
+        """Checks UI element's image on screen.
+
+        :param dict[str, PrimitiveStats] stats: statistics of primitives.
+        :param numpy.ndarray screen: screen image.
+        :param lib.game.ui.UIElement ui_element: UI element.
+        :param bool expected: should element be on screen or not.
+        """
+        image = AndroidEmulator.get_image_from_image(screen, ui_element.image_rect)
+        is_similar = None
+        for _ in range(self.repeat):
+            is_similar = stats["is_images_similar"].measure(is_images_similar, image1=image, image2=ui_element.image,
+                                                            overlap=ui_element.image_threshold)
+        stats["is_images_similar"].add_check(is_similar == expected)
+        if is_similar != expected:
+            logger.debug(f"{ui_element.name}: image is {'not ' if expected else ''}found.")
+
+    @staticmethod
+    def report(results):
+        """Creates text report from benchmark's results.
+
+        :param dict[tuple[int, int], dict[str, PrimitiveStats]] results: results of benchmark.
+
+        :rtype: str
+        """
+        lines = []
+        for (width, height), stats in results.items():
+            lines.append(f"{width}x{height}:")
+            lines.extend(f"  {primitive_stats}" for primitive_stats in stats.values())
+        return "\n".join(lines)
+
+
+def parse_resolution(value):
+    """Parses resolution from `<width>x<height>` string.
+
+    :param str value: resolution string.
+
+    :rtype: tuple[int, int]
+    """
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark of perception primitives on recorded screens.")
+    parser.add_argument("--corpus", default=CORPUS_FOLDER, help="path to corpus folder")
+    parser.add_argument("--resolutions", nargs="+", type=parse_resolution, default=RESOLUTIONS,
+                        help="resolutions to benchmark, for example: 1280x720 1920x1080")
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_REPEAT,
+                        help="how many times call every primitive for latency measurement")
+    parser.add_argument("--ocr-backend", help="name of OCR backend (see `lib.functions.OCR_BACKENDS`)")
+    args = parser.parse_args()
+
+    benchmark = PerceptionBenchmark(corpus=args.corpus, resolutions=args.resolutions, repeat=args.repeat,
+                                    ocr_backend=args.ocr_backend)
+    print(benchmark.report(benchmark.run()))
@@ -0,0 +1,107 @@
+"""Microbenchmark of structural similarity.
+
+Compares `lib.ssim.StructuralSimilarity` (OpenCV box filters, cached statistics of template) with reference
+implementation of `compare_ssim` of scikit-image (uniform filter, statistics of both images on every call)
+on UI elements' images and their distorted copies as captured from emulator's screen.
+Scores of both implementations are checked to be the same within tolerance.
+
+Usage:
+    python -m benchmarks.ssim --samples 200
+"""
+import argparse
+import random
+import time
+
+import cv2
+import numpy
+
+from lib.game import ui
+from lib.game.ui.general import UIElement
+from lib.ssim import StructuralSimilarity
+
+BENCHMARK_SAMPLES = 200
+BENCHMARK_SEED = 0
+SCORE_TOLERANCE = 1e-6  # Max difference of scores of implementations
+
+
+def uniform_filter_reference(image, size):
+    """Reference implementation of `scipy.ndimage.uniform_filter` in 'reflect' mode."""
+    radius = size // 2
+    for axis in range(image.ndim):
+        padding = [(0, 0)] * image.ndim
+        padding[axis] = (radius + 1, radius)
+        sums = numpy.cumsum(numpy.pad(image, padding, mode="symmetric"), axis=axis)
+        image = (numpy.take(sums, range(size, sums.shape[axis]), axis=axis) -
+                 numpy.take(sums, range(0, sums.shape[axis] - size), axis=axis)) / size
+    return image
+
+
+def compare_ssim_reference(image1, image2, win_size=7):
+    """Reference implementation of `compare_ssim` of scikit-image with default parameters and resize of images."""
+    height, width = max(image1.shape[0], image2.shape[0]), max(image1.shape[1], image2.shape[1])
+    x = cv2.cvtColor(cv2.resize(image1, (width, height), interpolation=cv2.INTER_CUBIC), cv2.COLOR_BGR2GRAY)
+    y = cv2.cvtColor(cv2.resize(image2, (width, height), interpolation=cv2.INTER_CUBIC), cv2.COLOR_BGR2GRAY)
+    x, y = x.astype(numpy.float64), y.astype(numpy.float64)
+    cov_norm = win_size ** 2 / (win_size ** 2 - 1)
+    ux, uy = uniform_filter_reference(x, win_size), uniform_filter_reference(y, win_size)
+    uxx, uyy = uniform_filter_reference(x * x, win_size), uniform_filter_reference(y * y, win_size)
+    uxy = uniform_filter_reference(x * y, win_size)
+    vx, vy, vxy = cov_norm * (uxx - ux * ux), cov_norm * (uyy - uy * uy), cov_norm * (uxy - ux * uy)
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    s = ((2 * ux * uy + c1) * (2 * vxy + c2)) / ((ux ** 2 + uy ** 2 + c1) * (vx + vy + c2))
+    pad = (win_size - 1) // 2
+    return s[pad:-pad, pad:-pad].mean()
+
+
+def distort(image):
+    """Distorts image as captured from emulator's screen: rescales, shifts brightness and adds noise.
+
+    :param numpy.ndarray image: image.
+
+    :rtype: numpy.ndarray
+    """
+    scale = random.uniform(0.8, 1.2)
+    height, width = max(int(image.shape[0] * scale), 7), max(int(image.shape[1] * scale), 7)
+    image = cv2.resize(image, (width, height), interpolation=cv2.INTER_LINEAR).astype(numpy.float64)
+    image += random.uniform(-20, 20) + numpy.random.normal(0, random.uniform(0, 15), image.shape)
+    return numpy.clip(image, 0, 255).astype(numpy.uint8)
+
+
+def run(samples=BENCHMARK_SAMPLES, seed=BENCHMARK_SEED):
+    """Runs benchmark of comparisons of distorted UI elements' images with original ones.
+
+    :param int samples: number of comparisons.
+    :param int seed: random seed of distortions.
+
+    :return: text report.
+    :rtype: str
+    """
+    random.seed(seed)
+    numpy.random.seed(seed)
+    templates = [element.image for element in vars(ui).values()
+                 if isinstance(element, UIElement) and element.image is not None and min(element.image.shape[:2]) >= 7]
+    pairs = [(distort(template), template) for template in (random.choice(templates) for _ in range(samples))]
+    structural_similarity = StructuralSimilarity()
+
+    start = time.perf_counter()
+    reference = [compare_ssim_reference(image, template) for image, template in pairs]
+    reference_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    scores = [structural_similarity.compare(image, template)[0] for image, template in pairs]
+    fast_ms = (time.perf_counter() - start) * 1000
+
+    max_difference = max(abs(score - reference_score) for score, reference_score in zip(scores, reference))
+    if max_difference > SCORE_TOLERANCE:
+        raise AssertionError(f"Scores differ from reference implementation by {max_difference}.")
+    return f"{len(templates)} templates, {samples} comparisons: reference {reference_ms:.1f} ms; " \
+           f"StructuralSimilarity {fast_ms:.1f} ms (x{reference_ms / fast_ms:.1f}); " \
+           f"max score difference {max_difference:.2e}"
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Microbenchmark of structural similarity.")
+    parser.add_argument("--samples", type=int, default=BENCHMARK_SAMPLES, help="number of comparisons")
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED, help="random seed of distortions")
+    args = parser.parse_args()
+
+    print(run(samples=args.samples, seed=args.seed))
@@ -0,0 +1,112 @@
+"""Microbenchmark of string similarity checks.
+
+Compares bounded edit distance of `lib.functions.is_strings_similar` and `lib.functions.find_similar_strings`
+with full edit distance matrix on game modes' names and Daily Trivia questions distorted as OCR results.
+Results of all implementations are checked to be the same.
+
+Usage:
+    python -m benchmarks.strings --samples 200
+"""
+import argparse
+import random
+import time
+
+from lib.functions import is_strings_similar, find_similar_strings
+from lib.game.data.daily_trivia import trivia_qa
+from lib.game.data.game_modes import game_modes
+
+BENCHMARK_SAMPLES = 200
+BENCHMARK_SEED = 0
+OCR_NOISE_CHARS = "ABCILO01 .,'"  # Chars that OCR usually confuses or inserts
+
+
+def is_strings_similar_full(original, compare, overlap=0.25):
+    """Reference implementation of `is_strings_similar` with full edit distance matrix."""
+
+    def levenshtein_distance(a, b):
+        if a == b:
+            return 0
+        if len(a) < len(b):
+            a, b = b, a
+        prev_row = range(len(b) + 1)
+        for i, column1 in enumerate(a):
+            cur_row = [i + 1]
+            for j, column2 in enumerate(b):
+                insertions = prev_row[j + 1] + 1
+                deletions = cur_row[j] + 1
+                substitutions = prev_row[j] + (column1 != column2)
+                cur_row.append(min(insertions, deletions, substitutions))
+            prev_row = cur_row
+        return prev_row[-1]
+
+    distance = levenshtein_distance(original.upper(), compare.upper())
+    non_similarity = distance / len(original) if len(original) > 0 else 1
+    return non_similarity <= overlap
+
+
+def add_ocr_noise(text, rate=0.2):
+    """Distorts text as OCR result: substitutes, inserts and deletes random chars.
+
+    :param str text: text.
+    :param float rate: max ratio of distorted chars.
+
+    :rtype: str
+    """
+    chars = list(text)
+    for _ in range(random.randint(0, int(len(chars) * rate))):
+        position = random.randrange(len(chars) + 1)
+        operation = random.randrange(3)
+        if operation == 0 and position < len(chars):
+            chars[position] = random.choice(OCR_NOISE_CHARS)
+        elif operation == 1:
+            chars.insert(position, random.choice(OCR_NOISE_CHARS))
+        elif position < len(chars):
+            del chars[position]
+    return "".join(chars)
+
+
+def measure(function, *args):
+    """Measures function's duration.
+
+    :return: result of function and duration in milliseconds.
+    :rtype: tuple[object, float]
+    """
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def run(samples=BENCHMARK_SAMPLES, seed=BENCHMARK_SEED):
+    """Runs benchmark of one-to-many checks: OCR string against game modes' names and trivia questions.
+
+    :param int samples: number of OCR strings for each list of candidates.
+    :param int seed: random seed of distortions.
+
+    :return: text report.
+    :rtype: str
+    """
+    random.seed(seed)
+    lines = []
+    for name, candidates in (("game modes", list(game_modes)), ("trivia questions", list(trivia_qa))):
+        texts = [add_ocr_noise(random.choice(candidates)) for _ in range(samples)]
+        full, full_ms = measure(lambda: [[candidate for candidate in candidates
+                                          if is_strings_similar_full(candidate, text)] for text in texts])
+        bounded, bounded_ms = measure(lambda: [[candidate for candidate in candidates
+                                                if is_strings_similar(candidate, text)] for text in texts])
+        batch, batch_ms = measure(lambda: [[candidate for candidate, _ in find_similar_strings(candidates, text)]
+                                           for text in texts])
+        if not full == bounded == batch:
+            raise AssertionError(f"Results of bounded edit distance for {name} differ from full edit distance.")
+        lines.append(f"{name} ({len(candidates)} candidates, {samples} texts): full {full_ms:.1f} ms; "
+                     f"is_strings_similar {bounded_ms:.1f} ms (x{full_ms / bounded_ms:.1f}); "
+                     f"find_similar_strings {batch_ms:.1f} ms (x{full_ms / batch_ms:.1f})")
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Microbenchmark of string similarity checks.")
+    parser.add_argument("--samples", type=int, default=BENCHMARK_SAMPLES, help="number of OCR strings")
+    parser.add_argument("--seed", type=int, default=BENCHMARK_SEED, help="random seed of distortions")
+    args = parser.parse_args()
+
+    print(run(samples=args.samples, seed=args.seed))
@@ -0,0 +1,124 @@
+import os
+from queue import Queue, Full
+from threading import Thread, Lock
+
+import cv2
+
+import lib.logger as logging
+
+logger = logging.get_logger(__name__)
+
+DEBUG_IMAGES_FOLDER = os.path.join("logs", "tesseract")
+DEBUG_IMAGES_QUEUE_SIZE = 32  # Images are dropped if writer can't keep up with this many pending images
+
+
+class DebugImageWriter:
+    """Class for writing debug images of recognitions in background thread.
+    Images are put into bounded queue and dropped if it's full, so recognition never waits for disk.
+
+    Sampling:
+        - `enabled` is global switch for all debug images;
+        - `every_nth` writes only every N-th image of each name;
+        - `only_mismatches` writes only images of failed recognitions;
+        - `names` writes only images with given names (all names if empty).
+
+    Images are written only if the folder exists; it's checked when the folder is set, not for every image.
+    """
+
+    def __init__(self, folder=DEBUG_IMAGES_FOLDER, queue_size=DEBUG_IMAGES_QUEUE_SIZE, enabled=True, every_nth=1,
+                 only_mismatches=False, names=None):
+        """Class initialization.
+
+        :param str folder: folder for images.
+        :param int queue_size: max number of pending images.
+        :param bool enabled: write images or not.
+        :param int every_nth: write every N-th image of each name.
+        :param bool only_mismatches: write only images of failed recognitions.
+        :param set[str] names: names of images to write; all names if not given.
+        """
+        self.folder = folder
+        self.enabled = enabled
+        self.every_nth = every_nth
+        self.only_mismatches = only_mismatches
+        self.names = set(names) if names else set()
+        self.written, self.dropped = 0, 0
+        self._counters = {}
+        self._queue = Queue(maxsize=queue_size)
+        self._thread = None
+        self._lock = Lock()
+
+    @property
+    def folder(self):
+        """Folder for images.
+
+        :rtype: str
+        """
+        return self._folder
+
+    @folder.setter
+    def folder(self, folder):
+        self._folder = folder
+        self._is_folder_exists = os.path.isdir(folder)
+
+    def is_sampled(self, name, mismatch=None):
+        """Checks if image should be written by sampling settings.
+
+        :param str name: name of image.
+        :param bool mismatch: was recognition failed or not; None if it's unknown.
+
+        :rtype: bool
+        """
+        if not self.enabled or not self._is_folder_exists:
+            return False
+        if self.names and name not in self.names:
+            return False
+        if self.only_mismatches and mismatch is False:
+            return False
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + 1
+            return (self._counters[name] - 1) % max(self.every_nth, 1) == 0
+
+    def save(self, name, image, mismatch=None):
+        """Puts image into writing queue if it passes sampling. Doesn't block.
+
+        :param str name: name of image.
+        :param numpy.ndarray | function image: image or function that creates image (called in writer's thread).
+        :param bool mismatch: was recognition failed or not; None if it's unknown.
+
+        :return: was image queued or not.
+        :rtype: bool
+        """
+        if not self.is_sampled(name, mismatch):
+            return False
+        self._start()
+        try:
+            self._queue.put_nowait((name, image))
+            return True
+        except Full:
+            self.dropped += 1
+            return False
+
+    def _start(self):
+        """Starts writer's thread if it isn't running."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        """Writes images from the queue."""
+        while True:
+            name, image = self._queue.get()
+            try:
+                image = image() if callable(image) else image
+                cv2.imwrite(os.path.join(self.folder, f"{name}.png"), image)
+                self.written += 1
+            except Exception as error:
+                logger.debug(f"Can't write debug image {name}: {error}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Waits until all queued images are written."""
+        if self._thread is not None:
+            self._queue.join()
@@ -1,35 +1,55 @@
 ﻿import ctypes
 import logging
+import math
+import os
 import random
 import time
-from ctypes import windll
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from distutils.version import LooseVersion
 from platform import release
 
-import autoit
-import pywintypes
-import win32api
-import win32con
-import win32gui
-import win32process
-import win32ui
-from PIL import Image
-from numpy import array
-
-from lib.functions import get_text_from_image, is_strings_similar, is_images_similar, is_color_similar, r_sleep, \
-    get_file_properties, convert_colors_in_image
+import cv2
+from numpy import frombuffer, uint8
+
+from lib.emulators.color_probe import ColorProbe
+from lib.emulators.frame_broker import FrameBroker
+from lib.emulators.shared_frames import SharedFrameReader
+from lib.functions import get_text_from_image, is_strings_similar, is_images_similar, is_any_color_similar, \
+    r_sleep, get_file_properties, convert_colors_in_image, get_texts_from_image_regions, locate_image
+from lib.ink_signature import InkSignatures
+from lib.region_cache import RegionCache
+from lib.screen_classifier import ScreenClassifier
+from lib.template_store import TemplateStore
+
+try:
+    import autoit
+    import pywintypes
+    import win32api
+    import win32con
+    import win32gui
+    import win32process
+    import win32ui
+    from ctypes import windll
+except ImportError:  # Not a Windows platform: only emulators without windows are available (see `ReplayEmulator`)
+    autoit, pywintypes, win32api, win32con, win32gui, win32process, win32ui, windll = (None,) * 8
 
 PW_CLIENTONLY = 1  # Only the client area of the window is copied to hdcBlt. By default, the entire window is copied.
 PW_RENDERFULLCONTENT = 2  # Properly capture DirectComposition window contents. Available from Windows 8.1
+FRAME_FRESHNESS_SEC = 0.05  # How long captured frame can be reused by screen checks without new capture
+# Threads for recognizing texts of multiple UI elements concurrently (see `AndroidEmulator.get_screen_texts`)
+_text_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
 
 # Set process as high-DPI aware to get actual window's coordinates. Set WM_PAINT flag by OS version
-if release() == "10":
+if windll and release() == "10":
     PRINT_FLAG = PW_RENDERFULLCONTENT
     ctypes.windll.shcore.SetProcessDpiAwareness(2)
 else:
     PRINT_FLAG = PW_CLIENTONLY
-    ctypes.windll.user32.SetProcessDPIAware()
-ctypes.windll.kernel32.SetThreadExecutionState(0x80000000 | 0x00000040)  # Prevent Windows going to sleep mode
+    if windll:
+        ctypes.windll.user32.SetProcessDPIAware()
+if windll:
+    ctypes.windll.kernel32.SetThreadExecutionState(0x80000000 | 0x00000040)  # Prevent Windows going to sleep mode
 
 
 class AndroidEmulator(object):
@@ -47,8 +67,19 @@ class AndroidEmulator(object):
         self.name = name
         self.child_name = child_name
         self.key_handle_name = key_handle_name
-        self.screen_locked = False
         self.last_frame = None
+        self.frame_broker = FrameBroker(capture=self._capture_frame)
+        self.shared_frames = None
+        self.region_cache = RegionCache()
+        self.ink_signatures = InkSignatures()
+        self.template_store = TemplateStore()
+        self.screen_classifier = ScreenClassifier()
+        self.frame_freshness = FRAME_FRESHNESS_SEC
+        self.frames_served, self.frames_captured = 0, 0
+        self._last_frame_time, self._last_frame_sequence = 0, 0
+        self._last_input_time = 0
+        self._inputs_sent = 0
+        self._pinned_at_input = None
         self.update_handlers()
         self._set_params_by_version()
         if self.initialized:
@@ -63,8 +94,8 @@ class AndroidEmulator(object):
         self.parent_hwnd, self.parent_thread, self.main_key_handle = (None,) * 7
         self.x, self.y, self.width, self.height, self.hwnd, self.key_handle = (None,) * 6
         # Storing external functions for process manager context (video_capture decorators)
-        self.autoit_control_click_by_handle = autoit.control_click_by_handle
-        self.win32_api_post_message = win32api.PostMessage
+        self.autoit_control_click_by_handle = autoit.control_click_by_handle if autoit else None
+        self.win32_api_post_message = win32api.PostMessage if win32api else None
 
     def get_process_exe(self):
         """Gets path of emulator's executable file.
@@ -134,6 +165,7 @@ class AndroidEmulator(object):
             self.y1 = self.y - self.parent_y
             self.x2 = self.width + self.x1
             self.y2 = self.height + self.y1
+            self.template_store.set_resolution(self.width, self.height)
         except pywintypes.error:
             pass
 
@@ -199,30 +231,28 @@ class AndroidEmulator(object):
 
     def get_screen_image(self, rect=(0, 0, 1, 1)):
         """Gets image of emulator's screen.
+        Returns view of the current frame without copying: copy it if you're going to modify it.
 
         :param tuple[float, float, float, float] | lib.game.ui.Rect rect: rectangle of screen to capture.
 
         :rtype: numpy.ndarray
         """
-        box = (rect[0] * self.width, rect[1] * self.height,
-               rect[2] * self.width, rect[3] * self.height)
-        screen = self._get_screen().crop(box)
-        return array(screen)
+        return self.get_image_from_image(self._get_screen(), rect)
 
     @staticmethod
     def get_image_from_image(image, rect):
         """Gets image from another image. Basically just crops it.
+        Returns view of the given image without copying.
 
         :param numpy.ndarray image: image.
         :param tuple[float, float, flaot, float] | lib.game.ui.Rect rect: rectangle to crop.
 
         :rtype: numpy.ndarray
         """
-        image = Image.fromarray(image)
-        box = (rect[0] * image.width, rect[1] * image.height,
-               rect[2] * image.width, rect[3] * image.height)
-        screen = image.crop(box)
-        return array(screen)
+        height, width = image.shape[:2]
+        x1, y1 = round(rect[0] * width), round(rect[1] * height)
+        x2, y2 = round(rect[2] * width), round(rect[3] * height)
+        return image[max(y1, 0):max(y2, 0), max(x1, 0):max(x2, 0)]
 
     def get_screen_color(self, positions, screen=None):
         """Gets color from emulator's screen by it position.
@@ -234,7 +264,19 @@ class AndroidEmulator(object):
         :rtype: list[tuple[int, int, int]]
         """
         screen = screen if screen is not None else self._get_screen()
-        return [screen.getpixel(position) for position in positions]
+        return [tuple(screen[y, x].tolist()) for x, y in positions]
+
+    def get_screen_colors(self, probe, screen=None):
+        """Gets colors from emulator's screen by color probe.
+
+        :param lib.emulators.color_probe.ColorProbe probe: color probe with positions rectangles.
+        :param numpy.ndarray screen: screen image.
+
+        :return: array of (r,g,b) colors.
+        :rtype: numpy.ndarray
+        """
+        screen = screen if screen is not None else self._get_screen()
+        return probe.sample(screen)
 
     def get_position_inside_screen_rectangle(self, rect, offset=0.1):
         """Gets (x,y) position inside screen rectangle with padding offset.
@@ -254,61 +296,256 @@ class AndroidEmulator(object):
         x, y = random.uniform(x1, x2), random.uniform(y1, y2)
         return int(x * self.width), int(y * self.height)
 
-    def get_screen_text(self, ui_element, screen=None):
+    def get_screen_text(self, ui_element, screen=None, alternatives=False):
         """Gets text from emulator's screen.
+        Text is a string with confidence of recognition, see `lib.ocr_backend.OCRResult`.
 
         :param lib.game.ui.UIElement ui_element: UI element that has all info for text recognition.
         :param numpy.ndarray screen: screen image.
+        :param bool alternatives: get alternatives of each recognized character or not.
 
         :return: text from the image.
-        :rtype: str
+        :rtype: lib.ocr_backend.OCRResult
         """
         image = self.get_screen_image(ui_element.text_rect) if screen is None else screen
-        if ui_element.color_to_convert:
-            image = convert_colors_in_image(image=image, colors=ui_element.color_to_convert)
-        return get_text_from_image(image=image, threshold=ui_element.text_threshold,
-                                   chars=ui_element.available_characters,
-                                   max_height=ui_element.tesseract_resize_height,
-                                   save_file=ui_element.name)
+
+        def get_text(region_image):
+            if ui_element.color_to_convert:
+                region_image = convert_colors_in_image(image=region_image, colors=ui_element.color_to_convert)
+            return get_text_from_image(image=region_image, threshold=ui_element.text_threshold,
+                                       chars=ui_element.available_characters,
+                                       max_height=ui_element.tesseract_resize_height,
+                                       save_file=ui_element.name, use_cache=ui_element.use_ocr_cache,
+                                       glyph_font=ui_element.glyph_font, ocr_backend=ui_element.ocr_backend,
+                                       alternatives=alternatives)
+
+        key = ("text", ui_element.name, tuple(ui_element.text_rect), ui_element.text_threshold,
+               ui_element.available_characters, ui_element.tesseract_resize_height, repr(ui_element.color_to_convert),
+               alternatives)
+        return self._get_region_result(key=key, image=image, recognize=get_text, use_cache=ui_element.use_region_cache)
+
+    def get_screen_texts(self, ui_elements, screen=None, single_upload=False):
+        """Gets texts of multiple UI elements from single frame.
+        Regions are recognized concurrently, so it takes about one OCR round-trip instead of one per element.
+
+        With `single_upload` UI elements with the same recognition parameters (threshold, available characters
+        and OCR backend) are prepared and uploaded to OCR once (see `get_texts_from_image_regions`).
+        Elements with color conversion or glyph font are recognized by `get_screen_text` as usual.
+
+        :param list[lib.game.ui.UIElement] ui_elements: UI elements that have all info for text recognition.
+        :param numpy.ndarray screen: screen image (whole frame); current frame if not given.
+        :param bool single_upload: upload frame once for UI elements with the same recognition parameters.
+
+        :return: dictionary of UI element's name -> text from the image.
+        :rtype: dict[str, str]
+        """
+        screen = screen if screen is not None else self._get_screen()
+        ui_elements = list(ui_elements)
+        texts = self._get_screen_texts_by_single_upload(ui_elements, screen) if single_upload else {}
+
+        def get_text(ui_element):
+            return self.get_screen_text(ui_element, screen=self.get_image_from_image(screen, ui_element.text_rect))
+
+        other_ui_elements = [ui_element for ui_element in ui_elements if ui_element.name not in texts]
+        texts.update(zip((ui_element.name for ui_element in other_ui_elements),
+                         _text_executor.map(get_text, other_ui_elements)))
+        return {ui_element.name: texts[ui_element.name] for ui_element in ui_elements}
+
+    @staticmethod
+    def _get_screen_texts_by_single_upload(ui_elements, screen):
+        """Gets texts of UI elements with the same recognition parameters by single upload of the frame.
+
+        :param list[lib.game.ui.UIElement] ui_elements: UI elements that have all info for text recognition.
+        :param numpy.ndarray screen: screen image (whole frame).
+
+        :return: dictionary of UI element's name -> text from the image for grouped UI elements.
+        :rtype: dict[str, str]
+        """
+        groups = {}
+        for ui_element in ui_elements:
+            if ui_element.color_to_convert or ui_element.glyph_font:
+                continue
+            key = (ui_element.text_threshold, ui_element.available_characters, ui_element.tesseract_resize_height,
+                   ui_element.ocr_backend)
+            groups.setdefault(key, []).append(ui_element)
+        height, width = screen.shape[:2]
+        texts = {}
+        for (threshold, chars, max_height, ocr_backend), group in groups.items():
+            if len(group) < 2:
+                continue
+            boxes = [(round(ui_element.text_rect[0] * width), round(ui_element.text_rect[1] * height),
+                      round(ui_element.text_rect[2] * width), round(ui_element.text_rect[3] * height))
+                     for ui_element in group]
+            group_texts = get_texts_from_image_regions(screen, boxes=boxes, threshold=threshold, chars=chars,
+                                                       save_files=[ui_element.name for ui_element in group],
+                                                       max_height=max_height,
+                                                       use_cache=all(ui_element.use_ocr_cache for ui_element in group),
+                                                       ocr_backend=ocr_backend)
+            texts.update(zip((ui_element.name for ui_element in group), group_texts))
+        return texts
 
     def is_image_on_screen(self, ui_element, screen=None):
         """Checks if image is on screen.
+        UI element's image is taken from template store already scaled to the screen's resolution.
+        If UI element has `search_rect` then image can be anywhere inside it (see `get_image_position`).
 
         :param lib.game.ui.UIElement ui_element: UI element hat has all info for image recognition.
-        :param numpy.ndarray screen: screen image.
+        :param numpy.ndarray screen: screen image (image of the whole screen if UI element has `search_rect`).
 
         :rtype: bool
         """
+        if ui_element.search_rect is not None:
+            return self.get_image_position(ui_element, screen=screen) is not None
         image = self.get_screen_image(ui_element.image_rect) if screen is None else screen
-        return is_images_similar(image1=image, image2=ui_element.image,
-                                 overlap=ui_element.image_threshold, save_file=ui_element.name)
+        template = self.template_store.get(ui_element)
+
+        def is_image_similar(region_image):
+            return is_images_similar(image1=region_image, image2=ui_element.image if template is None else template,
+                                     overlap=ui_element.image_threshold, save_file=ui_element.name)
+
+        key = ("image", ui_element.name, tuple(ui_element.image_rect), id(ui_element.image), ui_element.image.shape,
+               ui_element.image_threshold)
+        return self._get_region_result(key=key, image=image, recognize=is_image_similar,
+                                       use_cache=ui_element.use_region_cache)
+
+    def locate(self, ui_element, search_rect=None, screen=None):
+        """Locates UI element's image anywhere inside search area by normalized cross-correlation.
+        Image is searched at the size of its `image_rect` crop of the screen.
+
+        :param lib.game.ui.UIElement ui_element: UI element with image.
+        :param lib.game.ui.Rect search_rect: area for searching.
+            UI element's `search_rect` or `image_rect` if not given.
+        :param numpy.ndarray screen: image of the whole screen.
+
+        :return: rectangle of the best location and its score (from -1 to 1)
+            or (None, 0.0) if image can't be searched in the area.
+        :rtype: tuple[tuple[float, float, float, float] | None, float]
+        """
+        search_rect = search_rect or ui_element.search_rect or ui_element.image_rect
+        screen = self._get_screen() if screen is None else screen
+        template = self.template_store.get(ui_element)
+        area = self.get_image_from_image(screen, search_rect)
+        if template is None or area.shape[0] < template.shape[0] or area.shape[1] < template.shape[1]:
+            return None, 0.0
+        # RGB frame is converted with BGR weights on purpose: templates, thresholds and all other gray-scale
+        # conversions use the same weights, so gray levels are comparable
+        area = cv2.cvtColor(area, cv2.COLOR_BGR2GRAY) if area.ndim == 3 else area
+        (x, y), score = locate_image(area, template)
+        if not math.isfinite(score):  # Flat area or template
+            return None, 0.0
+        height, width = screen.shape[:2]
+        x, y = x + max(round(search_rect[0] * width), 0), y + max(round(search_rect[1] * height), 0)
+        template_height, template_width = template.shape
+        return (x / width, y / height, (x + template_width) / width, (y + template_height) / height), score
+
+    def get_image_position(self, ui_element, screen=None):
+        """Gets position of UI element's image inside its search area (`search_rect`).
+        Image is located by single normalized cross-correlation over the area,
+        then the best location is checked by structural similarity with UI element's `image_threshold`.
+
+        :param lib.game.ui.UIElement ui_element: UI element with image and search area.
+        :param numpy.ndarray screen: image of the whole screen.
+
+        :return: rectangle of the image or None if image isn't in the area.
+        :rtype: tuple[float, float, float, float] | None
+        """
+        screen = self._get_screen() if screen is None else screen
+
+        def get_position(_):
+            rect, _ = self.locate(ui_element, screen=screen)
+            if rect is None:
+                return None
+            template = self.template_store.get(ui_element)
+            if is_images_similar(image1=self.get_image_from_image(screen, rect), image2=template,
+                                 overlap=ui_element.image_threshold, save_file=ui_element.name):
+                return rect
+            return None
+
+        search_rect = ui_element.search_rect or ui_element.image_rect
+        key = ("position", ui_element.name, tuple(search_rect), tuple(ui_element.image_rect), id(ui_element.image),
+               ui_element.image.shape, ui_element.image_threshold)
+        return self._get_region_result(key=key, image=self.get_image_from_image(screen, search_rect),
+                                       recognize=get_position, use_cache=ui_element.use_region_cache)
+
+    def _get_region_result(self, key, image, recognize, use_cache=True):
+        """Gets result of region's recognition. Uses memoized result if region wasn't changed.
+
+        :param tuple key: key of recognition (UI element's name, rectangle and recognition parameters).
+        :param numpy.ndarray image: image of the region.
+        :param function recognize: function that recognizes the region's image.
+        :param bool use_cache: use memoized result or not (UI elements that change slightly, as timers, opt out).
+        """
+        if self.region_cache is None or not use_cache:
+            return recognize(image)
+        result = self.region_cache.get(key=key, image=image)
+        if result is RegionCache.MISS:
+            result = recognize(image)
+            self.region_cache.set(key=key, image=image, result=result)
+        return result
 
     def is_ui_element_on_screen(self, ui_element, screen=None):
         """Checks if UI element is on screen.
+        Region without ink or which ink signature is far from signatures of recognized text is rejected without OCR,
+        the latter only while it's unchanged since OCR didn't find the text on it.
 
         :param lib.game.ui.UIElement ui_element: UI element hat has all info for text recognition.
         :param numpy.ndarray screen: screen image.
 
         :rtype: bool
         """
-        text_on_screen = self.get_screen_text(ui_element, screen)
-        return is_strings_similar(ui_element.text, text_on_screen)
+        image = self.get_screen_image(ui_element.text_rect) if screen is None else screen
+        if ui_element.use_ink_signature and self.ink_signatures.is_rejected(ui_element, image):
+            return False
+        text_on_screen = self.get_screen_text(ui_element, image)
+        is_on_screen = is_strings_similar(ui_element.text, text_on_screen)
+        if ui_element.use_ink_signature:
+            if is_on_screen:
+                self.ink_signatures.learn(ui_element, image)
+            else:
+                self.ink_signatures.learn_negative(ui_element, image)
+        if is_on_screen:
+            self.screen_classifier.learn(ui_element, image, ui_element.text_rect)
+        return is_on_screen
+
+    def get_screen_candidates(self, ui_elements, screen=None):
+        """Ranks UI elements by how likely they are on screen by fingerprints of their regions
+        in single pass over the screen (see `ScreenClassifier`).
+        Candidates still need confirmation (`is_ui_element_on_screen` or `is_image_on_screen`),
+        unlikely elements aren't excluded from them, they are only ranked last.
+
+        :param list[lib.game.ui.UIElement] ui_elements: UI elements.
+        :param numpy.ndarray screen: image of the whole screen.
+
+        :return: all UI elements sorted by how likely they are on screen.
+        :rtype: list[lib.game.ui.UIElement]
+        """
+        screen = self._get_screen() if screen is None else screen
+        return [ui_element for ui_element, _ in self.screen_classifier.classify(screen, ui_elements)]
+
+    def get_grid_slots(self, slot_grid, screen=None):
+        """Gets states of all slots of the grid in single pass over the screen (see `SlotGrid`).
+
+        :param lib.slot_grid.SlotGrid slot_grid: grid of slots.
+        :param numpy.ndarray screen: image of the whole screen.
+
+        :return: slots from top left to bottom right.
+        :rtype: list[lib.slot_grid.GridSlot]
+        """
+        screen = self._get_screen() if screen is None else screen
+        return slot_grid.analyze(screen)
 
     def is_color_similar(self, color, rects, screen=None):
         """Checks if color on screen is similar to given color.
 
         :param tuple[int, int, int] color: color to check.
-        :param list[tuple[float, float, float, float]] | list[lib.game.ui.Rect] rects: color position rectangles.
+        :param list[tuple[float, float, float, float]] | list[lib.game.ui.Rect] | ColorProbe rects:
+            color position rectangles or precompiled color probe of them.
         :param numpy.ndarray screen: screen image.
 
         :rtype: bool
         """
-        positions = [self.get_position_inside_screen_rectangle(rect) for rect in rects]
-        screen_colors = self.get_screen_color(positions=positions, screen=screen)
-        similar = False
-        for screen_color in screen_colors:
-            similar = similar or True if is_color_similar(color, screen_color) else similar or False
-        return similar
+        probe = rects if isinstance(rects, ColorProbe) else ColorProbe(rects=rects)
+        return is_any_color_similar(color, self.get_screen_colors(probe=probe, screen=screen))
 
     def click_button(self, ui_element, min_duration=0.1, max_duration=0.25):
         """Clicks inside button rectangle by it's UI element.
@@ -321,6 +558,7 @@ class AndroidEmulator(object):
         r_sleep(duration)
         x, y = self.get_position_inside_screen_rectangle(ui_element.button_rect.global_rect)
         self.autoit_control_click_by_handle(self.parent_hwnd, self.hwnd, x=x, y=y)
+        self.invalidate_frame()
         r_sleep(duration * 2)
 
     def press_key(self, key, system_key=False):
@@ -331,6 +569,7 @@ class AndroidEmulator(object):
         """
         handle = self.key_handle if not system_key else self.main_key_handle
         autoit.control_send_by_handle(self.main_key_handle, handle, key)
+        self.invalidate_frame()
 
     def close_current_app(self):
         """Closes current opened app in emulator. Should be implemented in child classes."""
@@ -367,24 +606,92 @@ class AndroidEmulator(object):
                                         win32api.MAKELONG(x, y))
             time.sleep(sleep_amount)
         self.win32_api_post_message(self.hwnd, win32con.WM_LBUTTONUP, 0, win32api.MAKELONG(*to_position))
+        self.invalidate_frame()
+
+    @contextmanager
+    def frame(self):
+        """Context manager that pins current frame: every screen check inside of it reads the same snapshot.
+        Pinning is released after any input (click, drag or key press) so checks after input see new frames.
+
+        :return: pinned frame.
+        :rtype: numpy.ndarray
+        """
+        pinned_before = self._pinned_at_input
+        self._get_screen()
+        self._pinned_at_input = self._inputs_sent
+        try:
+            yield self.last_frame
+        finally:
+            self._pinned_at_input = pinned_before
+
+    def invalidate_frame(self):
+        """Invalidates current frame snapshot. Next screen check will capture new frame."""
+        self._inputs_sent += 1
+        self._last_input_time = time.time()
+
+    @property
+    def is_frame_fresh(self):
+        """Property that checks whether last captured frame can be reused by screen checks.
+
+        :rtype: bool
+        """
+        if self.last_frame is None or self._last_frame_time <= self._last_input_time:
+            return False
+        if self._pinned_at_input is not None and self._pinned_at_input == self._inputs_sent:
+            return True
+        return time.time() - self._last_frame_time <= self.frame_freshness
+
+    def attach_shared_frames(self):
+        """Makes frame broker read frames from `shared_frames` ring (written by another process)
+        instead of capturing them. Should be called inside of consumer's process."""
+        if self.shared_frames:
+            self.frame_broker.capture = SharedFrameReader(ring=self.shared_frames, fallback=self._capture_frame)
+
+    def reset_frame_stats(self):
+        """Resets counters of served from snapshot and captured frames."""
+        self.frames_served, self.frames_captured = 0, 0
 
     def _get_screen(self):
         """Get screen image from emulator's main window.
+        Returns snapshot of last frame if it's still fresh, otherwise waits for new frame from frame broker.
 
-        :return: image from emulator in BGR format.
-        :rtype: PIL.Image.Image
+        :return: image from emulator in RGB format.
+        :rtype: numpy.ndarray
         """
         if not self.initialized:
             return None
+        if self.is_frame_fresh:
+            self.frames_served += 1
+            return self.last_frame
+        frame = self.frame_broker.get_frame(captured_after=max(self._last_input_time,
+                                                               time.time() - self.frame_freshness))
+        if frame is None:
+            logging.warning(f"{self.name}: can't get new frame, using the last one.")
+            return self.last_frame
+        if frame.sequence == self._last_frame_sequence:
+            self.frames_served += 1
+        else:
+            self.frames_captured += 1
+        self.last_frame, self._last_frame_time, self._last_frame_sequence = frame.image, frame.timestamp, frame.sequence
+        return self.last_frame
+
+    def _capture_frame(self):
+        """Captures new frame for frame broker.
+
+        :rtype: numpy.ndarray
+        """
         if self.is_minimized:
             self.maximize()
         self.update_window_rectangles()
-        while self.screen_locked:
-            if self.last_frame:
-                return self.last_frame
-            time.sleep(0.1)
-        self.screen_locked = True
+        return self._capture_screen()
 
+    def _capture_screen(self):
+        """Captures image of emulator's main window and crops it by emulator's screen.
+        Can be overridden in child classes that get frames from other sources.
+
+        :return: image from emulator in RGB format.
+        :rtype: numpy.ndarray
+        """
         hwnd_dc = win32gui.GetWindowDC(self.parent_hwnd)
         mfc_dc = win32ui.CreateDCFromHandle(hwnd_dc)
         save_dc = mfc_dc.CreateCompatibleDC()
@@ -403,8 +710,6 @@ class AndroidEmulator(object):
         mfc_dc.DeleteDC()
         win32gui.ReleaseDC(self.parent_hwnd, hwnd_dc)
 
-        self.screen_locked = False
-        parent_img = Image.frombuffer('RGB', (bmp_info['bmWidth'], bmp_info['bmHeight']), bmp_arr, 'raw', 'BGRX', 0, 1)
-        img = parent_img.crop((self.x1, self.y1, self.x2, self.y2))
-        self.last_frame = img
-        return img
+        parent_img = frombuffer(bmp_arr, dtype=uint8).reshape((bmp_info['bmHeight'], bmp_info['bmWidth'], 4))
+        # Single copy of the frame: crop BGRX view of the bitmap and convert it to contiguous 3-channel image
+        return cv2.cvtColor(parent_img[self.y1:self.y2, self.x1:self.x2], cv2.COLOR_BGRA2RGB)
@@ -78,3 +78,4 @@ class BlueStacks(AndroidEmulator):
                                         win32api.MAKELONG(x, y))
             time.sleep(sleep_amount)
         self.win32_api_post_message(self.hwnd, win32con.WM_LBUTTONUP, 0, win32api.MAKELONG(*to_position))
+        self.invalidate_frame()
@@ -0,0 +1,59 @@
+import numpy
+
+
+class ColorProbe:
+    """Class for sampling colors from multiple screen rectangles at once.
+    Rectangles are compiled into pixel bounds once per screen resolution,
+    then random positions inside all of them are sampled with single vectorized call."""
+
+    def __init__(self, rects, offset=0.1):
+        """Class initialization.
+
+        :param list[tuple[float, float, float, float]] | list[lib.game.ui.Rect] rects: color position rectangles.
+        :param float offset: padding offset inside rectangles.
+        """
+        rects = numpy.array([tuple(rect) for rect in rects], dtype=numpy.float64).reshape((-1, 4))
+        x1, y1, x2, y2 = rects[:, 0], rects[:, 1], rects[:, 2], rects[:, 3]
+        dx, dy = x2 - x1, y2 - y1
+        self._bounds = numpy.stack((x1 + dx * offset, y1 + dy * offset, x2 - dx * offset, y2 - dy * offset), axis=1)
+        self._resolution = None
+        self._pixel_bounds = None
+
+    def __len__(self):
+        return len(self._bounds)
+
+    def _compile(self, width, height):
+        """Compiles rectangles' bounds into pixel bounds for given resolution.
+
+        :param int width: screen's width.
+        :param int height: screen's height.
+        """
+        if self._resolution != (width, height):
+            self._pixel_bounds = self._bounds * (width, height, width, height)
+            self._resolution = (width, height)
+        return self._pixel_bounds
+
+    def positions(self, width, height):
+        """Gets random (x, y) positions inside every rectangle.
+
+        :param int width: screen's width.
+        :param int height: screen's height.
+
+        :return: arrays of X and Y coordinates.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray]
+        """
+        bounds = self._compile(width, height)
+        x = numpy.random.uniform(bounds[:, 0], bounds[:, 2]).astype(numpy.intp)
+        y = numpy.random.uniform(bounds[:, 1], bounds[:, 3]).astype(numpy.intp)
+        return numpy.clip(x, 0, width - 1), numpy.clip(y, 0, height - 1)
+
+    def sample(self, screen):
+        """Samples colors from screen image.
+
+        :param numpy.ndarray screen: screen image.
+
+        :return: array of (r,g,b) colors.
+        :rtype: numpy.ndarray
+        """
+        x, y = self.positions(width=screen.shape[1], height=screen.shape[0])
+        return screen[y, x]
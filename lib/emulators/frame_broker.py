@@ -0,0 +1,137 @@
+import logging
+import time
+from threading import Condition, Thread
+
+FRAME_BROKER_FPS = 20  # Target rate of capturing when there are no consumers waiting for new frame
+FRAME_BROKER_IDLE_TIMEOUT_SEC = 2  # Capturing thread stops itself if nobody requested frames for this time
+FRAME_WAIT_TIMEOUT_SEC = 1
+
+
+class Frame:
+    """Class for storing captured frame."""
+
+    def __init__(self, image, sequence, timestamp):
+        """Class initialization.
+
+        :param numpy.ndarray image: captured image.
+        :param int sequence: sequence number of the frame.
+        :param float timestamp: time when capturing of the frame was started.
+        """
+        self.image = image
+        self.sequence = sequence
+        self.timestamp = timestamp
+
+    @property
+    def age(self):
+        """How many seconds ago frame was captured.
+
+        :rtype: float
+        """
+        return time.time() - self.timestamp
+
+
+class FrameBroker:
+    """Class for sharing frames between multiple consumers.
+    Single thread captures frames at target rate (or right away if any consumer waits for a frame)
+    and consumers block until frame that satisfies their requirements is captured.
+    """
+
+    def __init__(self, capture, fps=FRAME_BROKER_FPS, idle_timeout=FRAME_BROKER_IDLE_TIMEOUT_SEC):
+        """Class initialization.
+
+        :param function capture: function that captures image.
+        :param float fps: target rate of capturing.
+        :param float idle_timeout: how many seconds capturing thread can live without requests.
+        """
+        self.capture = capture
+        self.fps = fps
+        self.idle_timeout = idle_timeout
+        self._init_state()
+
+    def _init_state(self):
+        """Initializes thread-related state of the broker."""
+        self._condition = Condition()
+        self._thread = None
+        self._frame = None
+        self._waiting = 0
+        self._last_request_time = 0
+        self.frames_captured = 0
+
+    def __getstate__(self):
+        """Thread-related state isn't shared between processes: each process captures frames itself."""
+        return {"capture": self.capture, "fps": self.fps, "idle_timeout": self.idle_timeout}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_state()
+
+    @property
+    def latest(self):
+        """Last captured frame.
+
+        :rtype: Frame
+        """
+        return self._frame
+
+    @property
+    def is_running(self):
+        """Is capturing thread running or not.
+
+        :rtype: bool
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def get_frame(self, newer_than=None, captured_after=None, timeout=FRAME_WAIT_TIMEOUT_SEC):
+        """Gets frame from broker. Blocks until suitable frame is captured.
+
+        :param int newer_than: sequence number of frame that is too old.
+        :param float captured_after: time after which capturing of the frame should be started.
+        :param float timeout: how many seconds wait for the frame.
+
+        :return: suitable frame or None if there was no frame in given timeout.
+        :rtype: Frame
+        """
+
+        def is_suitable():
+            frame = self._frame
+            return frame is not None and (newer_than is None or frame.sequence > newer_than) and \
+                (captured_after is None or frame.timestamp > captured_after)
+
+        with self._condition:
+            self._last_request_time = time.time()
+            if not self.is_running:
+                self._thread = Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+                self._thread.start()
+            if not is_suitable():
+                self._waiting += 1
+                self._condition.notify_all()
+                try:
+                    self._condition.wait_for(is_suitable, timeout=timeout)
+                finally:
+                    self._waiting -= 1
+            return self._frame if is_suitable() else None
+
+    def _run(self):
+        """Captures frames until there are no requests for `idle_timeout` seconds."""
+        period = 1 / self.fps
+        last_capture_time = 0
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._waiting > 0,
+                                         timeout=max(last_capture_time + period - time.time(), 0))
+                if not self._waiting and time.time() - self._last_request_time > self.idle_timeout:
+                    self._thread = None
+                    return
+            last_capture_time = time.time()
+            try:
+                image = self.capture()
+            except Exception as err:
+                logging.debug(f"{self.__class__.__name__} failed to capture frame: {err}")
+                image = None
+            with self._condition:
+                if image is not None:
+                    self.frames_captured += 1
+                    self._frame = Frame(image=image, sequence=self.frames_captured, timestamp=last_capture_time)
+                self._condition.notify_all()
+            if image is None:
+                time.sleep(period)
@@ -0,0 +1,233 @@
+import os
+import time
+
+import cv2
+
+from lib.emulators.android_emulator import AndroidEmulator
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class RecordedAction:
+    """Class for storing input action that was sent to replay emulator."""
+
+    CLICK = "click"
+    DRAG = "drag"
+    KEY = "key"
+    CLOSE_APP = "close_app"
+
+    def __init__(self, name, frame_index, **params):
+        """Class initialization.
+
+        :param str name: name of action.
+        :param int frame_index: index of frame that was on screen when action was sent.
+        :param params: action's parameters (positions, keys, etc.).
+        """
+        self.time = time.time()
+        self.name = name
+        self.frame_index = frame_index
+        self.params = params
+
+    def __repr__(self):
+        return f"{self.name}@{self.frame_index}: {self.params}"
+
+
+class FramesSource:
+    """Class for reading frames from directory of images or from video file."""
+
+    def __init__(self, path):
+        """Class initialization.
+
+        :param str path: path to directory with images or to video file (for example, from `EmulatorCapture`).
+        """
+        self.path = path
+        self._files = None
+        self._video = None
+        self._video_position = 0
+        if os.path.isdir(path):
+            self._files = sorted(os.path.join(path, file_name) for file_name in os.listdir(path)
+                                 if file_name.lower().endswith(IMAGE_EXTENSIONS))
+            self.frames_count = len(self._files)
+        else:
+            self._video = cv2.VideoCapture(path)
+            if not self._video.isOpened():
+                raise ValueError(f"Can't open frames source {path}.")
+            self.frames_count = int(self._video.get(cv2.CAP_PROP_FRAME_COUNT))
+        if not self.frames_count:
+            raise ValueError(f"Frames source {path} is empty.")
+
+    def release(self):
+        """Releases video file."""
+        if self._video is not None:
+            self._video.release()
+
+    def read(self, index):
+        """Reads frame by index.
+
+        :param int index: index of frame.
+
+        :return: frame in RGB format (same as emulator's screen).
+        :rtype: numpy.ndarray
+        """
+        if self._files is not None:
+            image = cv2.imread(self._files[index])
+        else:
+            if index != self._video_position:
+                self._video.set(cv2.CAP_PROP_POS_FRAMES, index)
+            _, image = self._video.read()
+            self._video_position = index + 1
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+
+class ReplayEmulator(AndroidEmulator):
+    """Class for replaying recorded emulator's screen without actual emulator.
+    Serves frames from directory of images or from recorded video and records all input actions instead of sending them.
+
+    Frames are advanced by schedule:
+        - if `fps` is given then frames are changing by time (as in recorded video);
+        - if `script` is given then after N-th input action frame with index `script[N]` is shown;
+        - otherwise every input action advances to the next frame by `frames_per_action`.
+    """
+
+    def __init__(self, source, fps=None, script=None, frames_per_action=1, loop=False, name="Replay"):
+        """Class initialization.
+
+        :param str source: path to directory with images or to video file.
+        :param float fps: frames per second for time-based schedule.
+        :param list[int] script: frame indexes to show after each input action.
+        :param int frames_per_action: how many frames to advance after each input action.
+        :param bool loop: start from the first frame after reaching the end or stay on the last frame.
+        :param str name: name of the emulator.
+        """
+        self.source = FramesSource(source)
+        self.fps = fps
+        self.script = list(script) if script else None
+        self.frames_per_action = frames_per_action
+        self.loop = loop
+        self.actions = []
+        self._frame_index = 0
+        self._start_time = time.time()
+        super().__init__(name=name, child_name=name, key_handle_name=name)
+
+    def update_handlers(self):
+        """Updates screen's size by the first frame."""
+        self.update_window_rectangles()
+
+    def update_window_rectangles(self):
+        """Updates screen's rectangles by the size of the frames."""
+        if self.width is not None:
+            return
+        height, width, _ = self.source.read(0).shape
+        self.x, self.y, self.width, self.height = 0, 0, width, height
+        self.parent_x, self.parent_y, self.parent_width, self.parent_height = 0, 0, width, height
+        self.x1, self.y1, self.x2, self.y2 = 0, 0, width, height
+        self.template_store.set_resolution(width, height)
+
+    def get_version(self):
+        """Replay doesn't have version of emulator."""
+        return None
+
+    @property
+    def initialized(self):
+        """Replay is always initialized if frames source was opened."""
+        return self.width is not None
+
+    @property
+    def is_minimized(self):
+        """Replay doesn't have window to minimize."""
+        return False
+
+    def maximize(self):
+        """Replay doesn't have window to maximize."""
+        pass
+
+    @property
+    def frame_index(self):
+        """Index of frame that is currently on screen.
+
+        :rtype: int
+        """
+        if self.fps:
+            self._frame_index = int((time.time() - self._start_time) * self.fps)
+        if self._frame_index >= self.source.frames_count:
+            self._frame_index = self._frame_index % self.source.frames_count if self.loop \
+                else self.source.frames_count - 1
+        return self._frame_index
+
+    def seek(self, index):
+        """Sets frame that will be on screen.
+
+        :param int index: index of frame.
+        """
+        self._frame_index = index
+        self._start_time = time.time() - (index / self.fps if self.fps else 0)
+        self.invalidate_frame()
+
+    def advance(self, frames=1):
+        """Advances frames on screen.
+
+        :param int frames: how many frames to advance.
+        """
+        self.seek(self.frame_index + frames)
+
+    def _record_action(self, name, **params):
+        """Records input action and advances frames by schedule.
+
+        :param str name: name of action.
+        :param params: action's parameters.
+        """
+        self.actions.append(RecordedAction(name=name, frame_index=self.frame_index, **params))
+        if self.fps:
+            return self.invalidate_frame()
+        if self.script is not None:
+            if len(self.actions) <= len(self.script):
+                return self.seek(self.script[len(self.actions) - 1])
+            return self.invalidate_frame()
+        self.advance(self.frames_per_action)
+
+    def _capture_screen(self):
+        """Gets current frame from frames source.
+
+        :rtype: numpy.ndarray
+        """
+        return self.source.read(self.frame_index)
+
+    def click_button(self, ui_element, min_duration=0.1, max_duration=0.25):
+        """Records click inside button rectangle by it's UI element.
+
+        :param lib.game.ui.UIElement ui_element: UI element.
+        :param float min_duration: not used.
+        :param float max_duration: not used.
+        """
+        x, y = self.get_position_inside_screen_rectangle(ui_element.button_rect.global_rect)
+        self._record_action(RecordedAction.CLICK, ui_element=ui_element.name, position=(x, y))
+
+    def drag(self, from_ui, to_ui, duration=0.7, steps_count=100):
+        """Records dragging from one UI element to another.
+
+        :param lib.game.ui.UIElement from_ui: UI element of dragging position "From".
+        :param lib.game.ui.UIElement to_ui: UI element of dragging position "To".
+        :param float duration: duration of dragging.
+        :param int steps_count: not used.
+        """
+        from_position = self.get_position_inside_screen_rectangle(from_ui.button_rect.global_rect)
+        to_position = self.get_position_inside_screen_rectangle(to_ui.button_rect.global_rect)
+        self._record_action(RecordedAction.DRAG, from_position=from_position, to_position=to_position,
+                            duration=duration)
+
+    def press_key(self, key, system_key=False):
+        """Records key press.
+
+        :param str key: key name.
+        :param bool system_key: is emulator's system (main) key or not.
+        """
+        self._record_action(RecordedAction.KEY, key=key, system_key=system_key)
+
+    def close_current_app(self):
+        """Records closing of current app."""
+        self._record_action(RecordedAction.CLOSE_APP)
+
+    @property
+    def restartable(self):
+        """Replay can record app's restart."""
+        return True
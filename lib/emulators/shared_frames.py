@@ -0,0 +1,423 @@
+import logging
+import mmap
+import os
+import tempfile
+import time
+from threading import Thread
+
+import numpy
+
+try:
+    from multiprocess import Lock, Semaphore
+except ImportError:  # GUI requirements aren't installed: there are no task processes to share frames with
+    from threading import Lock, Semaphore
+
+from lib.emulators.frame_broker import FrameBroker
+
+SHARED_FRAMES_SLOTS = 4
+SHARED_FRAMES_POLL_SEC = 0.005  # How often consumer checks if requested frame was written
+SHARED_FRAMES_WAIT_TIMEOUT_SEC = 1
+SHARED_FRAMES_LOCK_TIMEOUT_SEC = 1  # Lock of the ring is considered lost (holder was terminated) after this time
+SHARED_FRAMES_PIN_TIMEOUT_SEC = 10  # Pins older than this are considered left by terminated processes
+# Global header: [latest sequence, time of the last request from consumers, is producer serving requests]
+_HEADER_SIZE = 3
+_LATEST_SEQUENCE, _REQUEST_TIME, _SERVED = range(_HEADER_SIZE)
+# Slot header: [sequence, capture timestamp, height, width, number of pins, time of the last pin]
+_SLOT_HEADER_SIZE = 6
+_SEQUENCE, _TIMESTAMP, _HEIGHT, _WIDTH, _PINS, _PIN_TIME = range(_SLOT_HEADER_SIZE)
+
+
+class _FramePin:
+    """Pin of the frame in shared ring: slot of the frame isn't overwritten while pin is alive."""
+
+    def __init__(self, ring, sequence):
+        """Class initialization.
+
+        :param SharedFrameRing ring: shared ring of frames.
+        :param int sequence: sequence number of pinned frame.
+        """
+        self.ring = ring
+        self.sequence = sequence
+
+    def __del__(self):
+        self.ring.unpin(self.sequence)
+
+
+class PinnedFrame(numpy.ndarray):
+    """View of the frame in shared memory that keeps frame's slot pinned.
+    Crops of the frame are views of it, so slot is unpinned when the frame and all its crops are released.
+    Copies and results of computations don't keep the pin. Frame is read-only: other processes read it too."""
+
+    _pin = None
+
+
+class SharedFrameRing:
+    """Class for sharing frames between processes through ring buffer in shared memory.
+    One producer writes frames and any process can read them by sequence number.
+    Frames are read as views pinned in shared memory (see `PinnedFrame`): producer writes new frames
+    only into slots that aren't pinned, so readers get frames without copying.
+    Ring is pickled by its name along with its lock and semaphore of requests,
+    so it can be passed to `multiprocess.Process` along with emulator.
+    """
+
+    def __init__(self, name, width, height, slots=SHARED_FRAMES_SLOTS, create=False, lock=None, requests=None):
+        """Class initialization.
+
+        :param str name: name of shared memory.
+        :param int width: max width of frames.
+        :param int height: max height of frames.
+        :param int slots: number of frames in the ring.
+        :param bool create: create shared memory or open existing one.
+        :param multiprocess.Lock lock: lock of slots' pins shared between processes.
+        :param multiprocess.Semaphore requests: semaphore that is released on each consumer's request.
+        """
+        self.name = name
+        self.width = width
+        self.height = height
+        self.slots = slots
+        self._owner = create
+        self._lock = lock if lock is not None else Lock()
+        self._requests = requests if requests is not None else Semaphore(0)
+        self._file = None
+        self._frame_size = width * height * 3
+        headers_size = (_HEADER_SIZE + _SLOT_HEADER_SIZE * slots) * numpy.dtype(numpy.float64).itemsize
+        size = headers_size + self._frame_size * slots
+        if os.name == "nt":
+            self._memory = mmap.mmap(-1, size, tagname=name)
+        else:
+            self._file = open(self._path, "w+b" if create else "r+b")
+            if create:
+                self._file.truncate(size)
+            self._memory = mmap.mmap(self._file.fileno(), size)
+        self._header = numpy.ndarray((_HEADER_SIZE,), dtype=numpy.float64, buffer=self._memory)
+        self._slot_headers = numpy.ndarray((slots, _SLOT_HEADER_SIZE), dtype=numpy.float64, buffer=self._memory,
+                                           offset=self._header.nbytes)
+        self._frames = numpy.ndarray((slots, self._frame_size), dtype=numpy.uint8, buffer=self._memory,
+                                     offset=headers_size)
+        if create:
+            self._header[:] = 0
+            self._slot_headers[:] = 0
+
+    @classmethod
+    def create(cls, width, height, slots=SHARED_FRAMES_SLOTS, name=None):
+        """Creates new shared memory for frames.
+
+        :param int width: max width of frames.
+        :param int height: max height of frames.
+        :param int slots: number of frames in the ring.
+        :param str name: name of shared memory.
+
+        :rtype: SharedFrameRing
+        """
+        name = name if name else f"mff_auto_frames_{os.getpid()}_{id(cls)}"
+        return cls(name=name, width=width, height=height, slots=slots, create=True)
+
+    @property
+    def _path(self):
+        """Path to file of shared memory on non-Windows platforms.
+
+        :rtype: str
+        """
+        folder = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+        return os.path.join(folder, self.name)
+
+    def __getstate__(self):
+        return {"name": self.name, "width": self.width, "height": self.height, "slots": self.slots,
+                "lock": self._lock, "requests": self._requests}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def close(self):
+        """Closes shared memory. Removes it if current process has created it."""
+        self._header, self._slot_headers, self._frames = None, None, None
+        self._memory.close()
+        if self._file:
+            self._file.close()
+            if self._owner and os.path.exists(self._path):
+                os.remove(self._path)
+
+    @property
+    def latest_sequence(self):
+        """Sequence number of the last written frame.
+
+        :rtype: int
+        """
+        return int(self._header[_LATEST_SEQUENCE])
+
+    @property
+    def request_time(self):
+        """Time of the last request for new frame from consumers.
+
+        :rtype: float
+        """
+        return float(self._header[_REQUEST_TIME])
+
+    @property
+    def is_served(self):
+        """Is producer running and able to write frames into the ring or not.
+
+        :rtype: bool
+        """
+        return bool(self._header[_SERVED])
+
+    def set_served(self, served):
+        """Reports that producer is running and able to write frames into the ring or not.
+        Consumer reports that ring isn't served when producer didn't answer its request in time.
+
+        :param bool served: is producer able to write frames or not.
+        """
+        self._header[_SERVED] = served
+
+    def fits(self, image):
+        """Checks if frame fits into the slot of the ring.
+
+        :param numpy.ndarray image: frame.
+
+        :rtype: bool
+        """
+        height, width = image.shape[:2]
+        return height * width * 3 <= self._frame_size
+
+    def request(self, captured_after):
+        """Requests producer to write frame which was captured after given time.
+
+        :param float captured_after: time after which capturing of the frame should be started.
+        """
+        if captured_after > self._header[_REQUEST_TIME]:
+            self._header[_REQUEST_TIME] = captured_after
+        self._requests.release()
+
+    def wait_request(self, timeout=None):
+        """Waits for consumer's request. Requests that came while producer was busy are merged into one.
+
+        :param float timeout: how many seconds wait for the request; wait forever if not given.
+
+        :return: was request received or not.
+        :rtype: bool
+        """
+        if not self._requests.acquire(timeout=timeout):
+            return False
+        while self._requests.acquire(False):
+            pass
+        return True
+
+    def _get_slot(self, sequence):
+        """Gets slot of the frame.
+
+        :param int sequence: sequence number of the frame.
+
+        :return: index of the slot or None if frame isn't in the ring.
+        :rtype: int | None
+        """
+        slots = numpy.flatnonzero(self._slot_headers[:, _SEQUENCE] == sequence)
+        return int(slots[0]) if sequence and len(slots) else None
+
+    def _get_free_slot(self):
+        """Gets slot for the next frame: the oldest slot that isn't pinned.
+
+        :return: index of the slot or None if all slots are pinned.
+        :rtype: int | None
+        """
+        now = time.time()
+        free = [slot for slot in range(self.slots) if not self._slot_headers[slot, _PINS] or
+                now - self._slot_headers[slot, _PIN_TIME] > SHARED_FRAMES_PIN_TIMEOUT_SEC]
+        return min(free, key=lambda slot: self._slot_headers[slot, _SEQUENCE]) if free else None
+
+    def write(self, image, timestamp):
+        """Writes frame into the oldest slot of the ring that isn't pinned.
+
+        :param numpy.ndarray image: frame to write.
+        :param float timestamp: time when capturing of the frame was started.
+
+        :return: sequence number of written frame or None if frame doesn't fit into the ring
+            or all slots are pinned.
+        :rtype: int
+        """
+        height, width = image.shape[:2]
+        if not self.fits(image):
+            logging.debug(f"Frame {width}x{height} is larger than shared memory {self.width}x{self.height}.")
+            return None
+        if not self._lock.acquire(timeout=SHARED_FRAMES_LOCK_TIMEOUT_SEC):
+            return None
+        try:
+            slot = self._get_free_slot()
+            if slot is None:
+                logging.debug(f"All {self.slots} slots of shared memory are pinned.")
+                return None
+            self._slot_headers[slot] = 0  # Mark slot as being written, so it can't be pinned
+        finally:
+            self._lock.release()
+        self._frames[slot, :height * width * 3].reshape((height, width, 3))[:] = image
+        sequence = self.latest_sequence + 1
+        slot_header = self._slot_headers[slot]
+        slot_header[_TIMESTAMP], slot_header[_HEIGHT], slot_header[_WIDTH] = timestamp, height, width
+        slot_header[_SEQUENCE] = sequence
+        self._header[_LATEST_SEQUENCE] = sequence
+        return sequence
+
+    def read(self, sequence=None, copy=False):
+        """Reads frame from the ring.
+        Frame without copying is a view into shared memory (see `PinnedFrame`): its slot isn't overwritten
+        while the view or its crops are alive.
+
+        :param int sequence: sequence number of the frame; latest frame if not given.
+        :param bool copy: copy frame from shared memory or return pinned view.
+
+        :return: sequence number, capture timestamp and the frame or None if frame isn't in the ring anymore.
+        :rtype: tuple[int, float, numpy.ndarray] | None
+        """
+        sequence = self.latest_sequence if sequence is None else sequence
+        if not self.pin(sequence):
+            return None
+        slot = self._get_slot(sequence)
+        slot_header = self._slot_headers[slot]
+        timestamp, height, width = float(slot_header[_TIMESTAMP]), int(slot_header[_HEIGHT]), int(slot_header[_WIDTH])
+        image = self._frames[slot, :height * width * 3].reshape((height, width, 3)).view(PinnedFrame)
+        image._pin = _FramePin(ring=self, sequence=sequence)
+        image.flags.writeable = False  # Frame is shared with other processes
+        return sequence, timestamp, image.copy().view(numpy.ndarray) if copy else image
+
+    def pin(self, sequence):
+        """Pins frame in the ring, so producer doesn't overwrite it until `unpin` is called.
+
+        :param int sequence: sequence number of the frame.
+
+        :return: was frame pinned or not (it isn't in the ring anymore).
+        :rtype: bool
+        """
+        if not self._lock.acquire(timeout=SHARED_FRAMES_LOCK_TIMEOUT_SEC):
+            return False
+        try:
+            slot = self._get_slot(sequence)
+            if slot is None:
+                return False
+            self._slot_headers[slot, _PINS] += 1
+            self._slot_headers[slot, _PIN_TIME] = time.time()
+            return True
+        finally:
+            self._lock.release()
+
+    def unpin(self, sequence):
+        """Unpins frame in the ring.
+
+        :param int sequence: sequence number of the frame.
+        """
+        if self._slot_headers is None or not self._lock.acquire(timeout=SHARED_FRAMES_LOCK_TIMEOUT_SEC):
+            return
+        try:
+            slot = self._get_slot(sequence)
+            if slot is not None and self._slot_headers[slot, _PINS] > 0:
+                self._slot_headers[slot, _PINS] -= 1
+        finally:
+            self._lock.release()
+
+    def is_valid(self, sequence):
+        """Checks if frame with given sequence number wasn't overwritten.
+
+        :param int sequence: sequence number of the frame.
+
+        :rtype: bool
+        """
+        return self._get_slot(sequence) is not None
+
+
+class SharedFrameProducer:
+    """Class for writing frames from frame broker into shared ring when consumers request them.
+    Producer's thread sleeps until consumer's request and waits for requested frame on frame broker,
+    so producer doesn't do anything while there are no consumers."""
+
+    def __init__(self, ring, frame_broker):
+        """Class initialization.
+
+        :param SharedFrameRing ring: shared ring of frames.
+        :param lib.emulators.frame_broker.FrameBroker frame_broker: frame broker of the producer's process.
+        """
+        self.ring = ring
+        self.frame_broker = frame_broker
+        self._stopped = False
+        self._thread = Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+
+    def start(self):
+        """Starts producing frames."""
+        self.ring.set_served(True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops producing frames and waits until producer's thread is finished,
+        so ring can be closed right after it."""
+        self._stopped = True
+        self.ring.request(captured_after=0)  # Wake up producer's thread
+        if self._thread.is_alive():
+            self._thread.join()
+        self.ring.set_served(False)
+
+    def _run(self):
+        """Writes frames into shared ring on consumers' requests.
+        Frame that was written after the request is already in the ring, so request is answered only once.
+        If frame can't be written (it doesn't fit into the ring after emulator was resized or all slots are pinned),
+        ring is marked as not served and consumers capture frames themselves until frame is written again."""
+        last_timestamp = 0
+        while self.ring.wait_request() and not self._stopped:
+            request_time = self.ring.request_time
+            if request_time < last_timestamp:
+                continue
+            frame = self.frame_broker.get_frame(captured_after=request_time)
+            if frame is None or self._stopped:
+                continue
+            last_timestamp = frame.timestamp
+            self.ring.set_served(self.ring.write(image=frame.image, timestamp=frame.timestamp) is not None)
+
+
+class LocalFrameProducer(SharedFrameProducer):
+    """Producer that captures frames with given function instead of emulator's frame broker.
+    Stand-in for tests and benchmarks without emulator."""
+
+    def __init__(self, ring, capture):
+        """Class initialization.
+
+        :param SharedFrameRing ring: shared ring of frames.
+        :param function capture: function that captures image.
+        """
+        super().__init__(ring=ring, frame_broker=FrameBroker(capture=capture))
+
+
+class SharedFrameReader:
+    """Class for reading frames from shared ring instead of capturing them.
+    Used as capturing function of frame broker inside consumer's process.
+
+    Frame isn't copied out of shared memory: it's a pinned view (see `PinnedFrame`), so it stays the same
+    while emulator keeps it as the last frame.
+    If producer isn't running or can't write frames, frame is captured by fallback right away."""
+
+    def __init__(self, ring, fallback=None, timeout=SHARED_FRAMES_WAIT_TIMEOUT_SEC, poll=SHARED_FRAMES_POLL_SEC):
+        """Class initialization.
+
+        :param SharedFrameRing ring: shared ring of frames.
+        :param function fallback: function that captures image if producer didn't write frame in time.
+        :param float timeout: how many seconds wait for the frame from producer.
+        :param float poll: how often to check for new frames.
+        """
+        self.ring = ring
+        self.fallback = fallback
+        self.timeout = timeout
+        self.poll = poll
+
+    def __call__(self):
+        """Requests frame that was captured after current time and waits for it.
+
+        :rtype: numpy.ndarray
+        """
+        requested_at = time.time()
+        # Request is sent even if ring isn't served: it lets producer find out that it can write frames again
+        self.ring.request(captured_after=requested_at)
+        while self.ring.is_served:
+            frame = self.ring.read()
+            if frame is not None and frame[1] >= requested_at:
+                return frame[2]
+            if time.time() - requested_at > self.timeout:
+                logging.debug(f"{self.__class__.__name__}: producer didn't write frame in time, capturing it.")
+                self.ring.set_served(False)
+                break
+            time.sleep(self.poll)
+        return self.fallback() if self.fallback else None
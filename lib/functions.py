@@ -1,43 +1,259 @@
 import logging
+import os
 import random
 import time
+from threading import Lock
 
 import cv2
-import win32api
-from numpy import concatenate, array
+from numpy import concatenate, array, asarray, int32, sqrt, zeros, uint8
 
-from lib.structural_similarity.ssim import compare_ssim
+from lib.debug_images import DebugImageWriter
+from lib.glyph_recognizer import GlyphRecognizer
+from lib.ocr_cache import OCRCache
+from lib.ssim import StructuralSimilarity
 from lib.tesseract3 import TesseractPool, AUTOMATIC_PAGE_SEGMENTATION, RAW_LINE_PAGE_SEGMENTATION
+from lib.tesseract4 import Tesseract4Pool, OEM_LEGACY, OEM_LSTM
+
+try:
+    import win32api
+except ImportError:  # Not a Windows platform
+    win32api = None
 
 logger = logging.getLogger()
 
 # Use default eng data for any letters
-tesseract_eng = TesseractPool(language="eng", processes=1)
+TESSERACT_ENG_LANGUAGE = "eng"
 # Use 'mff.traineddata' language for numbers
-tesseract_mff = TesseractPool(language="mff+eng", processes=1)
+TESSERACT_MFF_LANGUAGE = "mff+eng"
+LOCATE_COARSE_SCALE = 0.5  # Scale of coarse image search, best coarse location is refined at full size
+LOCATE_MIN_COARSE_SIZE = 16  # Min side of scaled template for coarse image search
+GLYPH_CONFIRMATION_THRESHOLD_SHIFT = 20  # Shift of threshold of independent read that confirms text for glyphs
+# Available OCR backends: name -> (backend class, backend's parameters)
+OCR_BACKENDS = {
+    TesseractPool.name: (TesseractPool, {}),
+    Tesseract4Pool.name: (Tesseract4Pool, {}),
+    "tesseract4_lstm": (Tesseract4Pool, {"engine_mode": OEM_LSTM}),
+    "tesseract4_legacy": (Tesseract4Pool, {"engine_mode": OEM_LEGACY}),
+}
+# Backend for UI elements without `ocr_backend`: bundled Tesseract 3 on Windows, system library otherwise
+DEFAULT_OCR_BACKEND = TesseractPool.name if os.name == "nt" else Tesseract4Pool.name
+_ocr_backends = {}
+_ocr_backends_lock = Lock()
+_glyph_recognizers = {}
+_glyph_recognizers_lock = Lock()
+# Memoized OCR results by content of thresholded image
+ocr_cache = OCRCache()
+# Writer of debug images of recognitions, set `debug_images.enabled = False` to turn them off
+debug_images = DebugImageWriter()
+# Structural similarity with cached statistics of UI elements' images
+structural_similarity = StructuralSimilarity()
+
+
+def get_ocr_backend(language, backend=None):
+    """Gets OCR backend for given language. Backend is created on first use,
+    so modules can be imported on machines without OCR library.
+
+    :param str language: OCR language.
+    :param str backend: name of OCR backend from `OCR_BACKENDS`; `DEFAULT_OCR_BACKEND` if not given.
+
+    :rtype: lib.ocr_backend.OCRBackend
+    """
+    backend = backend if backend else DEFAULT_OCR_BACKEND
+    with _ocr_backends_lock:
+        if (backend, language) not in _ocr_backends:
+            backend_class, params = OCR_BACKENDS[backend]
+            _ocr_backends[backend, language] = backend_class(language=language, **params)
+        return _ocr_backends[backend, language]
+
+
+def get_glyph_recognizer(font):
+    """Gets glyph recognizer for given font. Recognizer is created on first use.
+
+    :param str font: name of the font.
+
+    :rtype: lib.glyph_recognizer.GlyphRecognizer
+    """
+    with _glyph_recognizers_lock:
+        if font not in _glyph_recognizers:
+            _glyph_recognizers[font] = GlyphRecognizer(font=font)
+        return _glyph_recognizers[font]
+
+
+def get_ocr_parameters(chars=None):
+    """Gets OCR parameters for available characters.
+
+    :param str chars: available character in image's text.
+
+    :return: page segmentation mode and language.
+    :rtype: tuple[int, str]
+    """
+    psm = RAW_LINE_PAGE_SEGMENTATION if chars else AUTOMATIC_PAGE_SEGMENTATION
+    language = TESSERACT_MFF_LANGUAGE if chars and any(char.isdigit() for char in chars) else TESSERACT_ENG_LANGUAGE
+    return psm, language
 
 
-def get_text_from_image(image, threshold, chars=None, save_file=None, max_height=None):
+def get_text_from_image(image, threshold, chars=None, save_file=None, max_height=None, use_cache=True,
+                        glyph_font=None, ocr_backend=None, alternatives=False):
     """Get text from image using Tesseract OCR.
     https://github.com/tesseract-ocr/
+    Result is memoized by content of thresholded image, so the same pixels aren't recognized twice.
+    If glyph font is given then text is recognized by glyph templates first and Tesseract is used as fallback.
+    Text is returned as `OCRResult`: it's a string with confidence of recognition (and alternatives of characters
+    if they were requested), so callers can accept confident results at once and re-check others.
 
     :param numpy.ndarray image: image.
     :param int threshold: threshold of gray-scale for grabbing image's text.
     :param str chars: available character in image's text.
-    :param str save_file: name of file for saving result of gray-scaling.
+    :param str save_file: name of file for saving result of gray-scaling (see `debug_images`).
     :param int max_height: max height of image (in pixels).
+    :param bool use_cache: use memoized result of recognition of the same image or not.
+    :param str glyph_font: name of the font for glyph recognizer.
+    :param str ocr_backend: name of OCR backend from `OCR_BACKENDS`; `DEFAULT_OCR_BACKEND` if not given.
+    :param bool alternatives: get alternatives of each recognized character or not.
 
     :return: text from image.
-    :rtype: str
+    :rtype: lib.ocr_backend.OCRResult
     """
     image = resize_and_keep_aspect_ratio(image, height=max_height)
     gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     ret, threshold_img = cv2.threshold(gray, threshold, 255, cv2.THRESH_BINARY)
+    psm, language = get_ocr_parameters(chars)
+    key = ocr_cache.get_key(threshold_img, whitelist=chars, page_segmentation=psm, language=language,
+                            backend=ocr_backend) if use_cache else None
+    text = ocr_cache.get(key) if use_cache else None
+    if text is not None and (not alternatives or getattr(text, "alternatives", None) is not None):
+        if save_file:
+            debug_images.save(save_file, threshold_img, mismatch=not text)
+        return text
+    glyph_recognizer = get_glyph_recognizer(glyph_font) if glyph_font and not alternatives else None
+    text = glyph_recognizer.recognize(threshold_img, chars=chars) if glyph_recognizer is not None else None
+    if text is None:
+        backend = get_ocr_backend(language, backend=ocr_backend)
+        text = backend.image_to_result(threshold_img, whitelist=chars, page_segmentation=psm,
+                                       alternatives=alternatives)
+        if glyph_recognizer is not None and text:
+
+            def confirm():
+                confirm_threshold = min(threshold + GLYPH_CONFIRMATION_THRESHOLD_SHIFT, 254)
+                ret, confirm_img = cv2.threshold(gray, confirm_threshold, 255, cv2.THRESH_BINARY)
+                return backend.image_to_result(confirm_img, whitelist=chars, page_segmentation=psm)
+
+            glyph_recognizer.learn(threshold_img, text, confirm=confirm)
+    if use_cache:
+        ocr_cache.set(key, text)
     if save_file:
-        cv2.imwrite(f"logs/tesseract/{save_file}.png", threshold_img)
-    psm = RAW_LINE_PAGE_SEGMENTATION if chars else AUTOMATIC_PAGE_SEGMENTATION
-    tesseract = tesseract_mff if chars and any(char.isdigit() for char in chars) else tesseract_eng
-    return tesseract.image_to_string(threshold_img, whitelist=chars, page_segmentation=psm)
+        debug_images.save(save_file, threshold_img, mismatch=not text)
+    return text
+
+
+def get_texts_from_image_regions(image, boxes, threshold, chars=None, save_files=None, max_height=None,
+                                 use_cache=True, ocr_backend=None):
+    """Get texts from multiple regions of the same image using Tesseract OCR.
+    Regions are prepared as in `get_text_from_image` (resized and thresholded), stacked into single image
+    and uploaded to OCR backend once, then regions are recognized one by one on the uploaded image.
+    Results are memoized by content of thresholded region as in `get_text_from_image`.
+
+    :param numpy.ndarray image: image.
+    :param list[tuple[int, int, int, int]] boxes: list of (x1, y1, x2, y2) regions of the image (in pixels).
+    :param int threshold: threshold of gray-scale for grabbing image's text.
+    :param str chars: available character in image's text.
+    :param list[str] save_files: names of files for saving result of gray-scaling of each region.
+    :param int max_height: max height of each region (in pixels).
+    :param bool use_cache: use memoized result of recognition of the same image or not.
+    :param str ocr_backend: name of OCR backend from `OCR_BACKENDS`; `DEFAULT_OCR_BACKEND` if not given.
+
+    :return: list of texts in order of regions.
+    :rtype: list[str]
+    """
+    psm, language = get_ocr_parameters(chars)
+    texts, keys, regions = [""] * len(boxes), [None] * len(boxes), [None] * len(boxes)
+    for index, (x1, y1, x2, y2) in enumerate(boxes):
+        region = image[max(y1, 0):max(y2, 0), max(x1, 0):max(x2, 0)]
+        if not region.size:
+            continue
+        region = resize_and_keep_aspect_ratio(region, height=max_height)
+        ret, regions[index] = cv2.threshold(cv2.cvtColor(region, cv2.COLOR_BGR2GRAY), threshold, 255,
+                                            cv2.THRESH_BINARY)
+        if use_cache:
+            keys[index] = ocr_cache.get_key(regions[index], whitelist=chars, page_segmentation=psm,
+                                            language=language, backend=ocr_backend)
+        texts[index] = ocr_cache.get(keys[index]) if use_cache else None
+    missing = [index for index, text in enumerate(texts) if text is None]
+    if missing:
+        # Regions are stacked one under another, so each of them is a rectangle of single uploaded image
+        stacked = zeros((sum(regions[index].shape[0] for index in missing),
+                         max(regions[index].shape[1] for index in missing)), dtype=uint8)
+        rects, top = [], 0
+        for index in missing:
+            height, width = regions[index].shape
+            stacked[top:top + height, :width] = regions[index]
+            rects.append((0, top, width, height))
+            top += height
+        backend = get_ocr_backend(language, backend=ocr_backend)
+        recognized = backend.image_regions_to_strings(stacked, rects, whitelist=chars, page_segmentation=psm)
+        for index, text in zip(missing, recognized):
+            texts[index] = text
+            if use_cache:
+                ocr_cache.set(keys[index], text)
+    for save_file, region, text in zip(save_files or (), regions, texts):
+        if save_file and region is not None:
+            debug_images.save(save_file, region, mismatch=not text)
+    return texts
+
+
+def levenshtein_distance(a, b, max_distance=None):
+    """Returns the Levenshtein edit distance between two strings.
+    If max distance is given then only diagonal band of max distance's width is computed
+    and computation stops as soon as distance exceeds max distance.
+
+    :param str a: first string.
+    :param str b: second string.
+    :param int max_distance: max distance of interest.
+
+    :return: edit distance or `max_distance + 1` if distance is greater than max distance.
+    :rtype: int
+    """
+    if a == b:
+        return 0
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is None:
+        max_distance = len(a)
+    limit = max_distance + 1
+    if len(a) - len(b) > max_distance:
+        return limit
+    prev_row = list(range(len(b) + 1))
+    for i, column1 in enumerate(a, start=1):
+        start, end = max(1, i - max_distance), min(len(b), i + max_distance)
+        cur_row = [limit] * (len(b) + 1)
+        cur_row[0] = min(i, limit)
+        for j in range(start, end + 1):
+            substitutions = prev_row[j - 1] + (column1 != b[j - 1])
+            insertions = prev_row[j] + 1
+            deletions = cur_row[j - 1] + 1
+            cur_row[j] = min(insertions, deletions, substitutions, limit)
+        if min(cur_row[start - 1:end + 1]) >= limit:
+            return limit
+        prev_row = cur_row
+    return prev_row[-1]
+
+
+def _get_non_similarity(original, compare, overlap):
+    """Gets non similarity of normalized strings if strings are similar.
+
+    :param str original: normalized original string.
+    :param str compare: normalized string to compare.
+    :param float overlap: overlap parameter.
+
+    :return: non similarity or None if strings aren't similar.
+    :rtype: float | None
+    """
+    if not original:
+        return 1 if 1 <= overlap else None
+    # Distance is bounded with reserve of 1 so float rounding of the final check is the same as for full distance
+    max_distance = max(int(overlap * len(original)) + 1, 0)
+    non_similarity = levenshtein_distance(original, compare, max_distance=max_distance) / len(original)
+    return non_similarity if non_similarity <= overlap else None
 
 
 def is_strings_similar(original, compare, overlap=0.25):
@@ -49,27 +265,27 @@ def is_strings_similar(original, compare, overlap=0.25):
 
     :rtype: bool
     """
+    return _get_non_similarity(original.upper(), compare.upper(), overlap) is not None
 
-    def levenshtein_distance(a, b):
-        """Returns the Levenshtein edit distance between two strings."""
-        if a == b:
-            return 0
-        if len(a) < len(b):
-            a, b = b, a
-        prev_row = range(len(b) + 1)
-        for i, column1 in enumerate(a):
-            cur_row = [i + 1]
-            for j, column2 in enumerate(b):
-                insertions = prev_row[j + 1] + 1
-                deletions = cur_row[j] + 1
-                substitutions = prev_row[j] + (column1 != column2)
-                cur_row.append(min(insertions, deletions, substitutions))
-            prev_row = cur_row
-        return prev_row[-1]
-
-    distance = levenshtein_distance(original.upper(), compare.upper())
-    non_similarity = distance / len(original) if len(original) > 0 else 1
-    return non_similarity <= overlap
+
+def find_similar_strings(originals, compare, overlap=0.25):
+    """Finds original strings that are similar to the string in single call.
+    Same as checking every original by `is_strings_similar(original, compare, overlap)`.
+
+    :param list[str] originals: original strings.
+    :param str compare: string to compare (usually recognized text).
+    :param float overlap: overlap parameter. If string's similarity >= overlap then strings are similar.
+
+    :return: list of (original string, non similarity) in order of originals.
+    :rtype: list[tuple[str, float]]
+    """
+    compare = compare.upper()
+    similar_strings = []
+    for original in originals:
+        non_similarity = _get_non_similarity(original.upper(), compare, overlap)
+        if non_similarity is not None:
+            similar_strings.append((original, non_similarity))
+    return similar_strings
 
 
 def wait_until(predicate, timeout=3, period=0.25, condition=True, *args, **kwargs):
@@ -126,29 +342,58 @@ def bgr_to_rgb(image_array):
 
 def is_images_similar(image1, image2, overlap=0.6, save_file=None):
     """Checks if images are similar.
-    Uses structural similarity.
+    Uses structural similarity, statistics of the second image (UI element's image) are cached.
 
-    :param numpy.ndarray image1: original image.
-    :param numpy.ndarray image2: image to check.
+    :param numpy.ndarray image1: image to check.
+    :param numpy.ndarray image2: original image (template), RGB or gray-scale.
     :param float overlap: overlap parameter. If images similarity > overlap then images are similar.
-    :param str save_file: name of file for saving result of checking.
+    :param str save_file: name of file for saving result of checking (see `debug_images`).
 
     :rtype: bool
     """
-    max_x = image1.shape[0] if image1.shape[0] > image2.shape[0] else image2.shape[0]
-    max_y = image1.shape[1] if image1.shape[1] > image2.shape[1] else image2.shape[1]
-    image1 = colored1 = cv2.resize(image1, (max_y, max_x), interpolation=cv2.INTER_CUBIC)
-    image2 = colored2 = cv2.resize(image2, (max_y, max_x), interpolation=cv2.INTER_CUBIC)
-    image1 = cv2.cvtColor(image1, cv2.COLOR_BGR2GRAY)
-    image2 = cv2.cvtColor(image2, cv2.COLOR_BGR2GRAY)
-    sim, diff = compare_ssim(image1, image2, full=True)
+    sim, gray1, gray2 = structural_similarity.compare(image1, image2)
     if save_file:
-        gray_images = cv2.cvtColor(cv2.hconcat([image1, image2]), cv2.COLOR_GRAY2BGR)
-        original_images = cv2.hconcat([colored1, colored2])
-        cv2.imwrite(f"logs/tesseract/{save_file}.png", concatenate((gray_images, original_images), axis=0))
+
+        def create_debug_image():
+            height, width = gray1.shape
+            colored1, colored2 = (cv2.resize(image if image.ndim == 3 else cv2.cvtColor(image, cv2.COLOR_GRAY2BGR),
+                                             (width, height), interpolation=cv2.INTER_CUBIC)
+                                  for image in (image1, image2))
+            gray_images = cv2.cvtColor(cv2.hconcat([gray1, gray2]), cv2.COLOR_GRAY2BGR)
+            original_images = cv2.hconcat([colored1, colored2])
+            return concatenate((gray_images, original_images), axis=0)
+
+        debug_images.save(save_file, create_debug_image, mismatch=sim <= overlap)
     return sim > overlap
 
 
+def locate_image(image, template):
+    """Locates template anywhere inside image by normalized cross-correlation.
+    Big templates are located at reduced scale first, then the best location is refined at full size around it.
+
+    :param numpy.ndarray image: gray-scale image.
+    :param numpy.ndarray template: gray-scale template, can't be bigger than image.
+
+    :return: left top corner of the best location and its score (from -1 to 1).
+    :rtype: tuple[tuple[int, int], float]
+    """
+    left, top = 0, 0
+    template_height, template_width = template.shape
+    if min(template.shape) * LOCATE_COARSE_SCALE >= LOCATE_MIN_COARSE_SIZE:
+        coarse_image = cv2.resize(image, None, fx=LOCATE_COARSE_SCALE, fy=LOCATE_COARSE_SCALE,
+                                  interpolation=cv2.INTER_AREA)
+        coarse_template = cv2.resize(template, None, fx=LOCATE_COARSE_SCALE, fy=LOCATE_COARSE_SCALE,
+                                     interpolation=cv2.INTER_AREA)
+        if coarse_image.shape[0] >= coarse_template.shape[0] and coarse_image.shape[1] >= coarse_template.shape[1]:
+            _, _, _, (x, y) = cv2.minMaxLoc(cv2.matchTemplate(coarse_image, coarse_template, cv2.TM_CCOEFF_NORMED))
+            margin = round(1 / LOCATE_COARSE_SCALE) + 1
+            left = min(max(round(x / LOCATE_COARSE_SCALE) - margin, 0), image.shape[1] - template_width)
+            top = min(max(round(y / LOCATE_COARSE_SCALE) - margin, 0), image.shape[0] - template_height)
+            image = image[top:top + template_height + 2 * margin, left:left + template_width + 2 * margin]
+    _, score, _, (x, y) = cv2.minMaxLoc(cv2.matchTemplate(image, template, cv2.TM_CCOEFF_NORMED))
+    return (left + x, top + y), score
+
+
 def is_color_similar(color1, color2, overlap=0.05):
     """Checks if colors are similar.
 
@@ -164,6 +409,19 @@ def is_color_similar(color1, color2, overlap=0.05):
     return d / 510 <= overlap
 
 
+def is_any_color_similar(color, colors, overlap=0.05):
+    """Checks if any of colors is similar to original color. Vectorized version of `is_color_similar`.
+
+    :param tuple[int, int, int] color: original color.
+    :param numpy.ndarray colors: array of colors to check.
+    :param float overlap: overlap parameter. If colors similarity > overlap then colors are similar.
+
+    :rtype: bool
+    """
+    d = sqrt(((asarray(colors, dtype=int32).reshape((-1, 3)) - color) ** 2).sum(axis=1))
+    return bool((d / 510 <= overlap).any())
+
+
 def resize_and_keep_aspect_ratio(image, width=None, height=None):
     """Resizes image by width or height and keep original ratio between them.
 
@@ -233,6 +491,7 @@ def convert_colors_in_image(image, colors, color_to_convert=(255, 255, 255), blu
     :return: image with converted colors.
     :rtype: numpy.ndarray
     """
+    image = image.copy()  # Image can be a view of emulator's frame
     for color_low, color_high in colors:
         if isinstance(color_low, (set, list)):
             color_low = array(color_low)
@@ -0,0 +1,84 @@
+from collections import Counter, defaultdict
+
+from lib.functions import levenshtein_distance
+
+FUZZY_INDEX_NGRAM_SIZE = 3
+# Typographic characters that OCR reads as plain ones
+_NORMALIZED_CHARS = str.maketrans({"’": "'", "‘": "'", "“": '"', "”": '"', "–": "-", "—": "-"})
+
+
+class FuzzyIndex:
+    """Class for fuzzy lookup of strings (recognized by OCR) in dictionary.
+    Candidates are generated by inverted index of character n-grams and filtered by q-gram lemma:
+    strings within edit distance `k` share at least `max(len) - n + 1 - k * n` n-grams, so no match is missed.
+    Only candidates are verified by bounded edit distance."""
+
+    def __init__(self, items, ngram_size=FUZZY_INDEX_NGRAM_SIZE):
+        """Class initialization.
+
+        :param dict[str, object] items: dictionary of strings to look up and their values.
+        :param int ngram_size: size of n-grams.
+        """
+        self.ngram_size = ngram_size
+        self._keys = list(items)
+        self._values = [items[key] for key in self._keys]
+        self._normalized = [self.normalize(key) for key in self._keys]
+        self._index = defaultdict(list)
+        for key_index, normalized in enumerate(self._normalized):
+            for ngram, count in Counter(self._get_ngrams(normalized)).items():
+                self._index[ngram].append((key_index, count))
+
+    def __len__(self):
+        return len(self._keys)
+
+    @staticmethod
+    def normalize(text):
+        """Normalizes text for comparison: uppercase, plain quotes and dashes, no surrounding spaces.
+
+        :param str text: text.
+
+        :rtype: str
+        """
+        return text.translate(_NORMALIZED_CHARS).upper().strip()
+
+    def _get_ngrams(self, text):
+        """Gets character n-grams of text.
+
+        :param str text: normalized text.
+
+        :rtype: list[str]
+        """
+        return [text[i:i + self.ngram_size] for i in range(len(text) - self.ngram_size + 1)]
+
+    def find(self, query, overlap=0.25):
+        """Finds similar strings in the index. Similarity is the same as in `lib.functions.is_strings_similar`:
+        edit distance divided by query's length should be less or equal to overlap.
+
+        :param str query: string to look up.
+        :param float overlap: overlap parameter.
+
+        :return: list of (string, value, distance) sorted by distance.
+        :rtype: list[tuple[str, object, int]]
+        """
+        query = self.normalize(query)
+        if not query:
+            return []
+        max_distance = int(overlap * len(query))
+        common_ngrams = defaultdict(int)
+        for ngram, count in Counter(self._get_ngrams(query)).items():
+            for key_index, key_count in self._index.get(ngram, ()):
+                common_ngrams[key_index] += min(count, key_count)
+        candidates = []
+        for key_index, normalized in enumerate(self._normalized):
+            if abs(len(normalized) - len(query)) > max_distance:
+                continue
+            min_common_ngrams = max(len(normalized), len(query)) - self.ngram_size + 1 - max_distance * self.ngram_size
+            if common_ngrams.get(key_index, 0) >= min_common_ngrams:
+                candidates.append(key_index)
+        candidates.sort(key=lambda index: -common_ngrams.get(index, 0))
+        results = []
+        for key_index in candidates:
+            distance = levenshtein_distance(query, self._normalized[key_index], max_distance=max_distance)
+            if distance <= max_distance:
+                results.append((self._keys[key_index], self._values[key_index], distance))
+        return sorted(results, key=lambda result: result[2])
@@ -7,6 +7,8 @@ from lib.game import ui
 
 logger = logging.get_logger(__name__)
 t3_percentage_regexp = re.compile(r"([0-9][0-9]?\.?[0-9]? ?%?)")
+SKILL_COOL_DOWN_MIN_CONFIDENCE = 60  # Skill's cooldown read with lower confidence is read again from new frame
+SKILL_COOL_DOWN_MAX_RESAMPLES = 2  # Max number of additional reads of skill's cooldown with low confidence
 
 
 class BattleBot:
@@ -183,16 +185,37 @@ class LockedSkill:
         """Checks if skill is not locked and has `skill ready image` (means that it's ready to cast)."""
         return not self.locked and self._skill_ready_image is not None
 
+    def get_cool_down(self):
+        """Gets text of skill's cooldown from the screen.
+        Text read with low confidence is read again from new frames and the most confident read is returned,
+        so single misread of cooldown doesn't count as its repetition.
+
+        :return: text of skill's cooldown.
+        :rtype: str
+        """
+        cool_down = self.emulator.get_screen_text(self.skill_ui)
+        for _ in range(SKILL_COOL_DOWN_MAX_RESAMPLES):
+            confidence = getattr(cool_down, 'confidence', None)
+            if not cool_down or confidence is None or confidence >= SKILL_COOL_DOWN_MIN_CONFIDENCE:
+                break
+            logger.debug(f"Reading {self.name} skill cooldown again: '{cool_down}' has confidence {confidence}.")
+            self.emulator.invalidate_frame()
+            cool_down = max(cool_down, self.emulator.get_screen_text(self.skill_ui),
+                            key=lambda text: getattr(text, 'confidence', None) or 0)
+        return cool_down
+
     def check_skill_is_ready(self, max_repetitions=3, forced=False):
         """Checks if skill is available to cast.
         Gets text from the screen (skill cooldown) and stores it.
-        If same cooldown repeats then assumes that skill is available to cast.
+        If same cooldown repeats then assumes that skill is available to cast: real cooldown changes between checks,
+        while text read from skill's image stays the same. Cooldown with low confidence is read again
+        (see `get_cool_down`).
         Can be forced to set skill available to cast without that kind of checks.
 
         :param int max_repetitions: max repetitions if "same" cooldown if skill cooldown is hard to read.
         :param bool forced: force to set skill available.
         """
-        cool_down = self.emulator.get_screen_text(self.skill_ui) if not forced else False
+        cool_down = self.get_cool_down() if not forced else False
         if not cool_down and not forced:
             cool_down = "EMPTY"
         if cool_down:
@@ -201,13 +224,14 @@ class LockedSkill:
             else:
                 self.history[cool_down] = 1
             if self.history[cool_down] >= max_repetitions:
-                logger.debug(f"Found text over {self.name} skill with {self.history[cool_down]} repetitions. "
+                logger.debug(f"Found text over {self.name} skill with {self.history[cool_down]} repetitions "
+                             f"(confidence {getattr(cool_down, 'confidence', None)}). "
                              f"Assuming that {self.name} is available.")
                 cool_down = False
         if not cool_down:
             if self.skill_ui.image is None:
                 logger.debug(f"Got {self.name} skill image from screen. Now available to cast.")
-                self._skill_ready_image = self.emulator.get_screen_image(rect=self.skill_ui.button_rect)
+                self._skill_ready_image = self.emulator.get_screen_image(rect=self.skill_ui.button_rect).copy()
                 self.skill_ui.image = self._skill_ready_image
                 self.skill_ui.image_threshold = self.skill_locked_ui[0].image_threshold if self.skill_locked_ui else 0.8
             elif self.emulator.is_image_on_screen(self.skill_ui):
@@ -329,7 +353,7 @@ class ManualBattleBot(BattleBot):
     def load_character(self):
         """Loads character image."""
         logger.debug("Loading character image for the fight.")
-        character_image = self.emulator.get_screen_image(rect=ui.CURRENT_CHARACTER.image_rect)
+        character_image = self.emulator.get_screen_image(rect=ui.CURRENT_CHARACTER.image_rect).copy()
         ui.CURRENT_CHARACTER.image = character_image
         self.current_character = character_image
 
@@ -1,7 +1,8 @@
 import re
 
 import lib.logger as logging
-from lib.functions import wait_until, is_strings_similar, r_sleep, confirm_condition_by_time
+from lib.emulators.color_probe import ColorProbe
+from lib.functions import wait_until, find_similar_strings, r_sleep, confirm_condition_by_time
 from lib.game import ui
 from lib.game.data.game_modes import game_modes
 from lib.game.notifications import Notifications
@@ -44,6 +45,9 @@ class Game(Notifications):
         :param str user_name: game user name.
         """
         self.emulator = emulator
+        # Pre-scale images of all UI elements to emulator's resolution
+        self.emulator.template_store.preload(element for element in vars(ui).values()
+                                             if isinstance(element, ui.UIElement))
         self._apply_decorators()
         self._mode_names = game_modes
         self._user_name = user_name
@@ -54,6 +58,10 @@ class Game(Notifications):
         self.mission_team = 1
         self._modes = {}
         self._game_app_ui = ui.GAME_APP.copy()
+        self._loading_circle_probe = ColorProbe(rects=[
+            ui.LOADING_CIRCLE_1.image_rect, ui.LOADING_CIRCLE_2.image_rect, ui.LOADING_CIRCLE_3.image_rect,
+            ui.LOADING_CIRCLE_4.image_rect, ui.LOADING_CIRCLE_5.image_rect, ui.LOADING_CIRCLE_6.image_rect,
+            ui.LOADING_CIRCLE_7.image_rect, ui.LOADING_CIRCLE_8.image_rect])
         super().__init__(self)
 
     def _do_after_loading_circle_decorator(self, func):
@@ -232,11 +240,7 @@ class Game(Notifications):
 
     def is_loading_circle(self):
         """Checks if loading circle is on screen. Looks for colors in special places."""
-        loading_circle_rects = [ui.LOADING_CIRCLE_1.image_rect, ui.LOADING_CIRCLE_2.image_rect,
-                                ui.LOADING_CIRCLE_3.image_rect, ui.LOADING_CIRCLE_4.image_rect,
-                                ui.LOADING_CIRCLE_5.image_rect, ui.LOADING_CIRCLE_6.image_rect,
-                                ui.LOADING_CIRCLE_7.image_rect, ui.LOADING_CIRCLE_8.image_rect]
-        return self.emulator.is_color_similar(color=ui.LOADING_CIRCLE_1.image_color, rects=loading_circle_rects)
+        return self.emulator.is_color_similar(color=ui.LOADING_CIRCLE_1.image_color, rects=self._loading_circle_probe)
 
     def go_to_main_menu(self):
         """Goes to main menu screen."""
@@ -277,7 +281,8 @@ class Game(Notifications):
 
     def find_mode_on_board(self, mode_name, board, rows, cols):
         """Parses information from Content Status Board screen about game modes.
-        Creates pieces of board's elements for each element at (row, col) in Content Status Board and tries to parse it.
+        Creates pieces of board's elements for each element at (row, col) in Content Status Board
+        and parses all of them from single frame at once.
 
         :param str mode_name: name of game mode.
         :param ui.UIElement board: UI element that represents current Content Status Board.
@@ -286,19 +291,28 @@ class Game(Notifications):
 
         :rtype: GameMode
         """
-        self.emulator.get_screen_image()  # Store frame to cache for multi-threading the search
         element = ui.CONTENT_STATUS_ELEMENT_1  # Element contain button rectangle of local position and it's offset
+        board_elements = []
         for col in range(cols):
             for row in range(rows):
                 element_rect = ui.Rect(row * element.button_rect.width + row * element.offset.width,
                                        col * element.button_rect.height + col * element.offset.height,
                                        (row + 1) * element.button_rect.width + row * element.offset.width,
                                        (col + 1) * element.button_rect.height + col * element.offset.height)
-                mode = self.get_mode_from_element(board_rect=board.button_rect, element_rect=element_rect)
-                if mode:
-                    self._modes[mode.name] = mode
-                    if mode.name == mode_name:
-                        return mode
+                board_elements.append(self._get_board_element_ui(board_rect=board.button_rect,
+                                                                 element_rect=element_rect, suffix=f"{row}_{col}"))
+        texts = self.emulator.get_screen_texts([text_ui for _, label_ui, stage_ui in board_elements
+                                                for text_ui in (label_ui, stage_ui)], single_upload=True)
+        found_mode = None
+        for element_ui, label_ui, stage_ui in board_elements:
+            mode = self._get_mode_from_texts(element_ui=element_ui, board_rect=board.button_rect,
+                                             stage_label=texts[label_ui.name],
+                                             stage_counter_text=texts[stage_ui.name])
+            if mode:
+                self._modes[mode.name] = mode
+                if mode.name == mode_name and not found_mode:
+                    found_mode = mode
+        return found_mode
 
     def get_mode_from_element(self, board_rect, element_rect):
         """Gets information about game mode from single game mode element.
@@ -313,9 +327,26 @@ class Game(Notifications):
 
         :rtype: GameMode
         """
+        element_ui, label_ui, stage_ui = self._get_board_element_ui(board_rect=board_rect, element_rect=element_rect)
+        texts = self.emulator.get_screen_texts([label_ui, stage_ui])
+        return self._get_mode_from_texts(element_ui=element_ui, board_rect=board_rect,
+                                         stage_label=texts[label_ui.name], stage_counter_text=texts[stage_ui.name])
+
+    @staticmethod
+    def _get_board_element_ui(board_rect, element_rect, suffix=""):
+        """Creates temporary UI elements of single game mode element inside board.
+
+        :param ui.Rect board_rect: rectangle that represents current Content Status Board.
+        :param ui.Rect element_rect: rectangle of single game mode element inside board.
+        :param str suffix: suffix for names of UI elements to distinguish elements of the same board.
+
+        :return: UI elements of game mode's button, label and stages.
+        :rtype: tuple[ui.UIElement, ui.UIElement, ui.UIElement]
+        """
 
         def create_global_copy(ui_element: ui.UIElement, parent_rect: ui.Rect):
             copy_ui = ui_element.copy()
+            copy_ui.name = f"{ui_element.name}_{suffix}" if suffix else ui_element.name
             copy_ui.text_rect.parent = parent_rect
             copy_ui.text_rect = copy_ui.text_rect.global_rect
             return copy_ui
@@ -326,17 +357,26 @@ class Game(Notifications):
         element_ui.button_rect.parent = board_rect
         label_ui = create_global_copy(ui_element=ui.CONTENT_STATUS_ELEMENT_LABEL, parent_rect=element_ui.button_rect)
         stage_ui = create_global_copy(ui_element=ui.CONTENT_STATUS_ELEMENT_STAGE, parent_rect=element_ui.button_rect)
+        return element_ui, label_ui, stage_ui
+
+    def _get_mode_from_texts(self, element_ui, board_rect, stage_label, stage_counter_text):
+        """Gets information about game mode from texts of single game mode element.
+
+        :param ui.UIElement element_ui: UI element of game mode's button.
+        :param ui.Rect board_rect: rectangle that represents current Content Status Board.
+        :param str stage_label: text of game mode's label.
+        :param str stage_counter_text: text of game mode's stages.
 
-        stage_label = self.emulator.get_screen_text(label_ui)
-        stage_counter_text = self.emulator.get_screen_text(stage_ui)
+        :rtype: GameMode
+        """
         logger.debug(f"Stage: {stage_label}; stages: {stage_counter_text}")
         current_stages, max_stages = self.get_current_and_max_values_from_text(stage_counter_text)
         # Find mode and return info about stages and board
-        for mode_name in self._mode_names:
-            if is_strings_similar(mode_name, stage_label):
-                game_mode = GameMode(name=mode_name, stages=current_stages, max_stages=max_stages,
-                                     ui_button=element_ui, ui_board=board_rect.value)
-                return game_mode
+        similar_modes = find_similar_strings(self._mode_names, stage_label)
+        if similar_modes:
+            mode_name, _ = similar_modes[0]
+            return GameMode(name=mode_name, stages=current_stages, max_stages=max_stages,
+                            ui_button=element_ui, ui_board=board_rect.value)
 
     def select_mode(self, name):
         """Selects and opens game mode from Content Status Board by it's name.
@@ -509,12 +549,15 @@ class Game(Notifications):
             download_update()
             is_main_menu = self.is_main_menu()
             is_main_menu or \
-            self.close_news() or \
-            self.close_daily_rewards() or \
-            self.close_alliance_conquest() or \
-            self.close_alliance_conquest_results() or \
-            self.close_battleworld_rewards() or \
-            self.close_maintenance_notice() or \
+            self.close_first_notification([
+                (self.close_news, (ui.NEWS_ON_START_GAME,)),
+                (self.close_daily_rewards, (ui.MAIN_MENU_REWARDS,)),
+                (self.close_alliance_conquest, (ui.ALLIANCE_CONQUEST_NOTIFICATION,)),
+                (self.close_alliance_conquest_results, (ui.ALLIANCE_CONQUEST_REWARDS_ACQUIRE,
+                                                        ui.ALLIANCE_CONQUEST_REWARDS_CLOSE)),
+                (self.close_battleworld_rewards, (ui.MAIN_MENU_REWARDS_OK,)),
+                (self.close_maintenance_notice, (ui.MAINTENANCE_NOTICE, ui.MAINTENANCE_NOTICE_ACQUIRE))
+            ]) or \
             self.close_ads(timeout=1)
             return is_main_menu
 
@@ -202,7 +202,7 @@ class DangerRoom(Missions):
         characters_popularity, characters_images = [], []
         for character_index in range(1, 7):
             character_ui = ui.get_by_name(f'DANGER_ROOM_CHARACTER_{character_index}')
-            character_image = self.emulator.get_screen_image(rect=character_ui.button_rect)
+            character_image = self.emulator.get_screen_image(rect=character_ui.button_rect).copy()
             characters_images.append(character_image)
             character_popularity_text = self.emulator.get_screen_text(ui_element=character_ui)
             full_match = character_popularity_regexp.fullmatch(character_popularity_text)
@@ -90,10 +90,7 @@ class Missions(Notifications):
             return self.emulator.is_ui_element_on_screen(ui.CANNOT_ENTER)
 
         def home_button():
-            if self.emulator.is_image_on_screen(ui.HOME_BUTTON) or \
-                    self.emulator.is_image_on_screen(ui.HOME_BUTTON_POSITION_2) or \
-                    self.emulator.is_image_on_screen(ui.HOME_BUTTON_POSITION_3):
-                return True
+            return self.emulator.is_image_on_screen(ui.HOME_BUTTON)
 
         return [cannot_enter, home_button, self.close_lvl_up_notification,
                 self.close_stages_done_notification, self.close_items_def_notification, self.close_rank_up_notification,
@@ -157,15 +154,12 @@ class Missions(Notifications):
                 return logger.error("Can't start missions while repeating them, exiting.")
             AutoBattleBot(self.game, self.battle_over_conditions).fight()
             self.close_mission_notifications()
-            repeat_button_ui = None
-            if wait_until(self.emulator.is_image_on_screen, timeout=2,
-                          ui_element=ui.REPEAT_BUTTON_IMAGE_POSITION_2):
-                repeat_button_ui = ui.REPEAT_BUTTON_IMAGE_POSITION_2
-            else:
-                if wait_until(self.emulator.is_image_on_screen, timeout=2,
-                              ui_element=ui.REPEAT_BUTTON_IMAGE_POSITION_1):
-                    repeat_button_ui = ui.REPEAT_BUTTON_IMAGE_POSITION_1
-            if repeat_button_ui:
+            repeat_button_rect = None
+            if wait_until(self.emulator.is_image_on_screen, timeout=2, ui_element=ui.REPEAT_BUTTON_IMAGE):
+                repeat_button_rect = self.emulator.get_image_position(ui.REPEAT_BUTTON_IMAGE)
+            if repeat_button_rect:
+                repeat_button_ui = ui.REPEAT_BUTTON_IMAGE.copy()
+                repeat_button_ui.button_rect = ui.Rect(*repeat_button_rect)
                 self.press_repeat_button(repeat_button_ui)
 
     def press_start_button(self, start_button_ui=ui.START_BUTTON):
@@ -1,12 +1,11 @@
 ﻿import random
 
-import regex
-
 import lib.logger as logging
 from lib.functions import r_sleep, wait_until
 from lib.game import ui
 from lib.game.battle_bot import ManualBattleBot
 from lib.game.missions.missions import Missions
+from lib.rule_classifier import RuleClassifier
 
 logger = logging.get_logger(__name__)
 
@@ -17,22 +16,17 @@ class Shadowland(Missions):
     class FloorFilter:
         """Class for working with floor rules."""
 
-        DEFAULT_ERROR = 3  # Number of errors in the form of inserted, deleted or substituted characters in regex
+        DEFAULT_ERROR = 3  # Number of errors in the form of inserted, deleted or substituted characters in phrase
 
         def __init__(self, pattern, floor_filter):
             """Class initialization.
 
-            :param str pattern: regular expression pattern for mission's condition.
+            :param str pattern: phrase of floor's rule.
             :param ui.UIElement floor_filter: UI for main mission filter.
             """
-            self.pattern = f"[\\S\\s]*({pattern}){{e<={self.DEFAULT_ERROR}}}[\\S\\s]*"
-            self._regexp = regex.compile(self.pattern)
+            self.pattern = pattern
             self.filter = floor_filter
 
-        def get_filter(self, text):
-            if self._regexp.match(text):
-                return self.filter
-
         def __str__(self):
             return self.__class__.__name__
 
@@ -114,6 +108,9 @@ class Shadowland(Missions):
                               self.BlastCharacters(), self.CombatCharacters(), self.SpeedCharacters(),
                               self.UniversalCharacters(), self.MaleHeroes(), self.FireElement(), self.IceElement(),
                               self.BreakingJar()]
+        self.floor_rules = RuleClassifier(max_errors=self.FloorFilter.DEFAULT_ERROR, anywhere=True)
+        for floor_filter in self.floor_filters:
+            self.floor_rules.add_rule(label=floor_filter, phrase=floor_filter.pattern)
 
     @property
     def battle_over_conditions(self):
@@ -337,10 +334,9 @@ class Shadowland(Missions):
         return True
 
     def _select_character_filter_by_mission(self):
-        """Selects character filter by matching rules with `FloorFilter` objects."""
-        for floor_filter in self.floor_filters:
-            characters_filter = floor_filter.get_filter(text=self._room_rule)
-            if characters_filter:
-                logger.debug(f"Found filter {characters_filter} by {floor_filter}")
-                self.emulator.click_button(ui.SL_CHARACTER_FILTER, min_duration=1, max_duration=1)
-                self.emulator.click_button(characters_filter, min_duration=1, max_duration=1)
+        """Selects character filter by the best matched rule of `FloorFilter` objects."""
+        floor_filter, confidence = self.floor_rules.classify(self._room_rule)
+        if floor_filter:
+            logger.debug(f"Found filter {floor_filter.filter} by {floor_filter} with confidence {confidence:.2f}")
+            self.emulator.click_button(ui.SL_CHARACTER_FILTER, min_duration=1, max_duration=1)
+            self.emulator.click_button(floor_filter.filter, min_duration=1, max_duration=1)
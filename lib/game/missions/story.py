@@ -30,10 +30,7 @@ class Story(Missions):
             return self.emulator.is_ui_element_on_screen(ui.STORY_BATTLE_REWARDS)
 
         def home_button():
-            if self.emulator.is_image_on_screen(ui.HOME_BUTTON) or \
-                    self.emulator.is_image_on_screen(ui.HOME_BUTTON_POSITION_2) or \
-                    self.emulator.is_image_on_screen(ui.HOME_BUTTON_POSITION_3):
-                return True
+            return self.emulator.is_image_on_screen(ui.HOME_BUTTON)
 
         return [rewards, home_button]
 
@@ -1,5 +1,5 @@
 import lib.logger as logging
-from lib.functions import wait_until, is_strings_similar, r_sleep
+from lib.functions import wait_until, find_similar_strings, r_sleep
 from lib.game import ui
 from lib.game.battle_bot import ManualBattleBot
 from lib.game.missions.missions import Missions
@@ -324,8 +324,7 @@ class WorldBoss(Missions):
             return logger.warning(f"Achieved max resets of {current_reset} for Today's World Boss.")
         current_world_boss = self.emulator.get_screen_text(ui.WB_RESET_TODAYS_BOSS_NAME)
         logger.debug(f"Current boss of the day is {current_world_boss}; resetting for {target_world_boss}")
-        target_world_boss_found = [is_strings_similar(boss, current_world_boss) for boss in target_world_boss]
-        if any(target_world_boss_found):
+        if find_similar_strings(target_world_boss, current_world_boss):
             logger.debug("No need to reset World Boss. Exiting reset menu.")
             self.emulator.click_button(ui.WB_RESET_TODAYS_BOSS_MENU_CLOSE)
             return self.game.go_to_main_menu()
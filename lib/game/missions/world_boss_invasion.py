@@ -1,10 +1,9 @@
-import regex
-
 import lib.logger as logging
 from lib.functions import wait_until
 from lib.game import ui
 from lib.game.battle_bot import ManualBattleBot
 from lib.game.missions.missions import Missions
+from lib.rule_classifier import RuleClassifier
 
 logger = logging.get_logger(__name__)
 
@@ -15,29 +14,21 @@ class WorldBossInvasion(Missions):
     class MissionFilter:
         """Class for working with mission types of World Boss Invasion."""
 
-        DEFAULT_ERROR = 3  # Number of errors in the form of inserted, deleted or substituted characters in regex
+        DEFAULT_ERROR = 3  # Number of errors in the form of inserted, deleted or substituted characters in phrase
 
         def __init__(self, pattern, opposite_pattern, mission_filter, opposite_filter):
             """Class initialization.
 
-            :param str pattern: regular expression pattern for mission's condition.
-            :param str opposite_pattern: regular expression pattern for opposite mission's condition.
+            :param str pattern: phrase of mission's condition.
+            :param str opposite_pattern: phrase of opposite mission's condition.
             :param ui.UIElement mission_filter: UI for main mission filter.
             :param ui.UIElement opposite_filter: UI for opposite mission filter.
             """
-            self.pattern = f"({pattern}){{e<={self.DEFAULT_ERROR}}}"
-            self._regexp = regex.compile(self.pattern)
-            self.opposite_pattern = f"({opposite_pattern}){{e<={self.DEFAULT_ERROR}}}"
-            self._opposite_regexp = regex.compile(self.opposite_pattern)
+            self.pattern = pattern
+            self.opposite_pattern = opposite_pattern
             self.filter = mission_filter
             self.opposite_filter = opposite_filter
 
-        def get_filter(self, text):
-            if self._regexp.match(text):
-                return self.filter
-            if self._opposite_regexp.match(text):
-                return self.opposite_filter
-
     class SuperHeroes(MissionFilter):
 
         def __init__(self):
@@ -114,6 +105,11 @@ class WorldBossInvasion(Missions):
         self.mission_filters = [self.SuperHeroes(), self.SuperVillain(), self.MaleCharacters(), self.FemaleCharacters(),
                                 self.CombatCharacters(), self.SpeedCharacters(), self.BlastCharacters(),
                                 self.UniversalCharacters()]
+        self.mission_rules = RuleClassifier(max_errors=self.MissionFilter.DEFAULT_ERROR)
+        for mission_filter in self.mission_filters:
+            self.mission_rules.add_rule(label=(mission_filter, mission_filter.filter), phrase=mission_filter.pattern)
+            self.mission_rules.add_rule(label=(mission_filter, mission_filter.opposite_filter),
+                                        phrase=mission_filter.opposite_pattern)
 
     @property
     def battle_over_conditions(self):
@@ -334,13 +330,14 @@ class WorldBossInvasion(Missions):
             self.emulator.click_button(ui.INVASION_CHARACTER_3)
 
     def _select_character_filter_by_mission(self):
-        """Selects character filter by current mission."""
-        for mission_filter in self.mission_filters:
-            characters_filter = mission_filter.get_filter(text=self._boss_mission)
-            if characters_filter:
-                logger.debug(f"Found filter {characters_filter} by {mission_filter.__class__.__name__}")
-                self.emulator.click_button(ui.INVASION_CHARACTER_FILTER, min_duration=1, max_duration=1)
-                self.emulator.click_button(characters_filter, min_duration=1, max_duration=1)
+        """Selects character filter by the best matched rule of current mission."""
+        label, confidence = self.mission_rules.classify(self._boss_mission)
+        if label:
+            mission_filter, characters_filter = label
+            logger.debug(f"Found filter {characters_filter} by {mission_filter.__class__.__name__} "
+                         f"with confidence {confidence:.2f}")
+            self.emulator.click_button(ui.INVASION_CHARACTER_FILTER, min_duration=1, max_duration=1)
+            self.emulator.click_button(characters_filter, min_duration=1, max_duration=1)
 
     def _wait_for_players_and_start_fight(self):
         """Waits for players before start of the fight."""
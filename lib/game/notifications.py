@@ -17,6 +17,26 @@ class Notifications:
         self.game = game
         self.emulator = game.emulator
 
+    def close_first_notification(self, closers):
+        """Closes the first notification that is on screen.
+        Notifications are checked in order of how likely their UI elements are on screen
+        (see `AndroidEmulator.get_screen_candidates`), every notification is checked until one is closed.
+        Notifications that can't be ranked are checked last in their original order.
+
+        :param list[tuple[function, tuple[lib.game.ui.UIElement]]] closers: functions that close notification
+            and UI elements of these notifications.
+
+        :return: was notification closed or not.
+        :rtype: bool
+        """
+        candidates = self.emulator.get_screen_candidates([ui_element for _, ui_elements in closers
+                                                          for ui_element in ui_elements])
+        ranks = {ui_element.name: rank for rank, ui_element in enumerate(candidates)}
+        # Sorting is stable, so closers with equal ranks keep their original order
+        ranked_closers = sorted(closers, key=lambda closer: min((ranks[ui_element.name] for ui_element in closer[1]
+                                                                 if ui_element.name in ranks), default=len(ranks)))
+        return any(close() for close, _ in ranked_closers)
+
     def close_subscription_selector(self):
         """Closes Biometrics and X-Gene selector window.
 
@@ -270,12 +290,15 @@ class Notifications:
         """
 
         def close_notifications():
-            return self.close_lvl_up_notification() or \
-                   self.close_stages_done_notification() or \
-                   self.close_items_def_notification() or \
-                   self.close_rank_up_notification() or \
-                   self.close_shield_lvl_up_notification() or \
-                   self.close_recruit_character_notification()
+            with self.emulator.frame():
+                return self.close_first_notification([
+                    (self.close_lvl_up_notification, (ui.LVL_UP_NOTIFICATION,)),
+                    (self.close_stages_done_notification, (ui.STAGES_DONE_NOTIFICATION,)),
+                    (self.close_items_def_notification, (ui.TAP_TO_CONTINUE,)),
+                    (self.close_rank_up_notification, (ui.RANK_UP_NOTIFICATION_1, ui.RANK_UP_NOTIFICATION_2)),
+                    (self.close_shield_lvl_up_notification, (ui.SHIELD_LVL_UP_NOTIFICATION,)),
+                    (self.close_recruit_character_notification, (ui.RECRUIT_CHARACTER_NOTIFICATION,))
+                ])
 
         for _ in range(timeout):
             notification_closed = wait_until(close_notifications, timeout=1)
@@ -288,10 +311,13 @@ class Notifications:
         """
 
         def close_notifications():
-            return self.game.close_complete_challenge_notification() or \
-                   self.close_heroic_quest_notification() or \
-                   self.close_epic_quest_notification() or \
-                   self.game.close_subscription_selector()
+            with self.emulator.frame():
+                return self.close_first_notification([
+                    (self.game.close_complete_challenge_notification, (ui.CHALLENGE_COMPLETE_NOTIFICATION,)),
+                    (self.close_heroic_quest_notification, (ui.HQ_NOTIFICATION_OK,)),
+                    (self.close_epic_quest_notification, (ui.EQ_NOTIFICATION_OK,)),
+                    (self.game.close_subscription_selector, (ui.BIOMETRICS_NOTIFICATION, ui.X_GENE_NOTIFICATION))
+                ])
 
         for _ in range(timeout):
             notification_closed = wait_until(close_notifications, timeout=1)
@@ -3,11 +3,14 @@
 import lib.logger as logging
 from lib.functions import wait_until, is_strings_similar
 from lib.game import ui
+from lib.fuzzy_index import FuzzyIndex
 from lib.game.data.daily_trivia import trivia_qa
 from lib.game.notifications import Notifications
 
 logger = logging.get_logger(__name__)
 
+trivia_index = FuzzyIndex(trivia_qa)  # Built once, lookup doesn't scan all questions
+
 
 class DailyTrivia(Notifications):
     """Class for working with Daily Trivia."""
@@ -19,6 +22,7 @@ class DailyTrivia(Notifications):
         """
         super().__init__(game)
         self.trivia = trivia_qa
+        self.trivia_index = trivia_index
 
     def do_trivia(self):
         """Does trivia."""
@@ -41,17 +45,17 @@ class DailyTrivia(Notifications):
         """Solves trivia question."""
         question = self.emulator.get_screen_text(ui_element=ui.DAILY_TRIVIA_QUESTION)
         logger.debug(f"Found question: {question}")
-        answers = [value for key, value in self.trivia.items() if is_strings_similar(question, key)]
+        answers = [value for _, value, _ in self.trivia_index.find(question)]
         if not answers:
             logger.error(f"Can find answer for question: {question}")
             return False
         logger.debug(f"Found answers: {answers}, selecting.")
+        available_answers_ui = [ui.get_by_name(f'DAILY_TRIVIA_ANSWER_{i}') for i in range(1, 5)]
+        available_answers = self.emulator.get_screen_texts(ui_elements=available_answers_ui, single_upload=True)
+        logger.debug(f"Found available answers: {list(available_answers.values())}.")
         for answer in answers:
-            for i in range(1, 5):
-                available_answer_ui = ui.get_by_name(f'DAILY_TRIVIA_ANSWER_{i}')
-                available_answer = self.emulator.get_screen_text(ui_element=available_answer_ui)
-                logger.debug(f"Found available answer: {available_answer}.")
-                if is_strings_similar(answer, available_answer):
+            for available_answer_ui in available_answers_ui:
+                if is_strings_similar(answer, available_answers[available_answer_ui.name]):
                     logger.debug(f"Found correct answer on UI element: {available_answer_ui}, clicking.")
                     self.emulator.click_button(available_answer_ui)
                     return self.close_daily_trivia_answer_notification()
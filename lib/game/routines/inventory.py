@@ -1,9 +1,9 @@
-﻿import regex
-
-import lib.logger as logging
+﻿import lib.logger as logging
 from lib.functions import wait_until
 from lib.game import ui
 from lib.game.notifications import Notifications
+from lib.rule_classifier import RuleClassifier
+from lib.slot_grid import SlotGrid
 
 logger = logging.get_logger(__name__)
 
@@ -189,6 +189,16 @@ class Iso8(Notifications):
             return (cls.ALL_ATTACK_AND_ALL_DEFENCE, cls.ALL_ATTACK_AND_HP, cls.PHYSICAL_ATTACK_AND_HP,
                     cls.ENERGY_ATTACK_AND_HP)
 
+    def __init__(self, game):
+        """Class initialization.
+
+        :param lib.game.game.Game game: instance of the game.
+        """
+        super().__init__(game)
+        self.inventory_grid = SlotGrid([[ui.get_by_name(f"ISO8_ITEM_{row}_{col}")
+                                         for col in range(1, self.INVENTORY_COL + 1)]
+                                        for row in range(1, self.INVENTORY_ROW + 1)])
+
     def open_iso8_tab(self):
         """Opens ISO-8 tab in Inventory."""
 
@@ -296,6 +306,18 @@ class Iso8(Notifications):
             self._select_and_combine_iso8(times=times_for_each_combine)
         self.game.go_to_main_menu()
 
+    def _get_occupied_slots(self, skip_positions=None):
+        """Gets occupied slots of inventory's grid starting from bottom right.
+        All slots are checked in single pass over the screen before any of them is clicked.
+
+        :param skip_positions: list of position (row, col) which would be skipped.
+
+        :rtype: list[lib.slot_grid.GridSlot]
+        """
+        slots = self.emulator.get_grid_slots(self.inventory_grid)
+        return [slot for slot in reversed(slots)
+                if not slot.empty and not (skip_positions and (slot.row, slot.col) in skip_positions)]
+
     def _try_to_select_iso8_for_upgrade(self) -> bool:
         """Trying to select available ISO-8 for upgrade.
         Starting from bottom right clicks on every ISO-8 and looks for 'QUICK UPGRADE` button.
@@ -304,16 +326,12 @@ class Iso8(Notifications):
         :return: was available ISO-8 for upgrade found or not.
         :rtype: bool
         """
-        for row in range(self.INVENTORY_ROW, 0, -1):
-            for col in range(self.INVENTORY_COL, 0, -1):
-                iso8_ui = ui.get_by_name(f"ISO8_ITEM_{row}_{col}")
-                if self.emulator.is_image_on_screen(iso8_ui):  # Empty slot
-                    continue
-                self.emulator.click_button(iso8_ui)
-                if self.emulator.is_ui_element_on_screen(ui.ISO8_QUICK_UPGRADE) or \
-                        self.emulator.is_ui_element_on_screen(ui.ISO8_UPGRADE):
-                    logger.debug(f"Found ISO-8 available for upgrade in inventory grid at ({row}, {col})")
-                    return True
+        for slot in self._get_occupied_slots():
+            self.emulator.click_button(slot.ui_element)
+            if self.emulator.is_ui_element_on_screen(ui.ISO8_QUICK_UPGRADE) or \
+                    self.emulator.is_ui_element_on_screen(ui.ISO8_UPGRADE):
+                logger.debug(f"Found ISO-8 available for upgrade in inventory grid at ({slot.row}, {slot.col})")
+                return True
         return False
 
     def _try_to_select_iso8_for_combine(self, skip_positions=None):
@@ -327,15 +345,11 @@ class Iso8(Notifications):
         :return: False when no available ISO-8 was found or position (row, col) in inventory's grid of found ISO-8.
         :rtype: bool | tuple[int, int]
         """
-        for row in range(self.INVENTORY_ROW, 0, -1):
-            for col in range(self.INVENTORY_COL, 0, -1):
-                iso8_ui = ui.get_by_name(f"ISO8_ITEM_{row}_{col}")
-                if self.emulator.is_image_on_screen(iso8_ui) or (skip_positions and (row, col) in skip_positions):
-                    continue
-                self.emulator.click_button(iso8_ui)
-                if self.emulator.is_ui_element_on_screen(ui.ISO8_COMBINE):
-                    logger.debug(f"Found ISO-8 available for combine in inventory grid at ({row}, {col})")
-                    return row, col
+        for slot in self._get_occupied_slots(skip_positions=skip_positions):
+            self.emulator.click_button(slot.ui_element)
+            if self.emulator.is_ui_element_on_screen(ui.ISO8_COMBINE):
+                logger.debug(f"Found ISO-8 available for combine in inventory grid at ({slot.row}, {slot.col})")
+                return slot.row, slot.col
         return False
 
     def _select_types_for_upgrade(self, iso_to_use, stars_to_use):
@@ -437,27 +451,28 @@ class Iso8(Notifications):
 
         :param str | list[str] options_to_lock: list of options to look for locking. See `ISO8_LOCK` class.
         """
-        for row in range(self.INVENTORY_ROW, 0, -1):
-            for col in range(self.INVENTORY_COL, 0, -1):
-                iso8_ui = ui.get_by_name(f"ISO8_ITEM_{row}_{col}")
-                if self.emulator.is_image_on_screen(iso8_ui):
+        option_rules = RuleClassifier()
+        options_lines = {option: option_rules.add_pattern(option) for option in options_to_lock}
+        for slot in self._get_occupied_slots():
+            self.emulator.click_button(slot.ui_element)
+            text = self.emulator.get_screen_text(ui.ISO8_OPTION_TEXT)
+            # Every option is checked with its own number of errors, not only the best matched option of the line
+            lines_options = [option_rules.get_matched(line) for line in text.split("\n")]
+            for option in options_to_lock:
+                option_lines = options_lines[option]
+                if option in self.ISO8_LOCK.multi_line():
+                    matched = len(lines_options) >= len(option_lines) and \
+                        all(label in line_options for label, line_options in zip(option_lines, lines_options))
+                else:
+                    matched = any(option_lines[0] in line_options for line_options in lines_options)
+                if not matched:
                     continue
-                self.emulator.click_button(iso8_ui)
-                text = self.emulator.get_screen_text(ui.ISO8_OPTION_TEXT)
-                for option in options_to_lock:
-                    if option in self.ISO8_LOCK.multi_line():
-                        matched = regex.match(option, text) is not None
-                    else:
-                        # `match is not None` is required because `any()` can't cast `match` to bool
-                        matched = any([regex.match(option, line) is not None for line in text.split("\n")])
-                    if not matched:
-                        continue
-                    logger.debug(f"Found ISO-8 at {(row, col)} that meets requirements.")
-                    if wait_until(self.emulator.is_ui_element_on_screen, ui_element=ui.ISO8_LOCK):
-                        self.emulator.click_button(ui.ISO8_LOCK)
-                        if wait_until(self.emulator.is_ui_element_on_screen, ui_element=ui.ISO8_LOCK_CONFIRM):
-                            logger.info(f"ISO-8 at {(row, col)} has locked.")
-                            self.emulator.click_button(ui.ISO8_LOCK_CONFIRM)
+                logger.debug(f"Found ISO-8 at {(slot.row, slot.col)} that meets requirements.")
+                if wait_until(self.emulator.is_ui_element_on_screen, ui_element=ui.ISO8_LOCK):
+                    self.emulator.click_button(ui.ISO8_LOCK)
+                    if wait_until(self.emulator.is_ui_element_on_screen, ui_element=ui.ISO8_LOCK_CONFIRM):
+                        logger.info(f"ISO-8 at {(slot.row, slot.col)} has locked.")
+                        self.emulator.click_button(ui.ISO8_LOCK_CONFIRM)
 
 
 class Artifact(Notifications):
@@ -69,6 +69,7 @@ SKILL_1.text_rect = Rect(0.8485193621867881, 0.6022267206477733, 0.8712984054669
 SKILL_1.button_rect = Rect(0.8485193621867881, 0.6022267206477733, 0.8712984054669703, 0.6528340080971661)
 SKILL_1.image_threshold = 0.7
 SKILL_1.available_characters = "0123456789"
+SKILL_1.use_region_cache = False
 
 SKILL_2 = UIElement(name='SKILL_2')
 SKILL_2.description = "#2 skill button."
@@ -77,6 +78,7 @@ SKILL_2.text_rect = Rect(0.7858769931662871, 0.7186234817813765, 0.8115034168564
 SKILL_2.button_rect = Rect(0.7858769931662871, 0.7186234817813765, 0.8115034168564921, 0.7742914979757085)
 SKILL_2.image_threshold = 0.7
 SKILL_2.available_characters = "0123456789"
+SKILL_2.use_region_cache = False
 
 SKILL_3 = UIElement(name='SKILL_3')
 SKILL_3.description = "#3 skill button."
@@ -85,6 +87,7 @@ SKILL_3.text_rect = Rect(0.9396355353075171, 0.6072874493927125, 0.9681093394077
 SKILL_3.button_rect = Rect(0.9396355353075171, 0.6072874493927125, 0.9681093394077449, 0.6578947368421053)
 SKILL_3.image_threshold = 0.7
 SKILL_3.available_characters = "0123456789"
+SKILL_3.use_region_cache = False
 
 SKILL_4 = UIElement(name='SKILL_4')
 SKILL_4.description = "#4 skill button."
@@ -93,6 +96,7 @@ SKILL_4.text_rect = Rect(0.7972665148063781, 0.8805668016194332, 0.8257403189066
 SKILL_4.button_rect = Rect(0.7972665148063781, 0.8805668016194332, 0.8257403189066059, 0.9311740890688259)
 SKILL_4.image_threshold = 0.7
 SKILL_4.available_characters = "0123456789"
+SKILL_4.use_region_cache = False
 
 SKILL_5 = UIElement(name='SKILL_5')
 SKILL_5.description = "#5 skill button."
@@ -101,6 +105,7 @@ SKILL_5.text_rect = Rect(0.7061503416856492, 0.8805668016194332, 0.7317767653758
 SKILL_5.button_rect = Rect(0.7061503416856492, 0.8805668016194332, 0.7317767653758542, 0.9311740890688259)
 SKILL_5.image_threshold = 0.7
 SKILL_5.available_characters = "0123456789"
+SKILL_5.use_region_cache = False
 
 SKILL_6 = UIElement(name='SKILL_6')
 SKILL_6.description = "#6 skill button."
@@ -109,6 +114,7 @@ SKILL_6.text_rect = Rect(0.6083333333333333, 0.8787037037037037, 0.646875, 0.944
 SKILL_6.button_rect = Rect(0.6083333333333333, 0.8787037037037037, 0.646875, 0.9444444444444444)
 SKILL_6.text_threshold = 170
 SKILL_6.available_characters = "0123456789"
+SKILL_6.use_region_cache = False
 
 SKILL_6_LOCKED = UIElement(name='SKILL_6_LOCKED')
 SKILL_6_LOCKED.description = "#6 skill button when locked."
@@ -131,6 +137,7 @@ SKILL_T3.text_rect = Rect(0.5973958333333333, 0.8851851851851852, 0.6421875, 0.9
 SKILL_T3.button_rect = Rect(0.5973958333333333, 0.8851851851851852, 0.6421875, 0.9333333333333333)
 SKILL_T3.text_threshold = 170
 SKILL_T3.available_characters = "0123456789."
+SKILL_T3.use_region_cache = False
 
 SKILL_T3_LOCKED = UIElement(name='SKILL_T3_LOCKED')
 SKILL_T3_LOCKED.description = "T3 skill button when locked."
@@ -17,6 +17,7 @@ COOP_STAGE_PERCENTAGE.description = "CO-OP stage percentage."
 COOP_STAGE_PERCENTAGE.text_rect = Rect(0.702614427911823, 0.7783171556004411, 0.7342956657932411, 0.8003159445711723)
 COOP_STAGE_PERCENTAGE.text_threshold = 160
 COOP_STAGE_PERCENTAGE.available_characters = "0123456789%"
+COOP_STAGE_PERCENTAGE.glyph_font = "coop_percentage"
 
 COOP_DEPLOY_CHARACTER = UIElement(name='COOP_DEPLOY_CHARACTER')
 COOP_DEPLOY_CHARACTER.description = "Deploy character message that shown if you haven't deployed a character."
@@ -135,18 +135,21 @@ ENERGY.description = "Position of energy counter in top navigation bar."
 ENERGY.text_rect = Rect(0.40360971277466484, 0.028676049789068573, 0.4693535314333067, 0.06167028945613814)
 ENERGY.text_threshold = 175
 ENERGY.available_characters = "0123456789/,"
+ENERGY.glyph_font = "navigation_bar"
 
 GOLD = UIElement(name='GOLD')
 GOLD.description = "Position of gold counter in top navigation bar."
 GOLD.text_rect = Rect(0.5184254726330584, 0.032590620597026, 0.5901460020788496, 0.06446641146182204)
 GOLD.text_threshold = 150
 GOLD.available_characters = "0123456789,"
+GOLD.glyph_font = "navigation_bar"
 
 BOOST = UIElement(name='BOOST')
 BOOST.description = "Position of boost counter in top navigation bar."
 BOOST.text_rect = Rect(0.7345307521473501, 0.032590620597026, 0.7848609482496597, 0.06390718706068522)
 BOOST.text_threshold = 155
 BOOST.available_characters = "0123456789"
+BOOST.glyph_font = "navigation_bar"
 
 CONTENT_STATUS_BOARD_BUTTON = UIElement(name='CONTENT_STATUS_BOARD_BUTTON')
 CONTENT_STATUS_BOARD_BUTTON.description = "Button to content status board in main menu."
@@ -181,6 +184,7 @@ CONTENT_STATUS_ELEMENT_STAGE.description = "Local position of stage counter insi
 CONTENT_STATUS_ELEMENT_STAGE.text_rect = Rect(0.7630161579892281, 0.3357142857142857, 0.9353680430879713, 0.6214285714285714)
 CONTENT_STATUS_ELEMENT_STAGE.text_threshold = 160
 CONTENT_STATUS_ELEMENT_STAGE.available_characters = "1234567890/"
+CONTENT_STATUS_ELEMENT_STAGE.glyph_font = "content_status"
 
 CONTENT_STATUS_DRAG_FROM = UIElement(name='CONTENT_STATUS_DRAG_FROM')
 CONTENT_STATUS_DRAG_FROM.description = "Start position of dragging board to see others elements."
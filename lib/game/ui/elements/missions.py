@@ -5,12 +5,14 @@ ENERGY_COST.description = "Energy cost of staging the mission."
 ENERGY_COST.text_rect = Rect(0.9138564920273349, 0.9109311740890689, 0.9396355353075171, 0.951417004048583)
 ENERGY_COST.text_threshold = 145
 ENERGY_COST.available_characters = "-0123456789"
+ENERGY_COST.glyph_font = "mission_cost"
 
 BOOST_COST = UIElement(name='BOOST_COST')
 BOOST_COST.description = "Boost cost of staging the mission."
 BOOST_COST.text_rect = Rect(0.783876993166287, 0.8704453441295547, 0.8086560364464692, 0.9101311740890689)
 BOOST_COST.text_threshold = 225
 BOOST_COST.available_characters = "0123456789-"
+BOOST_COST.glyph_font = "mission_cost"
 
 START_BUTTON = UIElement(name='START_BUTTON')
 START_BUTTON.description = "The mission start button."
@@ -24,26 +26,13 @@ REPEAT_BUTTON.description = "The mission repeat button."
 REPEAT_BUTTON.button_rect = Rect(0.8942708333333333, 0.8944444444444445, 0.9354166666666667, 0.9601851851851851)
 
 HOME_BUTTON = UIElement(name='HOME_BUTTON')
-HOME_BUTTON.description = "The mission home button (middle position)."
+HOME_BUTTON.description = "The mission home button (middle position, can be in left or right position)."
 HOME_BUTTON.image_rect = Rect(0.7515625, 0.8953703703703704, 0.8015625, 0.9648148148148148)
+HOME_BUTTON.search_rect = Rect(0.6009375, 0.8844444444444445, 0.9527083333333334, 0.9748148148148148)
 HOME_BUTTON.button_rect = Rect(0.7515625, 0.8953703703703704, 0.8015625, 0.9648148148148148)
 HOME_BUTTON.image_threshold = 0.7
 HOME_BUTTON.image = load_ui_image("home_button.png")
 
-HOME_BUTTON_POSITION_2 = UIElement(name='HOME_BUTTON_POSITION_2')
-HOME_BUTTON_POSITION_2.description = "The mission home button. (left position)."
-HOME_BUTTON_POSITION_2.image_rect = Rect(0.6109375, 0.8944444444444445, 0.6604166666666667, 0.9638888888888889)
-HOME_BUTTON_POSITION_2.button_rect = Rect(0.6109375, 0.8944444444444445, 0.6604166666666667, 0.9638888888888889)
-HOME_BUTTON_POSITION_2.image_threshold = 0.7
-HOME_BUTTON_POSITION_2.image = load_ui_image("home_button.png")
-
-HOME_BUTTON_POSITION_3 = UIElement(name='HOME_BUTTON_POSITION_3')
-HOME_BUTTON_POSITION_3.description = "The mission home button. (right position)."
-HOME_BUTTON_POSITION_3.image_rect = Rect(0.8927083333333333, 0.8944444444444445, 0.9427083333333334, 0.9638888888888889)
-HOME_BUTTON_POSITION_3.button_rect = Rect(0.8927083333333333, 0.8944444444444445, 0.9427083333333334, 0.9638888888888889)
-HOME_BUTTON_POSITION_3.image_threshold = 0.7
-HOME_BUTTON_POSITION_3.image = load_ui_image("home_button.png")
-
 LVL_UP_NOTIFICATION = UIElement(name='LVL_UP_NOTIFICATION')
 LVL_UP_NOTIFICATION.description = "LVL up notification after end of the mission."
 LVL_UP_NOTIFICATION.text_rect = Rect(0.47955122512041004, 0.8978076507631267, 0.5214233754879544, 0.950978635356834)
@@ -120,19 +109,13 @@ ENEMY_AND_ALLY_APPEARED.text_rect = Rect(0.278125, 0.5194444444444445, 0.7192708
 ENEMY_AND_ALLY_APPEARED.text = "An Enemy Shifter Appeared!"
 ENEMY_AND_ALLY_APPEARED.text_threshold = 80
 
-REPEAT_BUTTON_IMAGE_POSITION_1 = UIElement(name='REPEAT_BUTTON_IMAGE_POSITION_1')
-REPEAT_BUTTON_IMAGE_POSITION_1.description = "An image of Repeat Mission button (position 1)."
-REPEAT_BUTTON_IMAGE_POSITION_1.image_rect = Rect(0.7536458333333333, 0.8944444444444445, 0.7953125, 0.9601851851851851)
-REPEAT_BUTTON_IMAGE_POSITION_1.button_rect = Rect(0.7536458333333333, 0.8944444444444445, 0.7953125, 0.9601851851851851)
-REPEAT_BUTTON_IMAGE_POSITION_1.image_threshold = 0.7
-REPEAT_BUTTON_IMAGE_POSITION_1.image = load_ui_image("repeat_button.png")
-
-REPEAT_BUTTON_IMAGE_POSITION_2 = UIElement(name='REPEAT_BUTTON_IMAGE_POSITION_2')
-REPEAT_BUTTON_IMAGE_POSITION_2.description = "An image of Repeat Mission button (position 2)."
-REPEAT_BUTTON_IMAGE_POSITION_2.image_rect = Rect(0.8942708333333333, 0.8944444444444445, 0.9354166666666667, 0.9601851851851851)
-REPEAT_BUTTON_IMAGE_POSITION_2.button_rect = Rect(0.8942708333333333, 0.8944444444444445, 0.9354166666666667, 0.9601851851851851)
-REPEAT_BUTTON_IMAGE_POSITION_2.image_threshold = 0.7
-REPEAT_BUTTON_IMAGE_POSITION_2.image = load_ui_image("repeat_button.png")
+REPEAT_BUTTON_IMAGE = UIElement(name='REPEAT_BUTTON_IMAGE')
+REPEAT_BUTTON_IMAGE.description = "An image of Repeat Mission button (can be in one of two positions)."
+REPEAT_BUTTON_IMAGE.image_rect = Rect(0.7536458333333333, 0.8944444444444445, 0.7953125, 0.9601851851851851)
+REPEAT_BUTTON_IMAGE.search_rect = Rect(0.7436458333333333, 0.8844444444444445, 0.9454166666666667, 0.9701851851851851)
+REPEAT_BUTTON_IMAGE.button_rect = Rect(0.7536458333333333, 0.8944444444444445, 0.7953125, 0.9601851851851851)
+REPEAT_BUTTON_IMAGE.image_threshold = 0.7
+REPEAT_BUTTON_IMAGE.image = load_ui_image("repeat_button.png")
 
 SELECT_TEAM_1 = UIElement(name='SELECT_TEAM_1')
 SELECT_TEAM_1.description = "Team selector is first team."
@@ -84,42 +84,49 @@ INVASION_TWILIGHT_BATTLE_1.description = "WBI: Twilight: Battle 1."
 INVASION_TWILIGHT_BATTLE_1.text_rect = Rect(0.06354166666666666, 0.40925925925925927, 0.14635416666666667, 0.44907407407407407)
 INVASION_TWILIGHT_BATTLE_1.button_rect = Rect(0.0640625, 0.21203703703703702, 0.1453125, 0.35555555555555557)
 INVASION_TWILIGHT_BATTLE_1.text_threshold = 150
+INVASION_TWILIGHT_BATTLE_1.use_region_cache = False
 
 INVASION_TWILIGHT_BATTLE_2 = UIElement(name='INVASION_TWILIGHT_BATTLE_2')
 INVASION_TWILIGHT_BATTLE_2.description = "WBI: Twilight: Battle 2."
 INVASION_TWILIGHT_BATTLE_2.text_rect = Rect(0.22604166666666667, 0.6203703703703703, 0.31197916666666664, 0.6546296296296297)
 INVASION_TWILIGHT_BATTLE_2.button_rect = Rect(0.22760416666666666, 0.40185185185185185, 0.3072916666666667, 0.5435185185185185)
 INVASION_TWILIGHT_BATTLE_2.text_threshold = 150
+INVASION_TWILIGHT_BATTLE_2.use_region_cache = False
 
 INVASION_TWILIGHT_BATTLE_3 = UIElement(name='INVASION_TWILIGHT_BATTLE_3')
 INVASION_TWILIGHT_BATTLE_3.description = "WBI: Twilight: Battle 3."
 INVASION_TWILIGHT_BATTLE_3.text_rect = Rect(0.4375, 0.6703703703703704, 0.5208333333333334, 0.7083333333333334)
 INVASION_TWILIGHT_BATTLE_3.button_rect = Rect(0.4390625, 0.45185185185185184, 0.5197916666666667, 0.5935185185185186)
 INVASION_TWILIGHT_BATTLE_3.text_threshold = 150
+INVASION_TWILIGHT_BATTLE_3.use_region_cache = False
 
 INVASION_TWILIGHT_BATTLE_4 = UIElement(name='INVASION_TWILIGHT_BATTLE_4')
 INVASION_TWILIGHT_BATTLE_4.description = "WBI: Twilight: Battle 4."
 INVASION_TWILIGHT_BATTLE_4.text_rect = Rect(0.32447916666666665, 0.34814814814814815, 0.4036458333333333, 0.38425925925925924)
 INVASION_TWILIGHT_BATTLE_4.button_rect = Rect(0.32447916666666665, 0.1287037037037037, 0.4036458333333333, 0.27037037037037037)
 INVASION_TWILIGHT_BATTLE_4.text_threshold = 150
+INVASION_TWILIGHT_BATTLE_4.use_region_cache = False
 
 INVASION_TWILIGHT_BATTLE_5 = UIElement(name='INVASION_TWILIGHT_BATTLE_5')
 INVASION_TWILIGHT_BATTLE_5.description = "WBI: Twilight: Battle 5."
 INVASION_TWILIGHT_BATTLE_5.text_rect = Rect(0.5614583333333333, 0.48333333333333334, 0.6463541666666667, 0.5194444444444445)
 INVASION_TWILIGHT_BATTLE_5.button_rect = Rect(0.5614583333333333, 0.2638888888888889, 0.6463541666666667, 0.40555555555555556)
 INVASION_TWILIGHT_BATTLE_5.text_threshold = 150
+INVASION_TWILIGHT_BATTLE_5.use_region_cache = False
 
 INVASION_TWILIGHT_BATTLE_6 = UIElement(name='INVASION_TWILIGHT_BATTLE_6')
 INVASION_TWILIGHT_BATTLE_6.description = "WBI: Twilight: Battle 6."
 INVASION_TWILIGHT_BATTLE_6.text_rect = Rect(0.8489583333333334, 0.6305555555555555, 0.9338541666666667, 0.6648148148148149)
 INVASION_TWILIGHT_BATTLE_6.button_rect = Rect(0.8489583333333334, 0.4101851851851852, 0.9338541666666667, 0.55)
 INVASION_TWILIGHT_BATTLE_6.text_threshold = 150
+INVASION_TWILIGHT_BATTLE_6.use_region_cache = False
 
 INVASION_TWILIGHT_BATTLE_7 = UIElement(name='INVASION_TWILIGHT_BATTLE_7')
 INVASION_TWILIGHT_BATTLE_7.description = "WBI: Twilight: Battle 7."
 INVASION_TWILIGHT_BATTLE_7.text_rect = Rect(0.7213541666666666, 0.3388888888888889, 0.8020833333333334, 0.375)
 INVASION_TWILIGHT_BATTLE_7.button_rect = Rect(0.7213541666666666, 0.12129629629629629, 0.8020833333333334, 0.2601851851851852)
 INVASION_TWILIGHT_BATTLE_7.text_threshold = 150
+INVASION_TWILIGHT_BATTLE_7.use_region_cache = False
 
 INVASION_BOSS_FIGHT_ENTER = UIElement(name='INVASION_BOSS_FIGHT_ENTER')
 INVASION_BOSS_FIGHT_ENTER.description = "WBI boss fight ENTER button."
@@ -140,42 +147,49 @@ INVASION_BLACK_ORDER_BATTLE_1.description = "WBI: Black Order: Battle 1."
 INVASION_BLACK_ORDER_BATTLE_1.text_rect = Rect(0.059895833333333336, 0.4537037037037037, 0.140625, 0.4888888888888889)
 INVASION_BLACK_ORDER_BATTLE_1.button_rect = Rect(0.059895833333333336, 0.23333333333333334, 0.140625, 0.37407407407407406)
 INVASION_BLACK_ORDER_BATTLE_1.text_threshold = 150
+INVASION_BLACK_ORDER_BATTLE_1.use_region_cache = False
 
 INVASION_BLACK_ORDER_BATTLE_2 = UIElement(name='INVASION_BLACK_ORDER_BATTLE_2')
 INVASION_BLACK_ORDER_BATTLE_2.description = "WBI: Black Order: Battle 2."
 INVASION_BLACK_ORDER_BATTLE_2.text_rect = Rect(0.20989583333333334, 0.34814814814814815, 0.29270833333333335, 0.3851851851851852)
 INVASION_BLACK_ORDER_BATTLE_2.button_rect = Rect(0.20989583333333334, 0.12962962962962962, 0.29270833333333335, 0.27037037037037037)
 INVASION_BLACK_ORDER_BATTLE_2.text_threshold = 150
+INVASION_BLACK_ORDER_BATTLE_2.use_region_cache = False
 
 INVASION_BLACK_ORDER_BATTLE_3 = UIElement(name='INVASION_BLACK_ORDER_BATTLE_3')
 INVASION_BLACK_ORDER_BATTLE_3.description = "WBI: Black Order: Battle 3."
 INVASION_BLACK_ORDER_BATTLE_3.text_rect = Rect(0.328125, 0.6370370370370371, 0.41041666666666665, 0.6703703703703704)
 INVASION_BLACK_ORDER_BATTLE_3.button_rect = Rect(0.328125, 0.4212962962962963, 0.41041666666666665, 0.5574074074074075)
 INVASION_BLACK_ORDER_BATTLE_3.text_threshold = 150
+INVASION_BLACK_ORDER_BATTLE_3.use_region_cache = False
 
 INVASION_BLACK_ORDER_BATTLE_4 = UIElement(name='INVASION_BLACK_ORDER_BATTLE_4')
 INVASION_BLACK_ORDER_BATTLE_4.description = "WBI: Black Order: Battle 4."
 INVASION_BLACK_ORDER_BATTLE_4.text_rect = Rect(0.46875, 0.3388888888888889, 0.5520833333333334, 0.37407407407407406)
 INVASION_BLACK_ORDER_BATTLE_4.button_rect = Rect(0.46875, 0.12129629629629629, 0.5520833333333334, 0.2611111111111111)
 INVASION_BLACK_ORDER_BATTLE_4.text_threshold = 150
+INVASION_BLACK_ORDER_BATTLE_4.use_region_cache = False
 
 INVASION_BLACK_ORDER_BATTLE_5 = UIElement(name='INVASION_BLACK_ORDER_BATTLE_5')
 INVASION_BLACK_ORDER_BATTLE_5.description = "WBI: Black Order: Battle 5."
 INVASION_BLACK_ORDER_BATTLE_5.text_rect = Rect(0.7203125, 0.38796296296296295, 0.8020833333333334, 0.42592592592592593)
 INVASION_BLACK_ORDER_BATTLE_5.button_rect = Rect(0.7203125, 0.16944444444444445, 0.8020833333333334, 0.30925925925925923)
 INVASION_BLACK_ORDER_BATTLE_5.text_threshold = 150
+INVASION_BLACK_ORDER_BATTLE_5.use_region_cache = False
 
 INVASION_BLACK_ORDER_BATTLE_6 = UIElement(name='INVASION_BLACK_ORDER_BATTLE_6')
 INVASION_BLACK_ORDER_BATTLE_6.description = "WBI: Black Order: Battle 6."
 INVASION_BLACK_ORDER_BATTLE_6.text_rect = Rect(0.5598958333333334, 0.6805555555555556, 0.640625, 0.7175925925925926)
 INVASION_BLACK_ORDER_BATTLE_6.button_rect = Rect(0.5598958333333334, 0.46296296296296297, 0.640625, 0.6018518518518519)
 INVASION_BLACK_ORDER_BATTLE_6.text_threshold = 150
+INVASION_BLACK_ORDER_BATTLE_6.use_region_cache = False
 
 INVASION_BLACK_ORDER_BATTLE_7 = UIElement(name='INVASION_BLACK_ORDER_BATTLE_7')
 INVASION_BLACK_ORDER_BATTLE_7.description = "WBI: Black Order: Battle 7."
 INVASION_BLACK_ORDER_BATTLE_7.text_rect = Rect(0.8567708333333334, 0.6296296296296297, 0.9375, 0.6666666666666666)
 INVASION_BLACK_ORDER_BATTLE_7.button_rect = Rect(0.8567708333333334, 0.41203703703703703, 0.9375, 0.5518518518518518)
 INVASION_BLACK_ORDER_BATTLE_7.text_threshold = 150
+INVASION_BLACK_ORDER_BATTLE_7.use_region_cache = False
 
 INVASION_BOSS_FIGHT_START = UIElement(name='INVASION_BOSS_FIGHT_START')
 INVASION_BOSS_FIGHT_START.description = "WBI boss fight START button."
@@ -86,6 +86,7 @@ class UIElement:
     button_rect = None  # type: Rect
     text_rect = None  # type: Rect
     image_rect = None  # type: Rect
+    search_rect = None  # type: Rect
     image = None  # type: numpy.ndarray
     text = None  # type: str
     image_threshold = None  # type: int
@@ -94,6 +95,11 @@ class UIElement:
     color_to_convert = None  # type: List[Tuple[int, int, int]]
     available_characters = None  # type: str
     tesseract_resize_height = STABLE_MAX_HEIGHT_FOR_TESSERACT  # type: int
+    use_ocr_cache = True  # type: bool
+    use_region_cache = True  # type: bool
+    use_ink_signature = True  # type: bool
+    glyph_font = None  # type: str
+    ocr_backend = None  # type: str
     offset = None  # type: Rect
 
     def __init__(self, name="Test"):
@@ -0,0 +1,217 @@
+import os
+from threading import Lock
+
+import cv2
+import numpy
+
+import lib.logger as logging
+from lib.ocr_backend import OCRResult
+
+logger = logging.get_logger(__name__)
+
+GLYPHS_FOLDER = os.path.join("images", "glyphs")  # Folder with saved glyph templates: <folder>/<font>.npz
+GLYPH_SIZE = (12, 16)  # Width and height of normalized glyph bitmap
+GLYPH_SHAPE_WEIGHT = 64  # Weight of glyph's shape features (aspect ratio, height and position inside line)
+GLYPH_MAX_DISTANCE = 0.12  # Max ratio of different pixels between glyph and template to consider them as same char
+GLYPH_MIN_MARGIN = 0.02  # Min difference of distances to the nearest and the second nearest chars to trust the glyph
+GLYPH_MIN_AREA = 3  # Components with less pixels are considered as noise
+GLYPH_MAX_TEMPLATES = 4  # Max number of templates per char
+
+
+class GlyphRecognizer:
+    """Class for recognizing short strings of fixed font (counters, costs, etc.) by glyph templates.
+    Thresholded image is segmented into glyphs by connected components and each glyph is classified
+    by the nearest template. Templates are loaded from `GLYPHS_FOLDER` and learned from Tesseract results
+    that are confirmed by independent recognition of the same image (see `learn`),
+    so the recognizer doesn't need any prepared data to start working and single misread isn't learned.
+    Learned templates are saved right away, so next runs start with them.
+
+    Text is recognized only when every available character already has a template
+    and each glyph is clearly closer to one char than to others, otherwise it's left for Tesseract:
+    glyph of char without template would be taken for the most similar known char ('8' for '0')."""
+
+    def __init__(self, font, max_distance=GLYPH_MAX_DISTANCE, min_margin=GLYPH_MIN_MARGIN, min_area=GLYPH_MIN_AREA,
+                 folder=GLYPHS_FOLDER):
+        """Class initialization.
+
+        :param str font: name of the font; templates of different fonts are kept separately.
+        :param float max_distance: max ratio of different pixels between glyph and template.
+        :param float min_margin: min difference of distances to the nearest and the second nearest chars.
+        :param int min_area: components with less pixels are considered as noise.
+        :param str folder: folder with saved glyph templates.
+        """
+        self.font = font
+        self.max_distance = max_distance
+        self.min_margin = min_margin
+        self.min_area = min_area
+        self.path = os.path.join(folder, f"{font}.npz")
+        # Labels and templates are replaced together, so readers without lock always see matching pair
+        self._data = (numpy.array([], dtype="<U1"),
+                      numpy.zeros((0, GLYPH_SIZE[0] * GLYPH_SIZE[1] + 3), dtype=numpy.float32))
+        self._lock = Lock()
+        self.load()
+
+    def __len__(self):
+        return len(self._data[0])
+
+    @property
+    def chars(self):
+        """Chars that have templates.
+
+        :rtype: set[str]
+        """
+        return set(self._data[0].tolist())
+
+    def load(self):
+        """Loads glyph templates of the font."""
+        if not os.path.exists(self.path):
+            return
+        with numpy.load(self.path) as data:
+            self._data = (data["labels"], data["templates"])
+        logger.debug(f"Loaded {len(self)} glyph templates of '{self.font}' font.")
+
+    def save(self):
+        """Saves glyph templates of the font. File is replaced at once, so other processes never read partial one."""
+        labels, templates = self._data
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            numpy.savez_compressed(file, labels=labels, templates=templates)
+        os.replace(temp_path, self.path)
+
+    def segment(self, image):
+        """Segments thresholded image into glyphs ordered from left to right.
+        Components that mostly overlap horizontally (as parts of '%' or ':') are merged into single glyph.
+        Each glyph is normalized to fixed size bitmap and described by shape features relative to the line
+        (aspect ratio, height and vertical position), so '.', ',' and '-' can be distinguished.
+
+        :param numpy.ndarray image: thresholded image.
+
+        :return: list of glyphs' vectors.
+        :rtype: list[numpy.ndarray]
+        """
+        if cv2.countNonZero(image) > image.size // 2:
+            image = cv2.bitwise_not(image)  # Glyphs are expected to be white on black background
+        count, _, stats, _ = cv2.connectedComponentsWithStats(image, connectivity=8)
+        boxes = sorted((x, y, x + width, y + height) for x, y, width, height, area in stats[1:count]
+                       if area >= self.min_area)
+        if not boxes:
+            return []
+        glyph_boxes = [list(boxes[0])]
+        for x1, y1, x2, y2 in boxes[1:]:
+            last_box = glyph_boxes[-1]
+            overlap = last_box[2] - x1
+            if overlap > 0 and overlap * 2 >= min(x2 - x1, last_box[2] - last_box[0]):
+                last_box[1], last_box[2], last_box[3] = min(last_box[1], y1), max(last_box[2], x2), max(last_box[3], y2)
+            else:
+                glyph_boxes.append([x1, y1, x2, y2])
+        line_height = float(numpy.median([y2 - y1 for _, y1, _, y2 in glyph_boxes]))
+        line_center = float(numpy.median([(y1 + y2) / 2 for _, y1, _, y2 in glyph_boxes]))
+        glyphs = []
+        for x1, y1, x2, y2 in glyph_boxes:
+            bitmap = cv2.resize(image[y1:y2, x1:x2], GLYPH_SIZE, interpolation=cv2.INTER_AREA)
+            features = (min((x2 - x1) / (y2 - y1), 2) / 2,
+                        min((y2 - y1) / line_height, 2) / 2,
+                        (numpy.clip(((y1 + y2) / 2 - line_center) / line_height, -1, 1) + 1) / 2)
+            glyphs.append(numpy.concatenate(((bitmap > 127).ravel(), numpy.multiply(features, GLYPH_SHAPE_WEIGHT)))
+                          .astype(numpy.float32))
+        return glyphs
+
+    def _get_nearest(self, glyph, chars=None):
+        """Gets the nearest template for the glyph.
+
+        :param numpy.ndarray glyph: glyph's vector.
+        :param str chars: chars to consider; any char if not given.
+
+        :return: char, distance to its template and distance to the nearest template of other char
+            (1.0 if there are no templates).
+        :rtype: tuple[str | None, float, float]
+        """
+        labels, templates = self._data
+        if chars:
+            mask = numpy.isin(labels, list(chars))
+            labels, templates = labels[mask], templates[mask]
+        if not len(labels):
+            return None, 1.0, 1.0
+        distances = numpy.abs(templates - glyph).sum(axis=1) / (GLYPH_SIZE[0] * GLYPH_SIZE[1])
+        index = int(distances.argmin())
+        other_distances = distances[labels != labels[index]]
+        return labels[index], float(distances[index]), float(other_distances.min()) if len(other_distances) else 1.0
+
+    def recognize(self, image, chars=None):
+        """Recognizes text of thresholded image.
+
+        :param numpy.ndarray image: thresholded image.
+        :param str chars: available characters in image's text.
+
+        :return: recognized text or None if any available character doesn't have template yet
+            or any glyph doesn't have similar template or is ambiguous.
+            Confidence of the text is similarity of the least similar glyph (0-100): 100 for exact match of template
+            and 0 for glyph at `max_distance` from its template.
+        :rtype: lib.ocr_backend.OCRResult | None
+        """
+        if chars and not set(chars.replace(" ", "")).issubset(self.chars):
+            return None
+        glyphs = self.segment(image)
+        if not glyphs:
+            return None
+        text, max_distance = [], 0.0
+        for glyph in glyphs:
+            char, distance, other_distance = self._get_nearest(glyph, chars)
+            if distance > self.max_distance or other_distance - distance < self.min_margin:
+                return None
+            text.append(char)
+            max_distance = max(max_distance, distance)
+        confidence = 100 * (1 - max_distance / self.max_distance) if self.max_distance else 100
+        return OCRResult("".join(text), confidence=round(confidence))
+
+    def learn(self, image, text, confirm):
+        """Learns glyph templates from image with text recognized by Tesseract.
+        Image is skipped if number of glyphs doesn't match text's length.
+        Templates are learned only if text is confirmed: `confirm` recognizes the image independently
+        (other threshold, other engine) and gives the same text. Confirmation is called only when image has
+        glyphs that aren't known yet, so known images don't cost additional recognition.
+        Learned templates are saved into font's file.
+
+        :param numpy.ndarray image: thresholded image.
+        :param str text: text of the image.
+        :param function confirm: function that independently recognizes the image and returns its text.
+
+        :return: were new templates learned or not.
+        :rtype: bool
+        """
+        text = text.replace(" ", "")
+        glyphs = self.segment(image)
+        if not text or len(glyphs) != len(text):
+            return False
+        new_templates = []
+        labels = self._data[0]
+        for char, glyph in zip(text, glyphs):
+            if numpy.count_nonzero(labels == char) >= GLYPH_MAX_TEMPLATES:
+                continue
+            _, distance, _ = self._get_nearest(glyph, char)
+            if distance > self.max_distance / 2:
+                new_templates.append((char, glyph))
+        if not new_templates:
+            return False
+        confirmed_text = confirm()
+        if confirmed_text is None or confirmed_text.replace(" ", "") != text:
+            logger.debug(f"Glyphs of '{self.font}' font aren't learned: '{text}' isn't confirmed "
+                         f"(got '{confirmed_text}').")
+            return False
+        self._add_templates(new_templates)
+        try:
+            self.save()
+        except OSError as error:
+            logger.debug(f"Can't save glyph templates of '{self.font}' font: {error}")
+        return True
+
+    def _add_templates(self, templates):
+        """Adds templates of chars.
+
+        :param list[tuple[str, numpy.ndarray]] templates: list of (char, glyph's vector) templates.
+        """
+        with self._lock:
+            labels, vectors = self._data
+            self._data = (numpy.append(labels, [char for char, _ in templates]),
+                          numpy.vstack([vectors] + [glyph for _, glyph in templates]))
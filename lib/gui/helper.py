@@ -198,7 +198,7 @@ def screen_to_gui_image(screen):
     :rtype: PyQt5.QtGui.QPixmap.QPixmap
     """
     height, width, channel = screen.shape
-    return QPixmap(QImage(screen.data, width, height, 3 * width, QImage.Format_RGB888))
+    return QPixmap(QImage(screen.data, width, height, screen.strides[0], QImage.Format_RGB888))
 
 
 def reset_emulator_and_logger(game):
@@ -217,8 +217,8 @@ def reset_emulator_and_logger(game):
                 name = func.__name__ if not func.__closure__ else func.__closure__[0].cell_contents.__module__
                 logging.get_logger(name).error(f"Can't find NoxWindow with name {game.emulator.name}.")
                 return
-            # Screen will never unlock itself inside side-process
-            game.emulator.screen_locked = False
+            # Read frames captured by GUI process instead of capturing them in side-process
+            game.emulator.attach_shared_frames()
             # Clear `screen_elements` from EmulatorImageSource if it exists
             if hasattr(game.emulator, 'screen_elements') and game.emulator.screen_elements is not None:
                 game.emulator.screen_elements[:] = []
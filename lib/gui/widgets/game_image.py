@@ -1,6 +1,4 @@
-﻿import gc
-
-from PyQt5.QtCore import Qt
+﻿from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QSizePolicy
 
 import lib.logger as logging
@@ -41,7 +39,6 @@ class ScreenImageLabel(Timer):
         scale_pix_map = pix_map.scaled(self.widget.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
         self.scaled_width, self.scaled_height = scale_pix_map.width(), scale_pix_map.height()
         self.widget.setPixmap(scale_pix_map)
-        gc.collect()  # Temp images easily can take over 500 MB of RAM
 
     def screen_click_event(self, event):
         """Click event on screen image."""
@@ -10,6 +10,7 @@ import lib.gui.designes.main_window as design
 import lib.logger as logging
 from lib.emulators.bluestacks import BlueStacks
 from lib.emulators.nox_player import NoxPlayer
+from lib.emulators.shared_frames import SharedFrameRing, SharedFrameProducer
 from lib.functions import bgr_to_rgb
 from lib.game import ui
 from lib.game.battle_bot import BattleBot
@@ -236,6 +237,13 @@ class MainWindow(QMainWindow, design.Ui_MainWindow):
                                              "[Unavailable (check logs)]")
             self.restart_game_button = None
         self.game = Game(self.emulator)
+        self.shared_frames_producer = None
+        if self.emulator.initialized:
+            self.emulator.shared_frames = SharedFrameRing.create(width=self.emulator.width,
+                                                                 height=self.emulator.height)
+            self.shared_frames_producer = SharedFrameProducer(ring=self.emulator.shared_frames,
+                                                              frame_broker=self.emulator.frame_broker)
+            self.shared_frames_producer.start()
         self.manager = SyncManager()
         self.manager.start()
         self.game._modes = self.manager.dict()
@@ -281,6 +289,10 @@ class MainWindow(QMainWindow, design.Ui_MainWindow):
         self.settings.setValue("MainWindow/size", self.size())
         self.settings.setValue("MainWindow/isMaximized", self.isMaximized())
         self.settings.setValue("MainWindow/pos", self.pos())
+        if self.shared_frames_producer:
+            self.shared_frames_producer.stop()
+            self.shared_frames_producer.ring.close()
+            self.emulator.shared_frames = None
 
     def create_blockable_button(self, button):
         """Creates button that blocks others."""
@@ -0,0 +1,149 @@
+from threading import Lock
+
+import cv2
+import numpy
+
+from lib.region_cache import RegionCache
+
+INK_SIGNATURE_COLUMNS = 32  # Bins of column projection profile
+INK_SIGNATURE_ROWS = 8  # Bins of row projection profile
+INK_SIGNATURE_MIN_SAMPLES = 3  # Min number of learned signatures before regions can be rejected by them
+INK_SIGNATURE_MAX_SAMPLES = 8  # Max number of learned signatures of UI element
+INK_SIGNATURE_TOLERANCE = 0.1  # Max distance to the nearest learned signature for region to be accepted
+
+
+def get_ink_signature(image, threshold):
+    """Gets ink signature of the region: how its text looks like after thresholding.
+    Signature consists of foreground pixels ratio, bounding box of foreground and row/column projection profiles,
+    all of them are normalized by region's size, so signature doesn't depend on screen's resolution.
+
+    :param numpy.ndarray image: image of the region.
+    :param int threshold: threshold of gray-scale for grabbing image's text.
+
+    :return: signature's vector or None if region doesn't have any ink.
+    :rtype: numpy.ndarray | None
+    """
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    _, binary = cv2.threshold(gray, threshold, 255, cv2.THRESH_BINARY)
+    points = cv2.findNonZero(binary)
+    if points is None:
+        return None
+    height, width = binary.shape
+    x, y, box_width, box_height = cv2.boundingRect(points)
+    profiles = cv2.resize(binary, (INK_SIGNATURE_COLUMNS, INK_SIGNATURE_ROWS), interpolation=cv2.INTER_AREA) / 255
+    return numpy.concatenate(((len(points) / binary.size,),
+                              (x / width, y / height, (x + box_width) / width, (y + box_height) / height),
+                              profiles.mean(axis=0), profiles.mean(axis=1)))
+
+
+class InkSignatures:
+    """Class for rejecting UI elements' regions without OCR by ink signatures of their expected text.
+    Signatures are learned from regions where text was recognized. Region without any ink is always rejected.
+
+    Region which signature is far from all learned ones is rejected only if it's unchanged since OCR confirmed
+    that it doesn't have expected text (see `learn_negative`), otherwise it's passed to OCR right away,
+    so new appearance of the text (other rendering, resolution, localization) is never rejected and can be learned.
+    When element has `max_samples` signatures, the oldest one is replaced by newly learned one.
+    Signatures can be checked and learned from multiple threads."""
+
+    def __init__(self, tolerance=INK_SIGNATURE_TOLERANCE, min_samples=INK_SIGNATURE_MIN_SAMPLES,
+                 max_samples=INK_SIGNATURE_MAX_SAMPLES):
+        """Class initialization.
+
+        :param float tolerance: max distance to the nearest learned signature for region to be accepted.
+        :param int min_samples: min number of learned signatures before regions can be rejected by them.
+        :param int max_samples: max number of learned signatures of UI element.
+        """
+        self.tolerance = tolerance
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.rejected, self.accepted = 0, 0
+        self._signatures = {}
+        self._negatives = RegionCache()  # Last region of each element where OCR didn't find its text
+        self._lock = Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    @staticmethod
+    def get_key(ui_element):
+        """Gets key of UI element's signatures.
+
+        :param lib.game.ui.UIElement ui_element: UI element.
+
+        :rtype: tuple
+        """
+        return ui_element.name, ui_element.text, tuple(ui_element.text_rect), ui_element.text_threshold
+
+    @staticmethod
+    def get_distance(signature, other_signatures):
+        """Gets distance from signature to the nearest of other signatures.
+
+        :param numpy.ndarray signature: signature.
+        :param numpy.ndarray other_signatures: array of signatures.
+
+        :rtype: float
+        """
+        return float(numpy.abs(other_signatures - signature).sum(axis=1).min() /
+                     (INK_SIGNATURE_COLUMNS + INK_SIGNATURE_ROWS))
+
+    def is_rejected(self, ui_element, image):
+        """Checks if region can't contain UI element's text.
+
+        :param lib.game.ui.UIElement ui_element: UI element.
+        :param numpy.ndarray image: image of the region.
+
+        :rtype: bool
+        """
+        if not ui_element.text or ui_element.color_to_convert:
+            return False
+        signature = get_ink_signature(image, ui_element.text_threshold)
+        key = self.get_key(ui_element)
+        with self._lock:
+            samples = self._signatures.get(key)
+        is_rejected = signature is None or \
+            samples is not None and len(samples) >= self.min_samples and \
+            self.get_distance(signature, samples) > self.tolerance and \
+            self._negatives.get(key, image) is not RegionCache.MISS
+        with self._lock:
+            if is_rejected:
+                self.rejected += 1
+            else:
+                self.accepted += 1
+        return is_rejected
+
+    def learn(self, ui_element, image):
+        """Learns signature of region where UI element's text was recognized.
+
+        :param lib.game.ui.UIElement ui_element: UI element.
+        :param numpy.ndarray image: image of the region.
+        """
+        if not ui_element.text or ui_element.color_to_convert:
+            return
+        signature = get_ink_signature(image, ui_element.text_threshold)
+        if signature is None:
+            return
+        key = self.get_key(ui_element)
+        with self._lock:
+            samples = self._signatures.get(key)
+            if samples is None:
+                self._signatures[key] = signature[numpy.newaxis]
+            elif self.get_distance(signature, samples) > 0:
+                self._signatures[key] = numpy.vstack((samples[1 - self.max_samples:]
+                                                      if len(samples) >= self.max_samples else samples, signature))
+
+    def learn_negative(self, ui_element, image):
+        """Learns region where OCR didn't find UI element's text: while it stays unchanged, it can be rejected.
+
+        :param lib.game.ui.UIElement ui_element: UI element.
+        :param numpy.ndarray image: image of the region.
+        """
+        if not ui_element.text or ui_element.color_to_convert:
+            return
+        self._negatives.set(self.get_key(ui_element), image, True)
@@ -0,0 +1,79 @@
+class OCRResult(str):
+    """Recognized text with recognition's details. Behaves as plain string, so it can be used wherever text is used.
+
+    Details:
+        - `confidence` is mean confidence of recognized words (0-100) or None if backend doesn't provide it;
+        - `alternatives` is list of alternatives of each recognized character: list of (char, confidence)
+          sorted by confidence or None if they weren't requested.
+    """
+
+    def __new__(cls, text, confidence=None, alternatives=None):
+        """Creates recognized text.
+
+        :param str text: recognized text.
+        :param float confidence: mean confidence of recognized words (0-100).
+        :param list[list[tuple[str, float]]] alternatives: alternatives of each recognized character.
+        """
+        result = super().__new__(cls, text)
+        result.confidence = confidence
+        result.alternatives = alternatives
+        return result
+
+    def __reduce__(self):
+        return self.__class__, (str(self), self.confidence, self.alternatives)
+
+
+class OCRBackend:
+    """Base class for OCR backends.
+    Backend recognizes thresholded images and must be safe to call from multiple threads."""
+
+    name = None  # type: str
+
+    def image_to_string(self, image, whitelist=None, page_segmentation=3):
+        """Retrieves text from image.
+
+        :param numpy.ndarray image: image.
+        :param str whitelist: whitelist characters.
+        :param int page_segmentation: page segmentation mode.
+
+        :rtype: str
+        """
+        raise NotImplementedError
+
+    def image_regions_to_strings(self, image, rects, whitelist=None, page_segmentation=3):
+        """Retrieves texts from multiple regions of image.
+        Backends that can recognize regions of single uploaded image should override it, by default regions
+        are cropped and recognized one by one.
+
+        :param numpy.ndarray image: image.
+        :param list[tuple[int, int, int, int]] rects: list of (left, top, width, height) regions of the image.
+        :param str whitelist: whitelist characters.
+        :param int page_segmentation: page segmentation mode.
+
+        :return: list of texts in order of regions.
+        :rtype: list[str]
+        """
+        return [self.image_to_string(image[top:top + height, left:left + width], whitelist=whitelist,
+                                     page_segmentation=page_segmentation)
+                for left, top, width, height in rects]
+
+    def image_to_result(self, image, whitelist=None, page_segmentation=3, alternatives=False):
+        """Retrieves text from image with recognition's details.
+        Backends that know confidence of recognition should override it.
+
+        :param numpy.ndarray image: image.
+        :param str whitelist: whitelist characters.
+        :param int page_segmentation: page segmentation mode.
+        :param bool alternatives: get alternatives of each recognized character or not.
+
+        :rtype: OCRResult
+        """
+        return OCRResult(self.image_to_string(image, whitelist=whitelist, page_segmentation=page_segmentation))
+
+    @property
+    def metrics(self):
+        """Metrics of the backend.
+
+        :rtype: dict
+        """
+        return {}
@@ -0,0 +1,110 @@
+import hashlib
+import sys
+from collections import OrderedDict
+from threading import Lock
+
+import numpy
+
+OCR_CACHE_MAX_ENTRIES = 1024  # Max number of memoized OCR results
+OCR_CACHE_MAX_BYTES = 1024 * 1024  # Max memory (in bytes) of memoized OCR results
+
+
+class OCRCache:
+    """Class for memoizing OCR results by content of recognized image.
+    Key is a hash of thresholded image and recognition parameters, so the same pixels aren't recognized twice.
+    Cache is bounded by number of entries and by memory, least recently used results are evicted first."""
+
+    def __init__(self, max_entries=OCR_CACHE_MAX_ENTRIES, max_bytes=OCR_CACHE_MAX_BYTES):
+        """Class initialization.
+
+        :param int max_entries: max number of memoized results.
+        :param int max_bytes: max memory (in bytes) of memoized results.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits, self.misses, self.evictions = 0, 0, 0
+        self.size_bytes = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def hit_rate(self):
+        """Ratio of results that were taken from cache.
+
+        :rtype: float
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """Clears all memoized results and statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits, self.misses, self.evictions = 0, 0, 0
+            self.size_bytes = 0
+
+    @staticmethod
+    def get_key(image, whitelist, page_segmentation, language, backend=None):
+        """Gets key of recognition.
+
+        :param numpy.ndarray image: thresholded image.
+        :param str whitelist: whitelist characters.
+        :param int page_segmentation: page segmentation mode.
+        :param str language: OCR language.
+        :param str backend: name of OCR backend.
+
+        :rtype: tuple
+        """
+        digest = hashlib.blake2b(numpy.ascontiguousarray(image), digest_size=16).digest()
+        return digest, image.shape, whitelist, page_segmentation, language, backend
+
+    @staticmethod
+    def _get_entry_size(key, text):
+        """Gets approximate memory size of cache's entry.
+
+        :param tuple key: key of recognition.
+        :param str text: recognized text.
+
+        :rtype: int
+        """
+        return sys.getsizeof(key) + sys.getsizeof(key[0]) + sys.getsizeof(text)
+
+    def get(self, key):
+        """Gets memoized OCR result.
+
+        :param tuple key: key of recognition from `get_key`.
+
+        :return: recognized text or None if image wasn't recognized before.
+        :rtype: str | None
+        """
+        with self._lock:
+            text = self._entries.get(key)
+            if text is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return text
+
+    def set(self, key, text):
+        """Memoizes OCR result. Evicts least recently used results if cache is over its limits.
+
+        :param tuple key: key of recognition from `get_key`.
+        :param str text: recognized text.
+        """
+        size = self._get_entry_size(key, text)
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        with self._lock:
+            previous_text = self._entries.pop(key, None)
+            if previous_text is not None:
+                self.size_bytes -= self._get_entry_size(key, previous_text)
+            self._entries[key] = text
+            self.size_bytes += size
+            while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+                old_key, old_text = self._entries.popitem(last=False)
+                self.size_bytes -= self._get_entry_size(old_key, old_text)
+                self.evictions += 1
@@ -0,0 +1,89 @@
+from threading import Lock
+
+import cv2
+
+REGION_PIXEL_TOLERANCE = 8  # Difference of pixel's channel that is considered as noise
+REGION_CHANGED_PIXELS_RATIO = 0.002  # Ratio of changed pixels after which region is considered as changed
+
+
+class RegionCache:
+    """Class for memoizing recognition results of screen regions.
+    Result is reused while region's pixels stay the same (within tolerance) as pixels of the last recognized crop.
+    Cache can be used from multiple threads (see `AndroidEmulator.get_screen_texts`)."""
+
+    MISS = object()
+
+    def __init__(self, pixel_tolerance=REGION_PIXEL_TOLERANCE, changed_pixels_ratio=REGION_CHANGED_PIXELS_RATIO):
+        """Class initialization.
+
+        :param int pixel_tolerance: difference of pixel's channel that is considered as noise.
+        :param float changed_pixels_ratio: ratio of changed pixels after which region is considered as changed.
+        """
+        self.pixel_tolerance = pixel_tolerance
+        self.changed_pixels_ratio = changed_pixels_ratio
+        self.hits, self.misses = 0, 0
+        self._entries = {}
+        self._lock = Lock()
+
+    def __getstate__(self):
+        return {"pixel_tolerance": self.pixel_tolerance, "changed_pixels_ratio": self.changed_pixels_ratio}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    @property
+    def hit_rate(self):
+        """Ratio of results that were taken from cache.
+
+        :rtype: float
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """Clears all memoized results and statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits, self.misses = 0, 0
+
+    def is_region_changed(self, image, previous_image):
+        """Checks if region was changed since previous recognition.
+
+        :param numpy.ndarray image: current crop of the region.
+        :param numpy.ndarray previous_image: crop of the region at previous recognition.
+
+        :rtype: bool
+        """
+        if image.shape != previous_image.shape:
+            return True
+        diff = cv2.absdiff(image, previous_image)
+        changed_pixels = cv2.countNonZero((diff.max(axis=2) if diff.ndim == 3 else diff) > self.pixel_tolerance)
+        return changed_pixels > self.changed_pixels_ratio * image.shape[0] * image.shape[1]
+
+    def get(self, key, image):
+        """Gets memoized result for the region.
+
+        :param tuple key: key of recognition (UI element's name, rectangle and recognition parameters).
+        :param numpy.ndarray image: current crop of the region.
+
+        :return: memoized result or `RegionCache.MISS` if region was changed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        is_hit = entry is not None and not self.is_region_changed(image, entry[0])
+        with self._lock:
+            if is_hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry[1] if is_hit else self.MISS
+
+    def set(self, key, image, result):
+        """Memoizes result of the region's recognition.
+
+        :param tuple key: key of recognition (UI element's name, rectangle and recognition parameters).
+        :param numpy.ndarray image: crop of the region that was recognized.
+        :param result: result of the recognition.
+        """
+        with self._lock:
+            self._entries[key] = (image.copy(), result)
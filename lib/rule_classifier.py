@@ -0,0 +1,166 @@
+import re
+from collections import defaultdict
+
+RULE_MAX_ERRORS = 3  # Number of errors in the form of inserted, deleted or substituted characters in phrase
+WHITESPACE_PATTERN = re.compile(r"\s")
+# Fuzzy pattern of `regex` module: "(PHRASE){e<=N}.*", errors part is optional
+FUZZY_PATTERN = re.compile(r"\((?P<phrase>.+)\)(?:\{e<=(?P<errors>\d+)\})?\.\*")
+
+
+class RuleClassifier:
+    """Class for classifying recognized text by fuzzy phrases of multiple rules in single pass.
+
+    Phrases of all rules are compiled once into single bit-vector (each phrase is a segment of it)
+    and text is scanned once by bit-parallel edit distance algorithm (Myers) for all phrases at the same time.
+    Additions are made per segment, so neighbour phrases don't affect each other.
+    Number of errors is the same as in fuzzy matching of `regex` module (`(phrase){e<=N}`):
+    phrase can be anywhere in the text or only in the beginning of it (as `regex.match`).
+
+    The best rule is the one with the most matched characters, so more specific phrase wins over its part
+    ("Universal-type Villains have..." over "Villains have...").
+    """
+
+    def __init__(self, max_errors=RULE_MAX_ERRORS, anywhere=False):
+        """Class initialization.
+
+        :param int max_errors: default number of errors that phrase can have in the text.
+        :param bool anywhere: phrase can be anywhere in the text or only in the beginning of it.
+        """
+        self.max_errors = max_errors
+        self.anywhere = anywhere
+        self._rules = []
+        self._compiled = None
+
+    def __len__(self):
+        return len(self._rules)
+
+    @staticmethod
+    def normalize(text):
+        """Normalizes text for matching: uppercase, spaces instead of line breaks and other whitespaces.
+
+        :param str text: text.
+
+        :rtype: str
+        """
+        return WHITESPACE_PATTERN.sub(" ", text.upper())
+
+    def add_rule(self, label, phrase, max_errors=None):
+        """Adds rule.
+
+        :param object label: label that is returned when text matches the rule.
+        :param str phrase: phrase of the rule.
+        :param int max_errors: number of errors that phrase can have in the text; default if not given.
+        """
+        phrase = self.normalize(phrase)
+        if not phrase.strip():
+            raise ValueError(f"Rule {label} has empty phrase.")
+        rule = (label, phrase, self.max_errors if max_errors is None else max_errors)
+        if rule not in self._rules:
+            self._rules.append(rule)
+            self._compiled = None
+
+    def add_pattern(self, pattern):
+        """Adds rules from fuzzy pattern of `regex` module. Multi-line pattern adds rule for each line.
+        Label of the rule is the pattern of its line.
+
+        :param str pattern: fuzzy pattern, for example: "(PHYSICAL ATTACK){e<=3}.*\\n(HP).*".
+
+        :return: labels of pattern's lines.
+        :rtype: list[str]
+        """
+        labels = []
+        for line_pattern in pattern.split("\\n"):
+            match = FUZZY_PATTERN.fullmatch(line_pattern)
+            if not match:
+                raise ValueError(f"Unsupported fuzzy pattern: {line_pattern}")
+            errors = int(match.group("errors")) if match.group("errors") else 0
+            self.add_rule(label=line_pattern, phrase=match.group("phrase"), max_errors=errors)
+            labels.append(line_pattern)
+        return labels
+
+    def _compile(self):
+        """Compiles phrases of all rules into single bit-vector.
+
+        :return: masks of characters' positions, masks of the first and the last bits of phrases, mask of all bits.
+        :rtype: tuple[dict[str, int], int, int, int]
+        """
+        if self._compiled is None:
+            chars_masks, first_bits, last_bits, offset = defaultdict(int), 0, 0, 0
+            for _, phrase, _ in self._rules:
+                for position, char in enumerate(phrase):
+                    chars_masks[char] |= 1 << (offset + position)
+                first_bits |= 1 << offset
+                offset += len(phrase)
+                last_bits |= 1 << (offset - 1)
+            self._compiled = dict(chars_masks), first_bits, last_bits, (1 << offset) - 1
+        return self._compiled
+
+    def get_errors(self, text):
+        """Gets number of errors of every rule's phrase in the text.
+
+        :param str text: text.
+
+        :return: list of errors in order of rules.
+        :rtype: list[int]
+        """
+        chars_masks, first_bits, last_bits, all_bits = self._compile()
+        not_last_bits, not_first_bits = all_bits & ~last_bits, all_bits & ~first_bits
+        # Horizontal delta in the first row: 0 if phrase can start anywhere, +1 if only in the beginning
+        first_row_delta = 0 if self.anywhere else first_bits
+        positive_vertical, negative_vertical = all_bits, 0
+        last_row_deltas = []
+        for char in self.normalize(text):
+            equal = chars_masks.get(char, 0)
+            vertical = equal | negative_vertical
+            matched = equal & positive_vertical
+            added = ((matched & not_last_bits) + (positive_vertical & not_last_bits)) ^ \
+                ((matched ^ positive_vertical) & last_bits)
+            horizontal = (added ^ positive_vertical) | equal
+            positive_horizontal = negative_vertical | (all_bits & ~(horizontal | positive_vertical))
+            negative_horizontal = positive_vertical & horizontal
+            last_row_deltas.append((positive_horizontal & last_bits, negative_horizontal & last_bits))
+            positive_horizontal = ((positive_horizontal << 1) & not_first_bits) | first_row_delta
+            negative_horizontal = (negative_horizontal << 1) & not_first_bits
+            positive_vertical = negative_horizontal | (all_bits & ~(vertical | positive_horizontal))
+            negative_vertical = positive_horizontal & vertical
+        errors, offset = [], 0
+        for _, phrase, _ in self._rules:
+            offset += len(phrase)
+            last_bit = 1 << (offset - 1)
+            score = min_score = len(phrase)
+            for positive_delta, negative_delta in last_row_deltas:
+                if positive_delta & last_bit:
+                    score += 1
+                elif negative_delta & last_bit:
+                    score -= 1
+                    min_score = min(min_score, score)
+            errors.append(min_score)
+        return errors
+
+    def get_matched(self, text):
+        """Gets labels of all rules which phrases match the text with their own number of errors.
+
+        :param str text: text.
+
+        :rtype: set[object]
+        """
+        if not self._rules or not text:
+            return set()
+        return {label for (label, _, max_errors), errors in zip(self._rules, self.get_errors(text))
+                if errors <= max_errors}
+
+    def classify(self, text):
+        """Classifies the text by the best matched rule.
+
+        :param str text: text.
+
+        :return: label of the best rule and its confidence or (None, 0.0) if text doesn't match any rule.
+        :rtype: tuple[object, float]
+        """
+        if not self._rules or not text:
+            return None, 0.0
+        best_label, best_confidence, best_matched = None, 0.0, 0
+        for (label, phrase, max_errors), errors in zip(self._rules, self.get_errors(text)):
+            if errors <= max_errors and len(phrase) - errors > best_matched:
+                best_label, best_confidence, best_matched = label, 1 - errors / len(phrase), len(phrase) - errors
+        return best_label, best_confidence
@@ -0,0 +1,247 @@
+from threading import Lock
+
+import cv2
+import numpy
+
+SCREEN_FINGERPRINT_COLUMNS = 8  # Columns of cells of region's fingerprint
+SCREEN_FINGERPRINT_ROWS = 4  # Rows of cells of region's fingerprint
+SCREEN_FINGERPRINT_TOLERANCE = 0.1  # Max distance to the nearest fingerprint of element for it to be likely on screen
+SCREEN_FINGERPRINT_MAX_SAMPLES = 8  # Max number of learned fingerprints of UI element
+
+
+def get_cells_bounds(rect, width, height):
+    """Gets bounds of fingerprint's cells of rectangle's region in pixels.
+
+    :param tuple[float, float, float, float] | lib.game.ui.Rect rect: rectangle of region.
+    :param int width: width of the image.
+    :param int height: height of the image.
+
+    :return: bounds of cells' columns and rows.
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+    columns = numpy.linspace(rect[0] * width, rect[2] * width, SCREEN_FINGERPRINT_COLUMNS + 1)
+    rows = numpy.linspace(rect[1] * height, rect[3] * height, SCREEN_FINGERPRINT_ROWS + 1)
+    return numpy.clip(numpy.round(columns), 0, width).astype(int), numpy.clip(numpy.round(rows), 0, height).astype(int)
+
+
+def get_cells_means(integral, columns, rows):
+    """Gets mean gray-scale level of fingerprint's cells of multiple regions at once.
+
+    :param numpy.ndarray integral: integral image of gray-scale image (see `cv2.integral`).
+    :param numpy.ndarray columns: bounds of cells' columns of every region, shape is (regions, columns + 1).
+    :param numpy.ndarray rows: bounds of cells' rows of every region, shape is (regions, rows + 1).
+
+    :return: fingerprints of regions, shape is (regions, rows * columns).
+    :rtype: numpy.ndarray
+    """
+    left, right = columns[:, numpy.newaxis, :-1], columns[:, numpy.newaxis, 1:]
+    top, bottom = rows[:, :-1, numpy.newaxis], rows[:, 1:, numpy.newaxis]
+    sums = integral[bottom, right] - integral[top, right] - integral[bottom, left] + integral[top, left]
+    areas = numpy.maximum((right - left) * (bottom - top), 1)
+    return (sums / (areas * 255.0)).reshape(len(columns), -1)
+
+
+def get_fingerprint(image):
+    """Gets fingerprint of region's image: mean gray-scale level (0-1) of each cell of the grid over the region.
+    Fingerprint doesn't depend on screen's resolution.
+
+    :param numpy.ndarray image: image of the region.
+
+    :return: fingerprint's vector or None if image is empty.
+    :rtype: numpy.ndarray | None
+    """
+    if not image.size:
+        return None
+    # RGB images are converted with BGR weights as everywhere else, so fingerprints of images and screens match
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+    height, width = gray.shape
+    columns, rows = get_cells_bounds((0, 0, 1, 1), width, height)
+    return get_cells_means(cv2.integral(gray), columns[numpy.newaxis], rows[numpy.newaxis])[0]
+
+
+class ScreenClassifier:
+    """Class for finding UI elements that are likely on screen in single pass over the screen.
+    Each UI element has fingerprints of its region: fingerprint of element's image
+    and fingerprints learned from regions where element was confirmed (by OCR or by image similarity).
+    Fingerprints of all elements are calculated from one integral image of the screen and compared with
+    learned ones at once, so likely elements can be confirmed first.
+
+    Element without fingerprints is always likely on screen. Unlikely elements aren't dropped, they are only
+    confirmed after others: fingerprints can't prove that element isn't on screen (its region could change),
+    so every element is still confirmed and can learn new fingerprint.
+    """
+
+    def __init__(self, tolerance=SCREEN_FINGERPRINT_TOLERANCE, max_samples=SCREEN_FINGERPRINT_MAX_SAMPLES):
+        """Class initialization.
+
+        :param float tolerance: max distance to the nearest fingerprint of element for it to be likely on screen.
+        :param int max_samples: max number of learned fingerprints of UI element.
+        """
+        self.tolerance = tolerance
+        self.max_samples = max_samples
+        self.rejected, self.accepted = 0, 0
+        self._elements = {}
+        self._index = None
+        self._lock = Lock()
+
+    def __getstate__(self):
+        return {"tolerance": self.tolerance, "max_samples": self.max_samples}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __len__(self):
+        return len(self._elements)
+
+    @staticmethod
+    def get_rect(ui_element):
+        """Gets rectangle of UI element's region that identifies the element: text's or image's one.
+
+        :param lib.game.ui.UIElement ui_element: UI element.
+
+        :return: rectangle or None if element can't be identified by its region.
+        :rtype: lib.game.ui.Rect | None
+        """
+        if ui_element.text and ui_element.text_rect is not None:
+            return ui_element.text_rect
+        if ui_element.image is not None and ui_element.image_rect is not None and ui_element.search_rect is None:
+            return ui_element.image_rect
+        return None
+
+    @classmethod
+    def get_key(cls, ui_element):
+        """Gets key of UI element's fingerprints.
+
+        :param lib.game.ui.UIElement ui_element: UI element.
+
+        :return: key or None if element can't be identified by its region.
+        :rtype: tuple | None
+        """
+        rect = cls.get_rect(ui_element)
+        if rect is None:
+            return None
+        return ui_element.name, tuple(rect), ui_element.text, id(ui_element.image) if ui_element.image is not None \
+            else None
+
+    def _register(self, ui_element):
+        """Registers UI element: its fingerprints are calculated with all other registered elements.
+
+        :param lib.game.ui.UIElement ui_element: UI element.
+
+        :return: key of element or None if element can't be identified by its region.
+        :rtype: tuple | None
+        """
+        key = self.get_key(ui_element)
+        if key is not None and key not in self._elements:
+            image = ui_element.image if not ui_element.text else None
+            fingerprint = get_fingerprint(image) if image is not None else None
+            samples = fingerprint[numpy.newaxis] if fingerprint is not None else None
+            # Element keeps its image's object, so image's id in the key can't be reused while element exists
+            self._elements[key] = {"rect": tuple(self.get_rect(ui_element)), "image": ui_element.image,
+                                   "samples": samples}
+            self._index = None
+        return key
+
+    def _get_index(self, width, height):
+        """Gets index of registered elements for screen's resolution: bounds of cells and all learned fingerprints.
+
+        :param int width: screen's width.
+        :param int height: screen's height.
+
+        :rtype: dict
+        """
+        if self._index is None or self._index["size"] != (width, height):
+            keys = list(self._elements)
+            bounds = [get_cells_bounds(self._elements[key]["rect"], width, height) for key in keys]
+            samples = [self._elements[key]["samples"] for key in keys]
+            counts = [len(element_samples) if element_samples is not None else 0 for element_samples in samples]
+            samples = [element_samples for element_samples in samples if element_samples is not None]
+            self._index = {
+                "size": (width, height),
+                "positions": {key: position for position, key in enumerate(keys)},
+                "columns": numpy.array([columns for columns, _ in bounds]).reshape(len(keys), -1),
+                "rows": numpy.array([rows for _, rows in bounds]).reshape(len(keys), -1),
+                "samples": numpy.vstack(samples) if samples else None,
+                # Samples of element at position P are rows from starts[P] to starts[P + 1] of `samples`
+                "starts": numpy.concatenate(([0], numpy.cumsum(counts))).astype(int),
+            }
+        return self._index
+
+    def get_distances(self, screen, ui_elements):
+        """Gets distances from regions of UI elements on the screen to their nearest fingerprints.
+
+        :param numpy.ndarray screen: image of the whole screen.
+        :param list[lib.game.ui.UIElement] ui_elements: UI elements.
+
+        :return: keys of elements and distances (infinity if element doesn't have fingerprints).
+        :rtype: tuple[list[tuple | None], list[float]]
+        """
+        with self._lock:
+            keys = [self._register(ui_element) for ui_element in ui_elements]
+            index = self._get_index(width=screen.shape[1], height=screen.shape[0])
+        # Only fingerprints of requested elements are calculated, not of every registered one
+        starts = index["starts"]
+        positions = [position for position in sorted({index["positions"][key] for key in keys if key is not None})
+                     if starts[position + 1] > starts[position]]
+        nearest = {}
+        if positions:
+            counts = starts[numpy.add(positions, 1)] - starts[positions]
+            rows = numpy.concatenate([numpy.arange(starts[position], starts[position + 1]) for position in positions])
+            owners = numpy.repeat(positions, counts)
+            gray = cv2.cvtColor(screen, cv2.COLOR_BGR2GRAY) if screen.ndim == 3 else screen
+            fingerprints = get_cells_means(cv2.integral(gray), index["columns"][owners], index["rows"][owners])
+            distances = numpy.abs(fingerprints - index["samples"][rows]).mean(axis=1)
+            segments = numpy.concatenate(([0], numpy.cumsum(counts)[:-1]))
+            nearest = dict(zip(positions, numpy.minimum.reduceat(distances, segments).tolist()))
+        return keys, [nearest.get(index["positions"][key], numpy.inf) if key is not None else numpy.inf
+                      for key in keys]
+
+    def classify(self, screen, ui_elements):
+        """Ranks UI elements by how likely they are on screen. No element is dropped.
+
+        :param numpy.ndarray screen: image of the whole screen.
+        :param list[lib.game.ui.UIElement] ui_elements: UI elements.
+
+        :return: likely elements with their scores (0-1) sorted by score,
+            then elements without fingerprints with None score, then unlikely elements sorted by score.
+        :rtype: list[tuple[lib.game.ui.UIElement, float | None]]
+        """
+        keys, distances = self.get_distances(screen, ui_elements)
+        likely, unknown, unlikely = [], [], []
+        with self._lock:
+            for ui_element, key, distance in zip(ui_elements, keys, distances):
+                element = self._elements.get(key)
+                if element is None or element["samples"] is None:
+                    unknown.append((ui_element, None))
+                elif distance <= self.tolerance:
+                    likely.append((ui_element, 1 - distance))
+                else:
+                    unlikely.append((ui_element, max(1 - distance, 0.0)))
+            self.accepted += len(likely) + len(unknown)
+            self.rejected += len(unlikely)
+        return sorted(likely, key=lambda item: item[1], reverse=True) + unknown + \
+            sorted(unlikely, key=lambda item: item[1], reverse=True)
+
+    def learn(self, ui_element, image, rect):
+        """Learns fingerprint of region where UI element was confirmed.
+
+        :param lib.game.ui.UIElement ui_element: UI element.
+        :param numpy.ndarray image: image of the region.
+        :param lib.game.ui.Rect rect: rectangle of the region.
+        """
+        if self.get_rect(ui_element) is not rect:
+            return
+        fingerprint = get_fingerprint(image)
+        if fingerprint is None:
+            return
+        with self._lock:
+            element = self._elements[self._register(ui_element)]
+            samples = element["samples"]
+            if samples is None:
+                element["samples"] = fingerprint[numpy.newaxis]
+            elif len(samples) < self.max_samples and \
+                    numpy.abs(samples - fingerprint).mean(axis=1).min() > self.tolerance / 2:
+                element["samples"] = numpy.vstack((samples, fingerprint))
+            else:
+                return
+            self._index = None
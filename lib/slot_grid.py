@@ -0,0 +1,151 @@
+import cv2
+import numpy
+
+from lib.functions import structural_similarity as default_structural_similarity
+from lib.template_store import TemplateStore
+
+
+def get_crop_bounds(rect, width, height):
+    """Gets bounds of rectangle's crop of the image in pixels (same as `AndroidEmulator.get_image_from_image`).
+
+    :param tuple[float, float, float, float] | lib.game.ui.Rect rect: rectangle.
+    :param int width: width of the image.
+    :param int height: height of the image.
+
+    :return: left, top, right and bottom bounds.
+    :rtype: tuple[int, int, int, int]
+    """
+    x1, x2 = (min(max(round(value * width), 0), width) for value in (rect[0], rect[2]))
+    y1, y2 = (min(max(round(value * height), 0), height) for value in (rect[1], rect[3]))
+    return x1, y1, max(x2, x1), max(y2, y1)
+
+
+def get_regions_means(integral, left, top, right, bottom):
+    """Gets mean values of multiple regions of the image at once.
+
+    :param numpy.ndarray integral: integral image (see `cv2.integral`).
+    :param numpy.ndarray left: left bounds of regions.
+    :param numpy.ndarray top: top bounds of regions.
+    :param numpy.ndarray right: right bounds of regions.
+    :param numpy.ndarray bottom: bottom bounds of regions.
+
+    :return: means of regions, shape is (regions, channels) for multichannel image.
+    :rtype: numpy.ndarray
+    """
+    sums = integral[bottom, right] - integral[top, right] - integral[bottom, left] + integral[top, left]
+    areas = numpy.maximum((right - left) * (bottom - top), 1)
+    return sums / (areas.reshape(-1, 1) if sums.ndim > 1 else areas)
+
+
+class GridSlot:
+    """Class for state of the slot of the grid."""
+
+    def __init__(self, ui_element, row, col, similarity, empty, color):
+        """Class initialization.
+
+        :param lib.game.ui.UIElement ui_element: UI element of the slot.
+        :param int row: row of the slot (from 1, top to bottom).
+        :param int col: column of the slot (from 1, left to right).
+        :param float similarity: similarity of the slot with the image of empty slot.
+        :param bool empty: is slot empty or not.
+        :param tuple[int, int, int] color: mean (r,g,b) color of the slot.
+        """
+        self.ui_element = ui_element
+        self.row = row
+        self.col = col
+        self.similarity = similarity
+        self.empty = empty
+        self.color = color
+
+    def __repr__(self):
+        return f"GridSlot({self.ui_element.name}, row={self.row}, col={self.col}, empty={self.empty}, " \
+               f"similarity={self.similarity:.3f}, color={self.color})"
+
+
+class SlotGrid:
+    """Class for analyzing all slots of the grid (inventory, shop) in single pass over the screen.
+    Each slot is UI element which image is the image of empty slot, so slot is empty if its `image_rect` crop
+    is similar to the image with the same threshold as in `AndroidEmulator.is_image_on_screen`.
+
+    Crops of all slots are placed side by side into one mosaic and images of empty slots (scaled to sizes of crops)
+    into another one, so structural similarity of all slots is calculated by one set of box filters.
+    Mosaic of images and its statistics are made once for screen's resolution. Windows of filter that cross
+    neighbour slots are inside of ignored border of each slot, so similarities are the same as of separate checks.
+    Mean color of each slot is calculated from the same mosaic, so items can be told apart by color of their frames.
+    """
+
+    def __init__(self, slots, structural_similarity=None):
+        """Class initialization.
+
+        :param list[list[lib.game.ui.UIElement]] slots: rows of UI elements of slots from top left to bottom right.
+        :param lib.ssim.StructuralSimilarity structural_similarity: calculator of similarity, shared one if not given.
+        """
+        self.slots = [(ui_element, row, col) for row, row_slots in enumerate(slots, start=1)
+                      for col, ui_element in enumerate(row_slots, start=1)]
+        if any(ui_element.image is None or ui_element.image_rect is None for ui_element, _, _ in self.slots):
+            raise ValueError("Every slot of the grid must have image of empty slot and its rectangle.")
+        self.structural_similarity = structural_similarity or default_structural_similarity
+        self._layout = None
+
+    def __len__(self):
+        return len(self.slots)
+
+    def _get_layout(self, width, height):
+        """Gets layout of slots' crops in mosaic for screen's resolution and mosaic of images of empty slots.
+
+        :param int width: screen's width.
+        :param int height: screen's height.
+
+        :rtype: dict
+        """
+        if self._layout is None or self._layout["size"] != (width, height):
+            bounds = [get_crop_bounds(ui_element.image_rect, width, height) for ui_element, _, _ in self.slots]
+            sizes = numpy.array([(x2 - x1, y2 - y1) for x1, y1, x2, y2 in bounds], dtype=int).reshape(-1, 2)
+            offsets = numpy.concatenate(([0], numpy.cumsum(sizes[:, 0])))
+            mosaic_size = int(offsets[-1]), int(sizes[:, 1].max(initial=0))
+            template = numpy.zeros((mosaic_size[1], mosaic_size[0]), dtype=numpy.uint8)
+            for (ui_element, _, _), (slot_width, slot_height), offset in zip(self.slots, sizes, offsets):
+                if slot_width and slot_height:
+                    template[:slot_height, offset:offset + slot_width] = \
+                        TemplateStore.scale(ui_element.image, (int(slot_width), int(slot_height)))
+            self._layout = {"size": (width, height), "bounds": bounds, "sizes": sizes, "offsets": offsets[:-1],
+                            "mosaic_size": mosaic_size, "template": template}
+        return self._layout
+
+    def analyze(self, screen):
+        """Analyzes all slots of the grid on the screen.
+
+        :param numpy.ndarray screen: image of the whole screen.
+
+        :return: slots from top left to bottom right.
+            Slot which crop is smaller than window of similarity is never empty.
+        :rtype: list[GridSlot]
+        """
+        layout = self._get_layout(width=screen.shape[1], height=screen.shape[0])
+        mosaic_width, mosaic_height = layout["mosaic_size"]
+        window = self.structural_similarity.window_size
+        if mosaic_width < window or mosaic_height < window:
+            return [GridSlot(ui_element, row, col, 0.0, False, (0, 0, 0)) for ui_element, row, col in self.slots]
+
+        mosaic = numpy.zeros((mosaic_height, mosaic_width) + screen.shape[2:], dtype=screen.dtype)
+        for (x1, y1, x2, y2), offset in zip(layout["bounds"], layout["offsets"]):
+            mosaic[:y2 - y1, offset:offset + x2 - x1] = screen[y1:y2, x1:x2]
+        similarity, _, _ = self.structural_similarity.get_similarity_map(mosaic, layout["template"])
+
+        # Ignore border of window's radius of each slot as in `StructuralSimilarity.compare`
+        pad = (window - 1) // 2
+        widths, heights = layout["sizes"][:, 0], layout["sizes"][:, 1]
+        valid = (widths >= window) & (heights >= window)
+        left, top = layout["offsets"] + pad, numpy.full(len(self.slots), pad)
+        right, bottom = numpy.maximum(left + widths - 2 * pad, left), numpy.maximum(top + heights - 2 * pad, top)
+        similarities = get_regions_means(cv2.integral(similarity), left, top, right, bottom)
+        colors = get_regions_means(cv2.integral(mosaic), layout["offsets"], numpy.zeros_like(top),
+                                   layout["offsets"] + widths, heights)
+
+        result = []
+        for (ui_element, row, col), is_valid, slot_similarity, color in zip(self.slots, valid, similarities, colors):
+            slot_similarity = float(slot_similarity) if is_valid else 0.0
+            color = tuple(int(round(value)) for value in numpy.atleast_1d(color))
+            result.append(GridSlot(ui_element=ui_element, row=row, col=col, similarity=slot_similarity,
+                                   empty=slot_similarity > ui_element.image_threshold, color=color))
+        return result
@@ -0,0 +1,139 @@
+from collections import OrderedDict
+from threading import Lock
+
+import cv2
+import numpy
+
+SSIM_WINDOW_SIZE = 7  # Side of sliding window
+SSIM_K1 = 0.01  # Constant of luminance term
+SSIM_K2 = 0.03  # Constant of contrast-structure term
+SSIM_DATA_RANGE = 255  # Range of gray-scale image's values
+SSIM_MAX_TEMPLATES = 256  # Max number of templates' sizes with cached statistics
+
+
+class StructuralSimilarity:
+    """Class for calculating mean structural similarity (SSIM) of image and template.
+    Gives the same scores as `compare_ssim` of scikit-image with default parameters (uniform 7x7 window,
+    sample covariance, border of window's radius is ignored) but uses box filters of OpenCV.
+
+    Statistics of template (gray-scale image, mean and variance fields) are calculated once for each size
+    of template and cached, so only statistics of the image and covariance are calculated on every call.
+    Template is identified by its object, so it must not be changed in place after first comparison.
+    """
+
+    def __init__(self, window_size=SSIM_WINDOW_SIZE, max_templates=SSIM_MAX_TEMPLATES):
+        """Class initialization.
+
+        :param int window_size: side of sliding window, must be odd and greater than 1.
+        :param int max_templates: max number of templates' sizes with cached statistics.
+        """
+        if window_size < 3 or window_size % 2 != 1:
+            raise ValueError("Window size must be odd and greater than 1.")
+        self.window_size = window_size
+        self.max_templates = max_templates
+        self.hits, self.misses = 0, 0
+        # Sample covariance: filter normalizes by N, so variances are multiplied by N / (N - 1)
+        self._covariance_norm = window_size ** 2 / (window_size ** 2 - 1)
+        self._c1 = (SSIM_K1 * SSIM_DATA_RANGE) ** 2
+        self._c2 = (SSIM_K2 * SSIM_DATA_RANGE) ** 2
+        self._templates = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._templates)
+
+    def clear(self):
+        """Clears cached statistics of templates."""
+        with self._lock:
+            self._templates.clear()
+            self.hits, self.misses = 0, 0
+
+    def _filter(self, image):
+        """Calculates mean of the sliding window for every pixel of image.
+
+        :param numpy.ndarray image: float image.
+
+        :rtype: numpy.ndarray
+        """
+        return cv2.blur(image, (self.window_size, self.window_size), borderType=cv2.BORDER_REFLECT)
+
+    def _get_statistics(self, image, size):
+        """Gets gray-scale image resized to given size and its mean and variance fields.
+        Image that already has given size isn't resized.
+
+        :param numpy.ndarray image: RGB or gray-scale image.
+        :param tuple[int, int] size: width and height of resized image.
+
+        :return: gray-scale image, its float version, mean and variance fields.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        """
+        if image.shape[:2] != (size[1], size[0]):
+            image = cv2.resize(image, size, interpolation=cv2.INTER_CUBIC)
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        gray_float = gray.astype(numpy.float64)
+        mean = self._filter(gray_float)
+        variance = self._covariance_norm * (self._filter(gray_float * gray_float) - mean * mean)
+        return gray, gray_float, mean, variance
+
+    def get_template_statistics(self, template, size):
+        """Gets cached statistics of template of given size. Calculates them on first use.
+
+        :param numpy.ndarray template: RGB or gray-scale image of template.
+        :param tuple[int, int] size: width and height of resized template.
+
+        :return: gray-scale template, its float version, mean and variance fields.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        """
+        key = id(template), template.shape, size
+        with self._lock:
+            entry = self._templates.get(key)
+            if entry is not None and entry[0] is template:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        statistics = self._get_statistics(template, size)
+        with self._lock:
+            # Entry keeps template's object, so its id can't be reused by another image while entry exists
+            self._templates[key] = template, statistics
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+        return statistics
+
+    def get_similarity_map(self, image, template):
+        """Calculates structural similarity of image and template for every pixel.
+        Both are resized to the max width and height of them.
+
+        :param numpy.ndarray image: RGB or gray-scale image.
+        :param numpy.ndarray template: RGB or gray-scale image of template, its statistics are cached.
+
+        :return: similarity field, gray-scale image and gray-scale template.
+        :rtype: tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+        """
+        size = max(image.shape[1], template.shape[1]), max(image.shape[0], template.shape[0])
+        if min(size) < self.window_size:
+            raise ValueError("Window size exceeds image extent.")
+        template_gray, template_float, template_mean, template_variance = self.get_template_statistics(template, size)
+        image_gray, image_float, image_mean, image_variance = self._get_statistics(image, size)
+        covariance = self._covariance_norm * (self._filter(image_float * template_float) - image_mean * template_mean)
+
+        similarity = ((2 * image_mean * template_mean + self._c1) * (2 * covariance + self._c2)) / \
+                     ((image_mean * image_mean + template_mean * template_mean + self._c1) *
+                      (image_variance + template_variance + self._c2))
+        return similarity, image_gray, template_gray
+
+    def compare(self, image, template):
+        """Calculates mean structural similarity of image and template.
+        Both are resized to the max width and height of them.
+
+        :param numpy.ndarray image: RGB or gray-scale image.
+        :param numpy.ndarray template: RGB or gray-scale image of template, its statistics are cached.
+
+        :return: similarity, gray-scale image and gray-scale template.
+        :rtype: tuple[float, numpy.ndarray, numpy.ndarray]
+        """
+        similarity, image_gray, template_gray = self.get_similarity_map(image, template)
+        # Ignore border of window's radius to avoid edge effects
+        pad = (self.window_size - 1) // 2
+        height, width = similarity.shape
+        return float(similarity[pad:height - pad, pad:width - pad].mean()), image_gray, template_gray
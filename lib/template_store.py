@@ -0,0 +1,147 @@
+from collections import OrderedDict
+from threading import Lock
+
+import cv2
+
+TEMPLATE_STORE_MAX_ENTRIES = 512  # Max number of stored images: UI elements' images and captured at runtime
+
+
+class TemplateStore:
+    """Class for storing UI elements' images pre-scaled to emulator's resolution.
+    Image is converted to gray-scale and scaled to the exact size of its `image_rect` crop of the screen,
+    so image checks don't resize and convert it on every call.
+
+    When resolution changes, only images which crop's size was changed are scaled again.
+    Images assigned at runtime (skills, characters) are scaled on first use.
+    Image is identified by its object, so it must be replaced (not changed in place) to be scaled again.
+    """
+
+    def __init__(self, max_entries=TEMPLATE_STORE_MAX_ENTRIES):
+        """Class initialization.
+
+        :param int max_entries: max number of stored images.
+        """
+        self.max_entries = max_entries
+        self.width, self.height = None, None
+        self.hits, self.misses, self.rescales = 0, 0, 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __getstate__(self):
+        return {"max_entries": self.max_entries}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Clears all stored images and statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits, self.misses, self.rescales = 0, 0, 0
+
+    def get_size(self, rect):
+        """Gets size of rectangle's crop of the screen (same as `AndroidEmulator.get_image_from_image`).
+
+        :param tuple[float, float, float, float] | lib.game.ui.Rect rect: rectangle.
+
+        :return: width and height of crop.
+        :rtype: tuple[int, int]
+        """
+        x1, x2 = (min(max(round(value * self.width), 0), self.width) for value in (rect[0], rect[2]))
+        y1, y2 = (min(max(round(value * self.height), 0), self.height) for value in (rect[1], rect[3]))
+        return max(x2 - x1, 0), max(y2 - y1, 0)
+
+    @staticmethod
+    def scale(image, size):
+        """Converts image to gray-scale and scales it to given size.
+
+        :param numpy.ndarray image: RGB or gray-scale image.
+        :param tuple[int, int] size: width and height.
+
+        :rtype: numpy.ndarray
+        """
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        height, width = gray.shape
+        if (width, height) == size:
+            return gray
+        interpolation = cv2.INTER_AREA if size[0] * size[1] < width * height else cv2.INTER_CUBIC
+        return cv2.resize(gray, size, interpolation=interpolation)
+
+    def _scale_entry(self, image, rect):
+        """Scales image to the size of rectangle's crop at current resolution.
+
+        :param numpy.ndarray image: image.
+        :param tuple[float, float, float, float] rect: rectangle.
+
+        :return: size of crop and scaled image or None if resolution is unknown or crop is empty.
+        :rtype: tuple[tuple[int, int] | None, numpy.ndarray | None]
+        """
+        if self.width is None or self.height is None:
+            return None, None
+        size = self.get_size(rect)
+        if not all(size):
+            return size, None
+        return size, self.scale(image, size)
+
+    def set_resolution(self, width, height):
+        """Sets resolution of emulator's screen. Scales stored images which crop's size was changed.
+
+        :param int width: screen's width.
+        :param int height: screen's height.
+        """
+        if (width, height) == (self.width, self.height):
+            return
+        with self._lock:
+            self.width, self.height = width, height
+            for key, (image, rect, size, template) in self._entries.items():
+                if size is None or self.get_size(rect) != size:
+                    self._entries[key] = (image, rect, *self._scale_entry(image, rect))
+                    self.rescales += 1
+
+    def _get_entry(self, ui_element):
+        """Gets entry of UI element's image: creates it if image wasn't stored before.
+
+        :param lib.game.ui.UIElement ui_element: UI element.
+
+        :return: image, rectangle, size of crop and scaled image.
+        :rtype: tuple
+        """
+        image, rect = ui_element.image, tuple(ui_element.image_rect)
+        key = id(image), rect
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is image:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        # Entry keeps image's object, so its id can't be reused by another image while entry exists
+        entry = self._entries[key] = (image, rect, *self._scale_entry(image, rect))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def preload(self, ui_elements):
+        """Stores images of UI elements. Images are scaled when resolution is known.
+
+        :param collections.Iterable[lib.game.ui.UIElement] ui_elements: UI elements.
+        """
+        with self._lock:
+            for ui_element in ui_elements:
+                if ui_element.image is not None and ui_element.image_rect is not None:
+                    self._get_entry(ui_element)
+
+    def get(self, ui_element):
+        """Gets UI element's image pre-scaled to its crop of the screen.
+
+        :param lib.game.ui.UIElement ui_element: UI element.
+
+        :return: gray-scale image or None if it can't be scaled (no image or resolution is unknown).
+        :rtype: numpy.ndarray | None
+        """
+        if ui_element.image is None or ui_element.image_rect is None:
+            return None
+        with self._lock:
+            return self._get_entry(ui_element)[3]
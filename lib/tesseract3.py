@@ -2,12 +2,15 @@
 import ctypes.util
 import logging
 import os
-from multiprocessing.pool import ThreadPool
-from time import sleep
+import time
+from threading import Condition
+
+from lib.ocr_backend import OCRBackend, OCRResult
 
 TESSERACT3_LIBNAME = 'libtesseract-3.dll'
 AUTOMATIC_PAGE_SEGMENTATION = 3
 RAW_LINE_PAGE_SEGMENTATION = 13
+SYMBOL_ITERATOR_LEVEL = 4  # RIL_SYMBOL level of result iterator
 logger = logging.getLogger()
 
 
@@ -47,31 +50,74 @@ class TesseractLib(object):
         lib.TessBaseAPIEnd.argtypes = (self.TessBaseAPI,)
         lib.TessBaseAPIEnd.restype = None
 
+        lib.TessBaseAPIInit2.argtypes = (self.TessBaseAPI, ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int)
+
         lib.TessBaseAPIInit3.argtypes = (self.TessBaseAPI, ctypes.c_char_p, ctypes.c_char_p)
 
         lib.TessBaseAPISetImage.argtypes = (self.TessBaseAPI,
                                             ctypes.c_void_p, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int)
         lib.TessBaseAPISetImage.restype = None
 
+        lib.TessBaseAPISetRectangle.argtypes = (self.TessBaseAPI,
+                                                ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int)
+        lib.TessBaseAPISetRectangle.restype = None
+
         lib.TessBaseAPISetVariable.argtypes = (self.TessBaseAPI, ctypes.c_char_p, ctypes.c_char_p)
-        lib.TessBaseAPISetVariable.restype = ctypes.c_bool
+        lib.TessBaseAPISetVariable.restype = ctypes.c_int  # BOOL
 
         lib.TessBaseAPIClearAdaptiveClassifier.argtypes = (self.TessBaseAPI,)
         lib.TessBaseAPIClearAdaptiveClassifier.restype = None
 
-        lib.TessBaseAPIGetUTF8Text.restype = ctypes.c_char_p
+        # Returned text is allocated by the library and must be freed by `TessDeleteText`
+        lib.TessBaseAPIGetUTF8Text.restype = ctypes.c_void_p
         lib.TessBaseAPIGetUTF8Text.argtypes = (self.TessBaseAPI,)
 
-    def __init__(self, lib_path, data_path, language="eng"):
+        lib.TessDeleteText.argtypes = (ctypes.c_void_p,)
+        lib.TessDeleteText.restype = None
+
+        lib.TessBaseAPIMeanTextConf.argtypes = (self.TessBaseAPI,)
+        lib.TessBaseAPIMeanTextConf.restype = ctypes.c_int
+
+        lib.TessBaseAPIGetIterator.argtypes = (self.TessBaseAPI,)
+        lib.TessBaseAPIGetIterator.restype = ctypes.c_void_p
+
+        lib.TessResultIteratorDelete.argtypes = (ctypes.c_void_p,)
+        lib.TessResultIteratorDelete.restype = None
+
+        lib.TessResultIteratorNext.argtypes = (ctypes.c_void_p, ctypes.c_int)
+        lib.TessResultIteratorNext.restype = ctypes.c_int
+
+        lib.TessResultIteratorGetChoiceIterator.argtypes = (ctypes.c_void_p,)
+        lib.TessResultIteratorGetChoiceIterator.restype = ctypes.c_void_p
+
+        lib.TessChoiceIteratorDelete.argtypes = (ctypes.c_void_p,)
+        lib.TessChoiceIteratorDelete.restype = None
+
+        lib.TessChoiceIteratorNext.argtypes = (ctypes.c_void_p,)
+        lib.TessChoiceIteratorNext.restype = ctypes.c_int
+
+        # Returned text is owned by the iterator, so it isn't freed
+        lib.TessChoiceIteratorGetUTF8Text.argtypes = (ctypes.c_void_p,)
+        lib.TessChoiceIteratorGetUTF8Text.restype = ctypes.c_char_p
+
+        lib.TessChoiceIteratorConfidence.argtypes = (ctypes.c_void_p,)
+        lib.TessChoiceIteratorConfidence.restype = ctypes.c_float
+
+    def __init__(self, lib_path, data_path, language="eng", engine_mode=None):
         """Class initialization.
 
         :param str lib_path: path to Tesseract 3 library.
         :param str data_path: path to Tesseract data folder.
         :param str language: OCR language.
+        :param int engine_mode: OCR engine mode; library's default if not given.
         """
         self.setup_lib(lib_path)
         self.api = self.lib.TessBaseAPICreate()
-        if self.lib.TessBaseAPIInit3(self.api, data_path.encode(), language.encode()):
+        if engine_mode is None:
+            result = self.lib.TessBaseAPIInit3(self.api, data_path.encode(), language.encode())
+        else:
+            result = self.lib.TessBaseAPIInit2(self.api, data_path.encode(), language.encode(), engine_mode)
+        if result:
             raise TesseractError('Tesseract API initialization failed.')
         self._check_setup()
 
@@ -102,6 +148,22 @@ class TesseractLib(object):
         bytes_per_line = width * bytes_per_pixel
         self.lib.TessBaseAPISetImage(self.api, imagedata, width, height, bytes_per_pixel, bytes_per_line)
 
+    def set_rectangle(self, left, top, width, height):
+        """Restricts recognition to rectangle of the image. Previous recognition results are cleared, image isn't.
+
+        :param int left: rectangle's left coordinate.
+        :param int top: rectangle's top coordinate.
+        :param int width: rectangle's width.
+        :param int height: rectangle's height.
+        """
+        self._check_setup()
+        self.lib.TessBaseAPISetRectangle(self.api, left, top, width, height)
+
+    def clear(self):
+        """Clears image and recognition results."""
+        self._check_setup()
+        self.lib.TessBaseAPIClear(self.api)
+
     def set_variable(self, key, val):
         """Sets variable for library's parameter.
 
@@ -111,24 +173,77 @@ class TesseractLib(object):
         self._check_setup()
         self.lib.TessBaseAPISetVariable(self.api, key.encode(), val.encode())
 
-    def get_utf8_text(self):
+    def get_utf8_text(self, clear=True):
         """Returns UTF-8 text from image.
+        Adaptive classifier is cleared after each recognition, so result doesn't depend on previous recognitions.
 
-        :rtype: bytearray
+        :param bool clear: clear image after recognition or keep it for recognition of other rectangles.
+
+        :rtype: bytes | None
         """
         self._check_setup()
-        result = self.lib.TessBaseAPIGetUTF8Text(self.api)
-        self.lib.TessBaseAPIClear(self.api)
+        text_pointer = self.lib.TessBaseAPIGetUTF8Text(self.api)
+        result = None
+        if text_pointer:
+            result = ctypes.string_at(text_pointer)
+            self.lib.TessDeleteText(text_pointer)
+        if clear:
+            self.lib.TessBaseAPIClear(self.api)
         self.lib.TessBaseAPIClearAdaptiveClassifier(self.api)
         return result
 
-    def get_text(self):
+    def get_mean_confidence(self):
+        """Returns mean confidence of recognized words. Should be called after recognition before clearing.
+
+        :return: confidence from 0 to 100.
+        :rtype: int
+        """
+        self._check_setup()
+        return self.lib.TessBaseAPIMeanTextConf(self.api)
+
+    def get_alternatives(self):
+        """Returns alternatives of each recognized character. Should be called after recognition before clearing.
+
+        :return: list of (char, confidence) alternatives of each character sorted by confidence.
+        :rtype: list[list[tuple[str, float]]]
+        """
+        self._check_setup()
+        iterator = self.lib.TessBaseAPIGetIterator(self.api)
+        if not iterator:
+            return []
+        alternatives = []
+        try:
+            while True:
+                choices = []
+                choice_iterator = self.lib.TessResultIteratorGetChoiceIterator(iterator)
+                if choice_iterator:
+                    try:
+                        while True:
+                            char = self.lib.TessChoiceIteratorGetUTF8Text(choice_iterator)
+                            if char:
+                                choices.append((char.decode('utf-8'),
+                                                self.lib.TessChoiceIteratorConfidence(choice_iterator)))
+                            if not self.lib.TessChoiceIteratorNext(choice_iterator):
+                                break
+                    finally:
+                        self.lib.TessChoiceIteratorDelete(choice_iterator)
+                if choices:
+                    alternatives.append(sorted(choices, key=lambda choice: choice[1], reverse=True))
+                if not self.lib.TessResultIteratorNext(iterator, SYMBOL_ITERATOR_LEVEL):
+                    break
+        finally:
+            self.lib.TessResultIteratorDelete(iterator)
+        return alternatives
+
+    def get_text(self, clear=True):
         """Returns decoded stripped text from image.
 
+        :param bool clear: clear image after recognition or keep it for recognition of other rectangles.
+
         :rtype: str
         """
         self._check_setup()
-        result = self.get_utf8_text()
+        result = self.get_utf8_text(clear=clear)
         if result:
             return result.decode('utf-8').strip()
         return ""
@@ -137,24 +252,43 @@ class TesseractLib(object):
 class Tesseract(TesseractLib):
     """Class for working with Tesseract OCR."""
 
-    def __init__(self, lib_path, data_path, language):
+    def __init__(self, lib_path, data_path, language, engine_mode=None):
         """Class initialization.
 
         :param str lib_path: path to Tesseract 3 library.
         :param str data_path: path to Tesseract data folder.
         :param str language: OCR language.
+        :param int engine_mode: OCR engine mode; library's default if not given.
         """
-        super().__init__(lib_path=lib_path, data_path=data_path, language=language)
+        super().__init__(lib_path=lib_path, data_path=data_path, language=language, engine_mode=engine_mode)
         self.set_variable("load_system_dawg", "0")
         self.set_variable("load_freq_dawg", "0")
         self.set_variable("tessedit_oem_mode", "3")
         self.set_variable("debug_file", "/dev/null")
-        self.locked = False
+        self.whitelist = None
+        self.page_segmentation = None
+        self.configure(whitelist="", page_segmentation=AUTOMATIC_PAGE_SEGMENTATION)
+
+    @property
+    def configuration(self):
+        """Current (whitelist, page segmentation mode) configuration of the instance.
+
+        :rtype: tuple[str, int]
+        """
+        return self.whitelist, self.page_segmentation
 
-    def _set_default_params(self):
-        """Sets default parameters for recognition."""
-        self.set_whitelist(whitelist="")
-        self.set_psm(page_segmentation=AUTOMATIC_PAGE_SEGMENTATION)
+    def configure(self, whitelist, page_segmentation):
+        """Configures instance for recognition. Variables are set only if they differ from current ones.
+
+        :param str whitelist: whitelist characters.
+        :param int page_segmentation: page segmentation mode.
+        """
+        if whitelist != self.whitelist:
+            self.set_whitelist(whitelist=whitelist)
+            self.whitelist = whitelist
+        if page_segmentation != self.page_segmentation:
+            self.set_psm(page_segmentation=page_segmentation)
+            self.page_segmentation = page_segmentation
 
     def set_whitelist(self, whitelist=None):
         """Sets whitelist characters for recognition."""
@@ -170,30 +304,76 @@ class Tesseract(TesseractLib):
             assert isinstance(page_segmentation, str)
             self.set_variable("tessedit_pageseg_mode", page_segmentation)
 
-    def image_to_string(self, image, whitelist="", page_segmentation=AUTOMATIC_PAGE_SEGMENTATION):
-        """Retrieves text from image.
+    def upload_image(self, image, whitelist="", page_segmentation=AUTOMATIC_PAGE_SEGMENTATION):
+        """Configures instance and sets image for recognition.
 
         :param numpy.ndarray image: image.
         :param str whitelist: whitelist characters.
         :param int page_segmentation: page segmentation mode.
         """
-        self.locked = True
         height, width, depth = 0, 0, 1
         if len(image.shape) == 2:
             height, width = image.shape
         elif len(image.shape) == 3:
             height, width, depth = image.shape
-        self.set_whitelist(whitelist=whitelist)
-        self.set_psm(page_segmentation=page_segmentation)
+        self.configure(whitelist=whitelist if whitelist else "", page_segmentation=page_segmentation)
         self.set_image(imagedata=image.ctypes, width=width, height=height, bytes_per_pixel=depth)
-        result = self.get_text()
-        self._set_default_params()
-        self.locked = False
-        return result
 
+    def image_to_string(self, image, whitelist="", page_segmentation=AUTOMATIC_PAGE_SEGMENTATION):
+        """Retrieves text from image.
+
+        :param numpy.ndarray image: image.
+        :param str whitelist: whitelist characters.
+        :param int page_segmentation: page segmentation mode.
+        """
+        self.upload_image(image=image, whitelist=whitelist, page_segmentation=page_segmentation)
+        return self.get_text()
+
+    def image_to_result(self, image, whitelist="", page_segmentation=AUTOMATIC_PAGE_SEGMENTATION, alternatives=False):
+        """Retrieves text from image with mean confidence of recognized words.
+
+        :param numpy.ndarray image: image.
+        :param str whitelist: whitelist characters.
+        :param int page_segmentation: page segmentation mode.
+        :param bool alternatives: get alternatives of each recognized character or not.
 
-class TesseractPool:
-    """Class for working with multiple instances of Tesseract."""
+        :rtype: lib.ocr_backend.OCRResult
+        """
+        self.upload_image(image=image, whitelist=whitelist, page_segmentation=page_segmentation)
+        try:
+            text = self.get_text(clear=False)
+            return OCRResult(text, confidence=self.get_mean_confidence(),
+                             alternatives=self.get_alternatives() if alternatives else None)
+        finally:
+            self.clear()
+
+    def image_regions_to_strings(self, image, rects, whitelist="", page_segmentation=AUTOMATIC_PAGE_SEGMENTATION):
+        """Retrieves texts from multiple regions of image. Image is uploaded once
+        and each region is recognized by restricting recognition to its rectangle.
+
+        :param numpy.ndarray image: image.
+        :param list[tuple[int, int, int, int]] rects: list of (left, top, width, height) regions of the image.
+        :param str whitelist: whitelist characters.
+        :param int page_segmentation: page segmentation mode.
+
+        :return: list of texts in order of regions.
+        :rtype: list[str]
+        """
+        self.upload_image(image=image, whitelist=whitelist, page_segmentation=page_segmentation)
+        try:
+            texts = []
+            for left, top, width, height in rects:
+                self.set_rectangle(left=left, top=top, width=width, height=height)
+                texts.append(self.get_text(clear=False))
+            return texts
+        finally:
+            self.clear()
+
+
+class TesseractPool(OCRBackend):
+    """Class for working with multiple instances of Tesseract.
+    Requests are blocked until any instance is available. Instances keep their configuration between requests
+    and request prefers instance that is already configured with the same (whitelist, page segmentation mode)."""
 
     @staticmethod
     def find_tesseract_lib():
@@ -206,37 +386,158 @@ class TesseractPool:
             raise TesseractError('Tesseract library is not found')
         return lib_path
 
-    def __init__(self, processes=None, language='eng', data_folder='tessdata'):
+    name = "tesseract3"
+
+    def __init__(self, processes=None, language='eng', data_folder='tessdata', engine_mode=None):
         """Class initialization.
 
-        :param int processes: number of Tesseract processes to create.
+        :param int processes: max number of Tesseract instances; number of CPU cores if not given.
         :param str language: OCR language.
         :param str data_folder: name of Tesseract data folder.
+        :param int engine_mode: OCR engine mode; library's default if not given.
         """
-        if processes is None:
-            processes = os.cpu_count()
+        self.size = processes if processes else os.cpu_count() or 1
         self.language = language
+        self.engine_mode = engine_mode
         self.lib_path = self.find_tesseract_lib()
-        lib_folder = os.path.dirname(self.lib_path)
-        self.data_path = os.path.join(lib_folder, data_folder)
-        init_params = [(self.lib_path, self.data_path, self.language) for _ in range(processes)]
-        with ThreadPool() as pool:
-            logger.debug(f"Creating {processes} Tesseract API(s) with '{language}' language.")
+        self.data_path = self.find_data_path(data_folder)
+        self._condition = Condition()
+        self._instances_count = 1
+        # First instance is created immediately to check library and language data, others are created on demand
+        self._idle = [self._create_instance()]
+        self.requests = 0
+        self.wait_time, self.max_wait_time = 0.0, 0.0
+        self.recognition_time, self.max_recognition_time = 0.0, 0.0
+
+    def find_data_path(self, data_folder):
+        """Finds path of Tesseract data folder. Tesseract 3 keeps data folder next to the library.
+
+        :param str data_folder: name of Tesseract data folder.
 
-            def init_tesseract_instance(*args, **kwargs):
-                return Tesseract(*args, **kwargs)
+        :rtype: str
+        """
+        return os.path.join(os.path.dirname(self.lib_path), data_folder)
+
+    def _create_instance(self):
+        """Creates new Tesseract instance.
+
+        :rtype: Tesseract
+        """
+        logger.debug(f"Creating Tesseract API with '{self.language}' language.")
+        return Tesseract(lib_path=self.lib_path, data_path=self.data_path, language=self.language,
+                         engine_mode=self.engine_mode)
 
-            self._pool = pool.starmap(init_tesseract_instance, init_params)
+    def _acquire(self, configuration):
+        """Acquires idle Tesseract instance. Blocks until any instance is released if pool is exhausted.
 
-    def image_to_string(self, image, whitelist=None, page_segmentation=3):
+        :param tuple[str, int] configuration: (whitelist, page segmentation mode) of the request.
+
+        :rtype: Tesseract
+        """
+        with self._condition:
+            while not self._idle and self._instances_count >= self.size:
+                self._condition.wait()
+            if self._idle:
+                for index, tesseract in enumerate(self._idle):
+                    if tesseract.configuration == configuration:
+                        return self._idle.pop(index)
+                return self._idle.pop()
+            self._instances_count += 1
+        try:
+            return self._create_instance()
+        except Exception:
+            with self._condition:
+                self._instances_count -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, tesseract, wait_time, recognition_time):
+        """Releases Tesseract instance back to the pool and updates metrics.
+
+        :param Tesseract tesseract: Tesseract instance.
+        :param float wait_time: how long request was waiting for the instance.
+        :param float recognition_time: how long recognition took.
+        """
+        with self._condition:
+            self._idle.append(tesseract)
+            self.requests += 1
+            self.wait_time += wait_time
+            self.max_wait_time = max(self.max_wait_time, wait_time)
+            self.recognition_time += recognition_time
+            self.max_recognition_time = max(self.max_recognition_time, recognition_time)
+            self._condition.notify()
+
+    @property
+    def metrics(self):
+        """Metrics of the pool: number of requests and instances, queue-wait and recognition times (in seconds).
+
+        :rtype: dict
+        """
+        with self._condition:
+            requests = self.requests if self.requests else 1
+            return {
+                "requests": self.requests,
+                "instances": self._instances_count,
+                "average_wait_time": self.wait_time / requests,
+                "max_wait_time": self.max_wait_time,
+                "average_recognition_time": self.recognition_time / requests,
+                "max_recognition_time": self.max_recognition_time
+            }
+
+    def _recognize(self, whitelist, page_segmentation, recognize):
+        """Runs recognition on available Tesseract instance.
+
+        :param str whitelist: whitelist characters.
+        :param int page_segmentation: page segmentation mode.
+        :param function recognize: function that recognizes by given instance.
+        """
+        requested_at = time.perf_counter()
+        tesseract = self._acquire(configuration=(whitelist, page_segmentation))
+        started_at = time.perf_counter()
+        try:
+            return recognize(tesseract)
+        finally:
+            self._release(tesseract, wait_time=started_at - requested_at,
+                          recognition_time=time.perf_counter() - started_at)
+
+    def image_to_string(self, image, whitelist=None, page_segmentation=AUTOMATIC_PAGE_SEGMENTATION):
         """Retrieves text from image from available Tesseract instance.
 
         :param numpy.ndarray image: image.
         :param str whitelist: whitelist characters.
         :param int page_segmentation: page segmentation mode.
         """
-        non_locked = [tess for tess in self._pool if not tess.locked]
-        if not non_locked:
-            sleep(0.05)
-            return self.image_to_string(image=image, whitelist=whitelist, page_segmentation=page_segmentation)
-        return non_locked[0].image_to_string(image=image, whitelist=whitelist, page_segmentation=page_segmentation)
+        whitelist = whitelist if whitelist else ""
+        return self._recognize(whitelist, page_segmentation, lambda tesseract: tesseract.image_to_string(
+            image=image, whitelist=whitelist, page_segmentation=page_segmentation))
+
+    def image_to_result(self, image, whitelist=None, page_segmentation=AUTOMATIC_PAGE_SEGMENTATION,
+                        alternatives=False):
+        """Retrieves text from image with its confidence from available Tesseract instance.
+
+        :param numpy.ndarray image: image.
+        :param str whitelist: whitelist characters.
+        :param int page_segmentation: page segmentation mode.
+        :param bool alternatives: get alternatives of each recognized character or not.
+
+        :rtype: lib.ocr_backend.OCRResult
+        """
+        whitelist = whitelist if whitelist else ""
+        return self._recognize(whitelist, page_segmentation, lambda tesseract: tesseract.image_to_result(
+            image=image, whitelist=whitelist, page_segmentation=page_segmentation, alternatives=alternatives))
+
+    def image_regions_to_strings(self, image, rects, whitelist=None, page_segmentation=AUTOMATIC_PAGE_SEGMENTATION):
+        """Retrieves texts from multiple regions of image by single Tesseract instance.
+        Image is uploaded once, see `Tesseract.image_regions_to_strings`.
+
+        :param numpy.ndarray image: image.
+        :param list[tuple[int, int, int, int]] rects: list of (left, top, width, height) regions of the image.
+        :param str whitelist: whitelist characters.
+        :param int page_segmentation: page segmentation mode.
+
+        :return: list of texts in order of regions.
+        :rtype: list[str]
+        """
+        whitelist = whitelist if whitelist else ""
+        return self._recognize(whitelist, page_segmentation, lambda tesseract: tesseract.image_regions_to_strings(
+            image=image, rects=rects, whitelist=whitelist, page_segmentation=page_segmentation))
@@ -0,0 +1,52 @@
+import ctypes.util
+import os
+
+from lib.tesseract3 import TesseractPool, TesseractError
+
+TESSERACT_LIBNAMES = ('tesseract', 'libtesseract-5', 'libtesseract-4')
+TESSERACT_DATA_PATHS = ('/usr/share/tesseract-ocr/5/tessdata', '/usr/share/tesseract-ocr/4.00/tessdata',
+                        '/usr/share/tessdata', '/usr/local/share/tessdata')
+# OCR engine modes of Tesseract 4.x/5.x
+OEM_LEGACY = 0
+OEM_LSTM = 1
+OEM_LEGACY_LSTM_COMBINED = 2
+OEM_DEFAULT = 3
+
+
+class Tesseract4Pool(TesseractPool):
+    """Class for working with multiple instances of system Tesseract 4.x/5.x library (libtesseract.so).
+    C API of these versions is compatible with Tesseract 3 API that is used by `TesseractPool`.
+    Engine (LSTM or legacy) is selected by `engine_mode`, legacy engine can use Tesseract 3 trained data.
+
+    Data folder is taken from TESSDATA_PREFIX environment variable or from default system paths.
+    Language data from `tessdata` folder of the project (`mff.traineddata`) should be copied into it.
+    """
+
+    name = "tesseract4"
+
+    @staticmethod
+    def find_tesseract_lib():
+        """Finds path of system Tesseract library.
+
+        :rtype: str
+        """
+        for lib_name in TESSERACT_LIBNAMES:
+            lib_path = ctypes.util.find_library(lib_name)
+            if lib_path is not None:
+                return lib_path
+        raise TesseractError('Tesseract library is not found')
+
+    def find_data_path(self, data_folder):
+        """Finds path of Tesseract data folder.
+
+        :param str data_folder: name of Tesseract data folder.
+
+        :rtype: str
+        """
+        tessdata_prefix = os.environ.get("TESSDATA_PREFIX")
+        if tessdata_prefix:
+            return tessdata_prefix
+        for data_path in TESSERACT_DATA_PATHS:
+            if os.path.isdir(data_path):
+                return data_path
+        return data_folder
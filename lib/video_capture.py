@@ -8,7 +8,7 @@ import cv2
 import numpy
 import win32api
 import win32con
-from PIL import ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont
 from multiprocess.managers import SyncManager, RemoteError
 
 import lib.logger as logging
@@ -105,7 +105,7 @@ class EmulatorImageSource:
         :return: image with debug drawings.
         :rtype: PIL.Image.Image
         """
-        screen = self.emulator._get_screen().copy()
+        screen = Image.fromarray(self.emulator._get_screen())
         try:
             self.emulator.screen_elements[:] = [element for element in self.emulator.screen_elements
                                                 if element.on_screen_seconds < ELEMENT_TIME_ON_SCREEN_SEC]
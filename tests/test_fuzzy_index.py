@@ -0,0 +1,56 @@
+import unittest
+
+from lib.functions import is_strings_similar, levenshtein_distance
+from lib.fuzzy_index import FuzzyIndex
+
+QUESTIONS = {
+    "Which hero is known as the God of Thunder?": "THOR",
+    "Which hero is known as the God of Mischief?": "LOKI",
+    "Who is the leader of the Guardians of the Galaxy?": "STAR-LORD",
+    "Who created Ultron?": "HANK PYM",
+    "What is Captain America’s shield made of?": "VIBRANIUM",
+    "HP": "SHORT",
+}
+
+
+class TestFuzzyIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index = FuzzyIndex(QUESTIONS)
+
+    def test_exact_lookup(self):
+        for question, answer in QUESTIONS.items():
+            results = self.index.find(question)
+            self.assertTrue(results, question)
+            self.assertEqual(results[0][:2], (question, answer))
+            self.assertEqual(results[0][2], 0)
+
+    def test_lookup_with_ocr_errors(self):
+        results = self.index.find("Whlch hero is kn0wn as the God of Thundr?")
+        self.assertEqual(results[0][1], "THOR")
+        self.assertEqual(results[0][2], 3)
+        results = self.index.find("What is Captain America's shield made of?")
+        self.assertEqual(results[0][1], "VIBRANIUM")
+
+    def test_results_are_sorted_by_distance(self):
+        results = self.index.find("Which hero is known as the God of M", overlap=0.5)
+        distances = [distance for _, _, distance in results]
+        self.assertEqual(distances, sorted(distances))
+        self.assertEqual({answer for _, answer, _ in results}, {"THOR", "LOKI"})
+
+    def test_same_as_checking_every_string(self):
+        queries = ["Who created Ultron", "Who created Ultr0n?", "Who is the leader of the Guardians?",
+                   "Which hero is known as the God of Mischef?", "HP", "H", "", "Completely other text"]
+        for overlap in (0.1, 0.25, 0.5):
+            for query in queries:
+                expected = {key for key in QUESTIONS
+                            if query.strip() and is_strings_similar(query, FuzzyIndex.normalize(key), overlap)}
+                found = {key for key, _, _ in self.index.find(query, overlap=overlap)}
+                self.assertEqual(found, expected, f"'{query}', overlap={overlap}")
+                for key, _, distance in self.index.find(query, overlap=overlap):
+                    self.assertEqual(distance, levenshtein_distance(FuzzyIndex.normalize(query),
+                                                                    FuzzyIndex.normalize(key)))
+
+
+if __name__ == '__main__':
+    unittest.main()
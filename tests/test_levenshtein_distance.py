@@ -0,0 +1,69 @@
+import random
+import unittest
+
+from lib.functions import levenshtein_distance, is_strings_similar, find_similar_strings
+
+
+def full_levenshtein_distance(a, b):
+    """Gets edit distance by full dynamic programming table.
+
+    :param str a: first string.
+    :param str b: second string.
+
+    :rtype: int
+    """
+    prev_row = list(range(len(b) + 1))
+    for i, column1 in enumerate(a, start=1):
+        cur_row = [i]
+        for j, column2 in enumerate(b, start=1):
+            cur_row.append(min(prev_row[j] + 1, cur_row[j - 1] + 1, prev_row[j - 1] + (column1 != column2)))
+        prev_row = cur_row
+    return prev_row[-1]
+
+
+class TestLevenshteinDistance(unittest.TestCase):
+
+    def setUp(self):
+        alphabet = "AB0O1l "
+        generator = random.Random(42)
+        self.pairs = [("", ""), ("", "ABC"), ("ABC", ""), ("KITTEN", "SITTING"), ("FLAW", "LAWN"),
+                      ("DAILY TRIVIA", "DA1LY TR1VIA")]
+        for _ in range(500):
+            a = "".join(generator.choice(alphabet) for _ in range(generator.randint(0, 12)))
+            b = "".join(generator.choice(alphabet) for _ in range(generator.randint(0, 12)))
+            self.pairs.append((a, b))
+
+    def test_unbounded_distance(self):
+        for a, b in self.pairs:
+            self.assertEqual(levenshtein_distance(a, b), full_levenshtein_distance(a, b), f"'{a}', '{b}'")
+
+    def test_banded_distance(self):
+        for a, b in self.pairs:
+            distance = full_levenshtein_distance(a, b)
+            for max_distance in range(0, 8):
+                expected = distance if distance <= max_distance else max_distance + 1
+                self.assertEqual(levenshtein_distance(a, b, max_distance=max_distance), expected,
+                                 f"'{a}', '{b}', max_distance={max_distance}")
+
+    def test_strings_similarity(self):
+        for a, b in self.pairs:
+            for overlap in (0.0, 0.1, 0.25, 0.5, 1.0):
+                if a:
+                    expected = full_levenshtein_distance(a, b) / len(a) <= overlap
+                else:
+                    expected = 1 <= overlap
+                self.assertEqual(is_strings_similar(a, b, overlap), expected, f"'{a}', '{b}', overlap={overlap}")
+
+    def test_find_similar_strings(self):
+        originals = ["DAILY TRIVIA", "DAILY QUEST", "TRIVIA", ""]
+        similar = find_similar_strings(originals, "daily trivla")
+        self.assertEqual([original for original, _ in similar], ["DAILY TRIVIA"])
+        self.assertAlmostEqual(similar[0][1], 1 / len("DAILY TRIVIA"))
+        for overlap in (0.25, 1.0):
+            expected = [original for original in originals if is_strings_similar(original, "DAILY QUEST", overlap)]
+            similar = find_similar_strings(originals, "DAILY QUEST", overlap)
+            self.assertEqual([original for original, _ in similar], expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+import numpy
+
+from lib.ocr_cache import OCRCache
+
+
+def get_key(value, whitelist="", language="eng"):
+    """Gets key of recognition of 8x8 image filled with value.
+
+    :param int value: value of image's pixels.
+    :param str whitelist: whitelist characters.
+    :param str language: OCR language.
+
+    :rtype: tuple
+    """
+    return OCRCache.get_key(numpy.full((8, 8), value, dtype=numpy.uint8), whitelist=whitelist, page_segmentation=3,
+                            language=language)
+
+
+class TestOCRCache(unittest.TestCase):
+
+    def test_key_depends_on_content_and_parameters(self):
+        self.assertEqual(get_key(1), get_key(1))
+        self.assertNotEqual(get_key(1), get_key(2))
+        self.assertNotEqual(get_key(1), get_key(1, whitelist="0123456789"))
+        self.assertNotEqual(get_key(1), get_key(1, language="mff+eng"))
+        image = numpy.zeros((8, 8), dtype=numpy.uint8)
+        self.assertNotEqual(OCRCache.get_key(image, "", 3, "eng"), OCRCache.get_key(image.reshape(4, 16), "", 3, "eng"))
+
+    def test_get_and_set(self):
+        cache = OCRCache()
+        self.assertIsNone(cache.get(get_key(1)))
+        cache.set(get_key(1), "TEXT")
+        self.assertEqual(cache.get(get_key(1)), "TEXT")
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.hit_rate, 0.5)
+
+    def test_least_recently_used_is_evicted_by_entries(self):
+        cache = OCRCache(max_entries=2)
+        cache.set(get_key(1), "1")
+        cache.set(get_key(2), "2")
+        cache.get(get_key(1))
+        cache.set(get_key(3), "3")
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertIsNone(cache.get(get_key(2)))
+        self.assertEqual(cache.get(get_key(1)), "1")
+        self.assertEqual(cache.get(get_key(3)), "3")
+
+    def test_entries_are_evicted_by_memory(self):
+        entry_size = OCRCache._get_entry_size(get_key(1), "1")
+        cache = OCRCache(max_bytes=entry_size * 3)
+        for value in range(10):
+            cache.set(get_key(value), str(value))
+            self.assertLessEqual(cache.size_bytes, cache.max_bytes)
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.evictions, 7)
+        self.assertEqual(cache.size_bytes, sum(OCRCache._get_entry_size(get_key(value), str(value))
+                                               for value in range(7, 10)))
+
+    def test_replaced_entry_keeps_memory_size(self):
+        cache = OCRCache()
+        cache.set(get_key(1), "SHORT")
+        cache.set(get_key(1), "MUCH LONGER TEXT")
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.size_bytes, OCRCache._get_entry_size(get_key(1), "MUCH LONGER TEXT"))
+
+    def test_entry_over_limits_is_not_cached(self):
+        cache = OCRCache(max_bytes=10)
+        cache.set(get_key(1), "TEXT")
+        self.assertEqual(len(cache), 0)
+        cache = OCRCache(max_entries=0)
+        cache.set(get_key(1), "TEXT")
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = OCRCache()
+        cache.set(get_key(1), "TEXT")
+        cache.get(get_key(1))
+        cache.clear()
+        self.assertEqual((len(cache), cache.size_bytes, cache.hits, cache.misses), (0, 0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
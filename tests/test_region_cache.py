@@ -0,0 +1,71 @@
+import pickle
+import unittest
+
+import numpy
+
+from lib.region_cache import RegionCache
+
+
+class TestRegionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = RegionCache(pixel_tolerance=8, changed_pixels_ratio=0.01)
+        self.image = numpy.random.RandomState(0).randint(0, 256, size=(20, 50, 3)).astype(numpy.uint8)
+
+    def test_miss_before_set(self):
+        self.assertIs(self.cache.get(("text", "A"), self.image), RegionCache.MISS)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+    def test_result_is_reused_while_region_is_unchanged(self):
+        self.cache.set(("text", "A"), self.image, "RESULT")
+        noisy_image = self.image.copy()
+        noisy_image[noisy_image < 250] += 5
+        self.assertEqual(self.cache.get(("text", "A"), self.image), "RESULT")
+        self.assertEqual(self.cache.get(("text", "A"), noisy_image), "RESULT")
+        self.assertEqual(self.cache.hit_rate, 1.0)
+
+    def test_changed_region_is_miss(self):
+        self.cache.set(("text", "A"), self.image, "RESULT")
+        changed_image = self.image.copy()
+        changed_image[:2, :10] = 255 - changed_image[:2, :10]
+        self.assertIs(self.cache.get(("text", "A"), changed_image), RegionCache.MISS)
+        self.assertIs(self.cache.get(("text", "A"), self.image[:, :40]), RegionCache.MISS)
+        self.assertIs(self.cache.get(("text", "B"), self.image), RegionCache.MISS)
+
+    def test_few_changed_pixels_are_noise(self):
+        self.cache.set(("text", "A"), self.image, "RESULT")
+        changed_image = self.image.copy()
+        changed_image[0, :10] = 255 - changed_image[0, :10]
+        self.assertEqual(self.cache.get(("text", "A"), changed_image), "RESULT")
+
+    def test_stored_crop_is_copied(self):
+        self.cache.set(("text", "A"), self.image, "RESULT")
+        original_image = self.image.copy()
+        self.image[:] = 0
+        self.assertEqual(self.cache.get(("text", "A"), original_image), "RESULT")
+
+    def test_set_replaces_entry_of_key(self):
+        self.cache.set(("text", "A"), self.image, "OLD")
+        changed_image = 255 - self.image
+        self.cache.set(("text", "A"), changed_image, "NEW")
+        self.assertEqual(self.cache.get(("text", "A"), changed_image), "NEW")
+        self.assertIs(self.cache.get(("text", "A"), self.image), RegionCache.MISS)
+
+    def test_gray_images(self):
+        gray_image = self.image[..., 0].copy()
+        self.cache.set(("image", "A"), gray_image, True)
+        self.assertTrue(self.cache.get(("image", "A"), gray_image))
+        self.assertIs(self.cache.get(("image", "A"), 255 - gray_image), RegionCache.MISS)
+
+    def test_clear_and_pickle_drop_entries(self):
+        self.cache.set(("text", "A"), self.image, "RESULT")
+        restored_cache = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual((restored_cache.pixel_tolerance, restored_cache.changed_pixels_ratio), (8, 0.01))
+        self.assertIs(restored_cache.get(("text", "A"), self.image), RegionCache.MISS)
+        self.cache.clear()
+        self.assertIs(self.cache.get(("text", "A"), self.image), RegionCache.MISS)
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
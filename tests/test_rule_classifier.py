@@ -0,0 +1,75 @@
+import unittest
+
+from lib.functions import levenshtein_distance
+from lib.rule_classifier import RuleClassifier
+
+
+def get_match_errors(phrase, text, anywhere):
+    """Gets number of errors of phrase in the text by full edit distance: as `regex` module's fuzzy matching.
+
+    :param str phrase: phrase.
+    :param str text: text.
+    :param bool anywhere: phrase can be anywhere in the text or only in the beginning of it.
+
+    :rtype: int
+    """
+    starts = range(len(text) + 1) if anywhere else (0,)
+    return min(levenshtein_distance(phrase, text[start:end])
+               for start in starts for end in range(start, len(text) + 1))
+
+
+class TestRuleClassifier(unittest.TestCase):
+
+    def test_errors_are_same_as_full_edit_distance(self):
+        phrases = ["PHYSICAL ATTACK", "HP", "ENERGY ATTACK", "ALL BASIC ATTACKS INCREASE"]
+        texts = ["PHYSICAL ATTACK +5%", "PHYSCAL ATACK", "HP +120", "ENERGY ATTAK 3%", "+5% PHYSICAL ATTACK",
+                 "ALL BASIC ATTACK INCREASE", "H", "", "XYZ"]
+        for anywhere in (False, True):
+            classifier = RuleClassifier(anywhere=anywhere)
+            for phrase in phrases:
+                classifier.add_rule(label=phrase, phrase=phrase)
+            for text in texts:
+                expected = [get_match_errors(phrase, text, anywhere) for phrase in phrases]
+                self.assertEqual(classifier.get_errors(text), expected, f"'{text}', anywhere={anywhere}")
+
+    def test_classify_prefers_more_specific_phrase(self):
+        classifier = RuleClassifier(anywhere=True)
+        classifier.add_rule(label="villains", phrase="Villains have")
+        classifier.add_rule(label="universal", phrase="Universal-type Villains have")
+        label, confidence = classifier.classify("All Universal-type Villains have 10% more HP")
+        self.assertEqual(label, "universal")
+        self.assertEqual(confidence, 1.0)
+
+    def test_classify_without_match(self):
+        classifier = RuleClassifier(max_errors=1)
+        self.assertEqual(classifier.classify("HP"), (None, 0.0))
+        classifier.add_rule(label="attack", phrase="PHYSICAL ATTACK")
+        self.assertEqual(classifier.classify("ENERGY DEFENCE"), (None, 0.0))
+        self.assertEqual(classifier.classify(""), (None, 0.0))
+
+    def test_pattern_errors_limit_each_rule(self):
+        classifier = RuleClassifier()
+        self.assertEqual(classifier.add_pattern("(PHYSICAL ATTACK){e<=3}.*\\n(HP).*"),
+                         ["(PHYSICAL ATTACK){e<=3}.*", "(HP).*"])
+        self.assertEqual(classifier.get_matched("PHYSCAL ATACK +5%"), {"(PHYSICAL ATTACK){e<=3}.*"})
+        self.assertEqual(classifier.get_matched("HB +120"), set())
+        self.assertEqual(classifier.get_matched("HP +120"), {"(HP).*"})
+
+    def test_get_matched_returns_every_rule_within_its_errors(self):
+        classifier = RuleClassifier()
+        classifier.add_pattern("(ALL BASIC DEFENCES INCREASE){e<=3}.*")
+        classifier.add_pattern("(ALL BASIC DEFENCE){e<=3}.*")
+        text = "ALL BASIC DEFENCES INCREASE 5%"
+        self.assertEqual(classifier.classify(text)[0], "(ALL BASIC DEFENCES INCREASE){e<=3}.*")
+        self.assertEqual(classifier.get_matched(text), {"(ALL BASIC DEFENCES INCREASE){e<=3}.*",
+                                                        "(ALL BASIC DEFENCE){e<=3}.*"})
+
+    def test_unsupported_pattern(self):
+        with self.assertRaises(ValueError):
+            RuleClassifier().add_pattern("PHYSICAL ATTACK")
+        with self.assertRaises(ValueError):
+            RuleClassifier().add_rule(label="empty", phrase=" ")
+
+
+if __name__ == '__main__':
+    unittest.main()